@@ -2,7 +2,13 @@
 import ghhops_server as hs
 import rhino3dm
 
+import hopskit
+
 hops = hs.Hops()
+# stream=True components send generator outputs a chunk at a time
+hopskit.Streaming(hops)
+# identical requests arriving together wait for one solve
+hopskit.SingleFlight(hops)
 
 
 @hops.component(
@@ -51,12 +57,16 @@ def pointat(curve, t=0.0):
         hs.HopsNumber("t", "t", "Parameters on Curve to evaluate", hs.HopsParamAccess.LIST),
     ],
     outputs=[
-        hs.HopsPoint("P", "P", "Points on curve at t")
-    ]
+        hopskit.HopsPointArray("P", "P", "Points on curve at t")
+    ],
+    stream=True
 )
 def pointsat(curve, t):
-    points = [curve.PointAt(item) for item in t]
-    return points
+    # evaluated and sent 64k points at a time
+    return (
+        hopskit.evaluate_curve(curve, t[start:start + 65536]).points
+        for start in range(0, len(t), 65536)
+    )
 
 
 @hops.component(
@@ -79,4 +89,18 @@ def ruled_surface(a, b, c, d):
 
 
 if __name__ == "__main__":
-    hops.start(debug=True)
+    import argparse
+    parser = argparse.ArgumentParser(description="Hops default http app")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5000)
+    # many concurrent keep-alive clients, solves run on an executor
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="serve with asyncio instead of one thread per connection")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--workers", type=int, default=None, help="executor size (cpu count)")
+    args = parser.parse_args()
+    if args.use_async:
+        hopskit.serve_async(hops, args.host, args.port, args.executor, args.workers, debug=True)
+    else:
+        # same as hops.start, but also speaks the binary format
+        hopskit.serve_http(hops, args.host, args.port, debug=True)
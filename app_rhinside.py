@@ -1,7 +1,13 @@
 """Hops default HTTP server swith rhinoinside example"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import rhinoinside
 import ghhops_server as hs
 
+import hopskit
+
 
 rhinoinside.load()
 # System and Rhino can only be loaded after rhinoinside is initialized
@@ -10,6 +16,11 @@ import Rhino  # noqa
 
 hops = hs.Hops(app=rhinoinside)
 
+# RhinoCommon geometry calls release the GIL, batch components split
+# their work into chunks on these threads
+threads = ThreadPoolExecutor(int(os.environ.get("HOPS_BATCH_THREADS", 0)) or os.cpu_count() or 1)
+BATCH_CHUNK = 1024
+
 
 @hops.component(
     "/add",
@@ -96,5 +107,40 @@ def interp_length(p1, p2, p3):
     return crv.GetLength()
 
 
+def _interp_lengths(points, start, stop):
+    # each curve reads its three points through a view of the shared array
+    lengths = []
+    for i in range(start, stop):
+        segment = System.ArraySegment[Rhino.Geometry.Point3d](points, 3 * i, 3)
+        crv = Rhino.Geometry.Curve.CreateInterpolatedCurve(segment, 3)
+        lengths.append(crv.GetLength() if crv is not None else 0.0)
+    return lengths
+
+
+@hops.component(
+    "/interplengths",
+    name="InterpCurve Lengths",
+    nickname="ICLs",
+    description="Interpolated curve lengths for many point triples",
+    inputs=[
+        hs.HopsPoint("P1", "P1", "First points", hs.HopsParamAccess.LIST),
+        hs.HopsPoint("P2", "P2", "Second points", hs.HopsParamAccess.LIST),
+        hs.HopsPoint("P3", "P3", "Third points", hs.HopsParamAccess.LIST),
+    ],
+    outputs=[hopskit.HopsNumberArray("Length", "L", "Interpolated curve lengths, 0 where no curve fits")],
+)
+def interp_lengths(p1, p2, p3):
+    if not len(p1) == len(p2) == len(p3):
+        raise ValueError("P1, P2 and P3 need the same number of points")
+    count = len(p1)
+    # one .NET array for all triples instead of a List per curve
+    points = System.Array[Rhino.Geometry.Point3d]([p for triple in zip(p1, p2, p3) for p in triple])
+    chunks = [(start, min(start + BATCH_CHUNK, count)) for start in range(0, count, BATCH_CHUNK)]
+    lengths = np.empty(count)
+    for (start, stop), values in zip(chunks, threads.map(lambda c: _interp_lengths(points, *c), chunks)):
+        lengths[start:stop] = values
+    return lengths
+
+
 if __name__ == "__main__":
     hops.start(debug=True)
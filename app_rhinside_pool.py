@@ -0,0 +1,36 @@
+"""Hops server for app_rhinside.py answering from warm Rhino.Inside workers
+
+Each worker process imports app_rhinside (and loads Rhino once); this
+process only routes requests, so a restart or a crashed worker never
+makes a user wait for Rhino to load.
+"""
+import argparse
+import os
+
+import hopskit
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hops server with a Rhino.Inside worker pool")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-requests", type=int, default=0,
+                        help="recycle a worker after this many solves")
+    parser.add_argument("--max-memory", type=int, default=None,
+                        help="recycle a worker above this many MB of memory")
+    parser.add_argument("--timeout", type=float, default=300.0,
+                        help="kill a worker that takes longer than this many seconds")
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    # workers share the cores for their batch threads, see app_rhinside.py
+    os.environ.setdefault("HOPS_BATCH_THREADS", str(max(1, (os.cpu_count() or 1) // args.workers)))
+    pool = hopskit.RhinoPool(
+        "app_rhinside",
+        workers=args.workers,
+        max_requests=args.max_requests,
+        max_memory=args.max_memory * 2**20 if args.max_memory else None,
+        timeout=args.timeout,
+    )
+    pool.start(args.host, args.port, args.debug)
@@ -0,0 +1,246 @@
+"""Benchmark every Hops component of app.py
+
+For each component and input size this times the three stages of a
+solve separately (decode the payload into inputs, run the handler,
+encode the outputs) and a full POST /solve through the flask test
+client. Inputs are generated from the component's input params.
+
+    python benchmarks/bench_components.py --list
+    python benchmarks/bench_components.py --save benchmarks/baseline.json
+    python benchmarks/bench_components.py --compare benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import json
+import logging
+import math
+import os
+import os.path as op
+import statistics
+import sys
+import time
+
+sys.path.insert(0, op.dirname(op.dirname(op.abspath(__file__))))
+
+import ghhops_server as hs  # noqa: E402
+import rhino3dm  # noqa: E402
+from ghhops_server.logger import hlogger  # noqa: E402
+
+import app  # noqa: E402
+
+
+# control points per curve, points per surface side, items per list
+SIZES = {
+    "small": {"curve": 8, "surface": 4, "list": 10},
+    "medium": {"curve": 1000, "surface": 50, "list": 10000},
+    "large": {"curve": 10000, "surface": 200, "list": 100000},
+}
+
+
+def make_curve(count):
+    points = [
+        rhino3dm.Point3d(i, math.sin(i * 0.1) * 5, math.cos(i * 0.07) * 2)
+        for i in range(count)
+    ]
+    return rhino3dm.Curve.CreateControlPointCurve(points, 3)
+
+
+def make_surface(count):
+    surface = rhino3dm.NurbsSurface.Create(3, False, 4, 4, count, count)
+    for i in range(count):
+        for j in range(count):
+            z = math.sin(i * 0.3) * math.cos(j * 0.2)
+            surface.Points[(i, j)] = rhino3dm.Point4d(i, j, z, 1)
+    surface.KnotsU.CreateUniformKnots(1.0)
+    surface.KnotsV.CreateUniformKnots(1.0)
+    return surface
+
+
+def make_value(param, index, size):
+    """Synthetic value for one item of an input param"""
+    if isinstance(param, hs.HopsCurve):
+        return make_curve(size["curve"])
+    if isinstance(param, hs.HopsSurface):
+        return make_surface(size["surface"])
+    if isinstance(param, hs.HopsBrep):
+        return rhino3dm.Brep.CreateFromSurface(make_surface(size["surface"]))
+    if isinstance(param, hs.HopsPoint):
+        # points on a circle so three of them are never collinear
+        angle = index * 2.1
+        return rhino3dm.Point3d(math.cos(angle), math.sin(angle), index * 0.1)
+    if isinstance(param, hs.HopsVector):
+        return rhino3dm.Vector3d(0, 0, 1)
+    if isinstance(param, hs.HopsBoolean):
+        return True
+    if isinstance(param, hs.HopsInteger):
+        return 3 if param.name == "Degree" else 1
+    if isinstance(param, hs.HopsString):
+        return "hops"
+    if isinstance(param, hs.HopsNumber):
+        return 0.5 + index
+    raise TypeError(f"No synthetic input for {type(param).__name__}")
+
+
+def make_items(param, index, size):
+    if param.access == hs.HopsParamAccess.LIST:
+        count = size["list"]
+        if isinstance(param, hs.HopsNumber):
+            return [i / count for i in range(count)]
+        if isinstance(param, hs.HopsPoint):
+            return [rhino3dm.Point3d(i, (i * 7) % 13, 0) for i in range(count)]
+    return [make_value(param, index, size)]
+
+
+def encode_item(param, value):
+    if isinstance(value, bool):
+        data = json.dumps(value)
+    elif isinstance(value, (int, float, str)):
+        data = str(value)
+    else:
+        data = json.dumps(value.Encode())
+    result_type = param.result_type
+    if isinstance(value, rhino3dm.NurbsSurface):
+        result_type = "Rhino.Geometry.NurbsSurface"
+    return {"type": result_type, "data": data}
+
+
+def make_payload(comp, size):
+    values = []
+    for index, param in enumerate(comp.inputs):
+        items = make_items(param, index, size)
+        values.append({
+            "ParamName": param.name,
+            "InnerTree": {"{0}": [encode_item(param, v) for v in items]},
+        })
+    return json.dumps({"pointer": comp.uri, "values": values})
+
+
+def components():
+    # import every category, the stages below need the real components
+    app.registry.load_all()
+    seen = []
+    for comp in app.hops._components.values():
+        if comp not in seen:
+            seen.append(comp)
+    return seen
+
+
+def _time(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def bench_component(comp, size, repeat, client):
+    payload = make_payload(comp, size)
+    row = {"payload_bytes": len(payload)}
+
+    # decode, solve and encode the way ghhops_server does it
+    row["decode"], (ok, inputs) = _time(lambda: app.hops._prepare_inputs(comp, payload), repeat)
+    if not ok:
+        raise ValueError(inputs)
+
+    def solve():
+        # handlers may change their inputs, solve on fresh ones
+        _, fresh = app.hops._prepare_inputs(comp, payload)
+        start = time.perf_counter()
+        returned = comp.handler(*fresh)
+        return time.perf_counter() - start, returned
+
+    timings = [solve() for _ in range(repeat)]
+    row["solve"] = statistics.median(t for t, _ in timings)
+    returned = timings[-1][1]
+    row["encode"], (_, outputs) = _time(lambda: app.hops._prepare_outputs(comp, returned), repeat)
+    row["output_bytes"] = len(outputs)
+
+    # the whole request through flask, with the caches cold
+    def request():
+        app.solve_cache.clear()
+        app.geometry_cache.clear()
+        response = client.post("/solve", data=payload)
+        if response.status_code != 200:
+            raise ValueError(response.get_data(as_text=True)[:200])
+        return response
+
+    row["request"], _ = _time(request, repeat)
+    return row
+
+
+def run(names, sizes, repeat):
+    hlogger.setLevel(logging.WARNING)
+    client = app.app.test_client()
+    results = {}
+    for comp in components():
+        if names and not any(n in comp.uri for n in names):
+            continue
+        for size_name in sizes:
+            key = f"{comp.uri} [{size_name}]"
+            try:
+                # ghhops_server prints every input it decodes
+                with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                    results[key] = bench_component(comp, SIZES[size_name], repeat, client)
+            except Exception as ex:
+                results[key] = {"error": str(ex).splitlines()[0][:120]}
+    return results
+
+
+def report(results, baseline=None, threshold=1.2):
+    """Print a table and return the keys that got slower than threshold"""
+    stages = ("decode", "solve", "encode", "request")
+    header = f"{'component':52} " + " ".join(f"{s:>10}" for s in stages)
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+    regressions = []
+    for key, row in results.items():
+        if "error" in row:
+            print(f"{key:52} error: {row['error']}")
+            continue
+        line = f"{key:52} " + " ".join(f"{row[s] * 1000:9.3f}ms" for s in stages)
+        base = (baseline or {}).get(key)
+        if base and "request" in base:
+            ratio = row["request"] / base["request"]
+            line += f" {ratio:7.2f}x"
+            if ratio > threshold:
+                line += " SLOWER"
+                regressions.append(key)
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app.py Hops components")
+    parser.add_argument("--list", action="store_true", help="list registered components and exit")
+    parser.add_argument("--filter", action="append", default=[], help="only uris containing this text")
+    parser.add_argument("--sizes", default="small,medium", help="comma separated: " + ",".join(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="write results to this json file")
+    parser.add_argument("--compare", help="compare with results saved earlier")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown ratio that fails --compare")
+    args = parser.parse_args()
+
+    if args.list:
+        for comp in components():
+            inputs = ", ".join(f"{p.name}:{type(p).__name__}" for p in comp.inputs)
+            print(f"{comp.uri:52} {inputs}")
+        return 0
+
+    results = run(args.filter, args.sizes.split(","), args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"sizes": SIZES, "repeat": args.repeat, "results": results}, f, indent=1, sort_keys=True)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Benchmark app.py startup with lazy and eager component registration
+
+Every run is a fresh interpreter. It reports the time to import app
+(everything a worker does before serving), the time to answer the
+component list (GET /) and the time of the first solve, which for the
+lazy app includes importing the category module.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --uri /srfPointAt
+"""
+import argparse
+import json
+import os
+import os.path as op
+import statistics
+import subprocess
+import sys
+
+
+ROOT = op.dirname(op.dirname(op.abspath(__file__)))
+
+# runs in the child interpreter, prints one json line of timings
+PROBE = """
+import json, logging, os, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+from ghhops_server.logger import hlogger
+hlogger.setLevel(logging.WARNING)
+client = app.app.test_client()
+t = time.perf_counter()
+listed = client.get("/")
+listed = time.perf_counter() - t
+t = time.perf_counter()
+with open(os.devnull, "w") as devnull:
+    sys.stdout, stdout = devnull, sys.stdout
+    solved = client.post("/solve", data=sys.argv[1])
+    sys.stdout = stdout
+solved_ok = solved.status_code == 200
+solved = time.perf_counter() - t
+print(json.dumps({
+    "import": imported - start,
+    "register": app.registry.startup_seconds,
+    "list": listed,
+    "first_solve": solved,
+    "ok": solved_ok,
+}))
+"""
+
+
+def payload(uri):
+    """Solve payload for the probe component"""
+    sys.path.insert(0, ROOT)
+    sys.path.insert(0, op.join(ROOT, "benchmarks"))
+    import bench_components
+    comp = next(c for c in bench_components.components() if c.uri == uri)
+    return bench_components.make_payload(comp, bench_components.SIZES["small"])
+
+
+def probe(lazy, data):
+    env = dict(os.environ, HOPS_LAZY="1" if lazy else "0", PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, data], env=env, cwd=ROOT,
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark app.py startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--uri", default="/crvPointAt", help="component solved first")
+    args = parser.parse_args()
+
+    data = payload(args.uri)
+    # warm the manifest and the bytecode caches
+    probe(True, data)
+
+    stages = ("import", "register", "list", "first_solve")
+    print(f"{'mode':8} " + " ".join(f"{s:>12}" for s in stages))
+    for lazy in (False, True):
+        runs = [probe(lazy, data) for _ in range(args.runs)]
+        if not all(r["ok"] for r in runs):
+            print(f"first solve of {args.uri} failed")
+            return 1
+        medians = {s: statistics.median(r[s] for r in runs) for s in stages}
+        print(f"{'lazy' if lazy else 'eager':8} " + " ".join(f"{medians[s] * 1000:10.1f}ms" for s in stages))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
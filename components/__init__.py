@@ -0,0 +1,45 @@
+"""Components of the hops example app, one module per category
+
+install() registers them on a hops app through hopskit.LazyComponents:
+the component list comes from manifest.json and a category module is
+only imported when one of its routes is first solved. The manifest is
+rewritten whenever a category module changes.
+
+Category modules register on `hops` and share the caches below.
+"""
+import os.path as op
+
+import hopskit
+
+
+CATEGORIES = [
+    "components.basics",
+    "components.curves",
+    "components.surfaces",
+    "components.intervals",
+    "components.planes",
+    "components.points",
+    "components.vectors",
+    "components.arcs",
+]
+
+MANIFEST = op.join(op.dirname(__file__), "manifest.json")
+
+# set by install() before any category module is imported
+hops = None
+
+# knots, weights and control points per curve as numpy arrays, for batch evaluation
+evaluators = hopskit.CurveEvaluatorCache(max_entries=1024, max_bytes=128 * 2**20)
+# polylines and arc length tables per curve, reused while the curves don't change
+tessellations = hopskit.TessellationCache(max_entries=1024, max_bytes=256 * 2**20)
+# indexed meshes per surface or brep and density
+meshes = hopskit.MeshCache(max_entries=256, max_bytes=256 * 2**20)
+# closest point trees per curve, built on the tessellations above
+curve_index = hopskit.CurveIndexCache(max_entries=256, max_bytes=256 * 2**20, tessellations=tessellations)
+
+
+def install(hops_app, lazy=True):
+    """Register every category on hops_app, returns the LazyComponents"""
+    global hops
+    hops = hops_app
+    return hopskit.LazyComponents(hops_app, CATEGORIES, MANIFEST, lazy=lazy)
@@ -0,0 +1,167 @@
+"""Arc components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import rhino3dm
+
+from components import hops
+
+
+"""
+ █████╗ ██████╗  ██████╗
+██╔══██╗██╔══██╗██╔════╝
+███████║██████╔╝██║     
+██╔══██║██╔══██╗██║     
+██║  ██║██║  ██║╚██████╗
+╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝                                              
+"""
+"""
+classrhino3dm.Arc
+Arc(circle, angleRadians)
+Initializes a new instance of an arc from a base circle and an angle.
+
+Parameters:	
+circle (Circle) – Circle to base arc upon.
+angleRadians (float) – Sweep angle of arc (in radians)
+"""
+# create and arc from a circle
+@hops.component(
+    "/arcCircle",
+    name="ArcFromCircle",
+    nickname="ArcFromCircle",
+    description="ArcFromCircle",
+    inputs=[
+        hs.HopsCurve("Circle", "C", "Circle"),
+        hs.HopsNumber("Angle", "A", "Angle"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsCurve("Arc", "A", "Arc"),
+        ]
+)
+def arcCircle(circle: rhino3dm.Curve, angle: float):
+    success = True
+    arc = rhino3dm.Arc(circle, angle)
+    return success, arc
+
+"""
+Arc(center, radius, angleRadians)
+Initializes a new horizontal arc at the given center point, with a custom radius and angle.
+
+Parameters:	
+center (rhino3dm.Point3d) – Center point of arc.
+radius (float) – Radius of arc.
+angleRadians (float) – Sweep angle of arc (in radians)
+"""
+# create an arc from a center point
+@hops.component(
+    "/arcCenter",
+    name="ArcFromCenter",
+    nickname="ArcFromCenter",
+    description="ArcFromCenter",
+    inputs=[
+        hs.HopsPoint("Center", "C", "Center"),
+        hs.HopsNumber("Radius", "R", "Radius"),
+        hs.HopsNumber("Angle", "A", "Angle"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsCurve("Arc", "A", "Arc"),
+        ]
+)
+def arcCenter(center: rhino3dm.Point, radius: float, angle: float):
+    success = True
+    arc = rhino3dm.Arc(center, radius, angle)
+    # Arc is a value type and can't be serialized, send its nurbs form
+    return success, arc.ToNurbsCurve()
+
+"""
+Arc(startPoint, pointOnInterior, endPoint)
+Initializes a new arc through three points. If the points are coincident or co-linear, this will result in an Invalid arc.
+
+Parameters:	
+startPoint (rhino3dm.Point3d) – Start point of arc.
+pointOnInterior (rhino3dm.Point3d) – Point on arc interior.
+endPoint (rhino3dm.Point3d) – End point of arc.
+"""
+# create an arc from three points
+@hops.component(
+    "/arcPoints",
+    name="ArcFromPoints",
+    nickname="ArcFromPoints",
+    description="ArcFromPoints",
+    inputs=[
+        hs.HopsPoint("Start", "S", "Start"),
+        hs.HopsPoint("Interior", "I", "Interior"),
+        hs.HopsPoint("End", "E", "End"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsCurve("Arc", "A", "Arc"),
+        ]
+)
+def arcPoints(start: rhino3dm.Point, interior: rhino3dm.Point, end: rhino3dm.Point):
+    success = True
+    arc = rhino3dm.Arc(start, interior, end)
+    # Arc is a value type and can't be serialized, send its nurbs form
+    return success, arc.ToNurbsCurve()
+
+"""
+Arc(pointA, tangentA, pointB)
+Initializes a new arc from end points and a tangent vector. If the tangent is parallel with the endpoints this will result in an Invalid arc.
+
+Parameters:	
+pointA (rhino3dm.Point3d) – Start point of arc.
+tangentA (rhino3dm.Vector3d) – Tangent at start of arc.
+pointB (rhino3dm.Point3d) – End point of arc.
+"""
+# create an arc from two points and a tangent
+@hops.component(
+    "/arcTangent",
+    name="ArcFromTangent",
+    nickname="ArcFromTangent",
+    description="ArcFromTangent",
+    inputs=[
+        hs.HopsPoint("Start", "S", "Start"),
+        hs.HopsVector("Tangent", "T", "Tangent"),
+        hs.HopsPoint("End", "E", "End"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsCurve("Arc", "A", "Arc"),    
+        ]
+)
+def arcTangent(start: rhino3dm.Point, tangent: rhino3dm.Vector3d, end: rhino3dm.Point):
+    success = True
+    arc = rhino3dm.Arc(start, tangent, end)
+    # Arc is a value type and can't be serialized, send its nurbs form
+    return success, arc.ToNurbsCurve()
+
+"""
+ClosestPoint(testPoint)
+Computes the point on an arc that is closest to a test point.
+
+Parameters:	testPoint (rhino3dm.Point3d) – Point to get close to.
+Returns:	The point on the arc that is closest to testPoint. If testPoint is the center of the arc, then the starting point of the arc is returned. UnsetPoint on failure.
+Return type:	rhino3dm.Point3d
+"""
+# get the closest point on an arc
+@hops.component(
+    "/arcClosestPoint",
+    name="ArcClosestPoint",
+    nickname="ArcClosestPoint",
+    description="ArcClosestPoint",
+    inputs=[
+        hs.HopsCurve("Arc", "A", "Arc"),
+        hs.HopsPoint("Point", "P", "Point"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsPoint("Closest", "C", "Closest"),
+        ]
+)
+def arcClosestPoint(arc: rhino3dm.Curve, point: rhino3dm.Point):
+    success = True
+    closest = arc.ClosestPoint(point)
+    return success, closest
@@ -0,0 +1,171 @@
+"""Basic components: points, curves, surfaces and vectors from numbers
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import rhino3dm
+
+from components import hops
+
+
+# hs.HopsNumber(name="Angle", nickname="Ang", description="Angle"),
+# hs.HopsInteger(name="Grid", nickname="G", description="Grid size"),
+# hs.HopsBoolean(name="Adaptive", nickname="Ad", description="Adaptive meshing"),
+# hs.HopsString(name="String", nickname="S", description="String to mesh"),
+
+# hs.HopsVector(name="Vector", nickname="V", description="Vector to mesh")
+# hs.HopsPoint(name="Point", nickname="P", description="Point to mesh"),
+# hs.HopsLine(name="Line", nickname="L", description="Line to mesh"),
+# hs.HopsCurve(name="Curve", nickname="C", description="Curve to mesh"),
+
+# hs.HopsSurface(name="Surface", nickname="S", description="Surface to mesh"),
+# hs.HopsBrep(name="Brep", nickname="B", description="Brep to mesh"),
+# hs.HopsMesh(name="Mesh", nickname="M", description="Mesh to mesh"),
+# hs.HopsSubD(name="SubD", nickname="SD", description="SubD to mesh"),
+
+# hs.HopsParamAccess(name="Param", nickname="Pa", description="Parametric access"),
+# hs.HopsDefault(name="Density", nickname="D", description="Density"),
+# hs.HopsFlask(name="Flask", nickname="F", description="Flask to mesh"),
+# hs._HopsEncoder(name="Encoder", nickname="En", description="Encoder to mesh")
+
+
+
+@hops.component(
+    "/pointat",
+    name="PointAt",
+    nickname="PtAt",
+    description="Get point along curve",
+    icon="../pointat.png",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("t", "t", "Parameter on Curve to evaluate")
+    ],
+    outputs=[hs.HopsPoint("P", "P", "Point on curve at t")]
+)
+def pointat(curve: rhino3dm.Curve, t=0.0):
+    return curve.PointAt(t)
+
+
+@hops.component(
+    "/srf4pt",
+    name="4Point Surface",
+    nickname="Srf4Pt",
+    description="Create ruled surface from four points",
+    inputs=[
+        hs.HopsPoint("Corner A", "A", "First corner"),
+        hs.HopsPoint("Corner B", "B", "Second corner"),
+        hs.HopsPoint("Corner C", "C", "Third corner"),
+        hs.HopsPoint("Corner D", "D", "Fourth corner")
+    ],
+    outputs=[hs.HopsSurface("Surface", "S", "Resulting surface")]
+)
+def ruled_surface(a: rhino3dm.Point3d,
+                  b: rhino3dm.Point3d,
+                  c: rhino3dm.Point3d,
+                  d: rhino3dm.Point3d):
+    edge1 = rhino3dm.LineCurve(a, b)
+    edge2 = rhino3dm.LineCurve(c, d)
+    return rhino3dm.NurbsSurface.CreateRuledSurface(edge1, edge2)
+
+# param containers in grasshopper 
+# are represented as lists in python
+@hops.component(
+    "/createpoint",
+    name="Create Point",
+    nickname="Pt",
+    description="Create point",
+    inputs=[
+        hs.HopsNumber("X", "X", "X coordinate of point"),
+        hs.HopsNumber("Y", "Y", "Y coordinate of point"),
+        hs.HopsNumber("Z", "Z", "Z coordinate of point")
+    ],
+    outputs=[hs.HopsPoint("Point", "P", "Resulting point")]
+)
+def create_point(x=0.0, y=0.0, z=0.0):
+    return rhino3dm.Point3d(x, y, z)
+
+
+@hops.component(
+    "/createCurve",
+    name="Create Curve",
+    nickname="Crv",
+    description="Create curve",
+    inputs=[
+        hs.HopsPoint("Start", "S", "Start point of curve"),
+        hs.HopsPoint("End", "E", "End point of curve")
+    ],
+    outputs=[hs.HopsCurve("Curve", "C", "Resulting curve")]
+)
+def create_curve(start: rhino3dm.Point3d, end: rhino3dm.Point3d):
+    return rhino3dm.LineCurve(start, end)  
+
+@hops.component(
+    "/createSurface",
+    name="Create Surface",
+    nickname="Srf",
+    description="Create surface",
+    inputs=[
+        hs.HopsPoint("Corner A", "A", "First corner"),
+        hs.HopsPoint("Corner B", "B", "Second corner"),
+        hs.HopsPoint("Corner C", "C", "Third corner"),
+        hs.HopsPoint("Corner D", "D", "Fourth corner")
+    ],
+    outputs=[hs.HopsSurface("Surface", "S", "Resulting surface")]
+)
+def create_surface(a: rhino3dm.Point3d,
+                     b: rhino3dm.Point3d,
+                     c: rhino3dm.Point3d,
+                     d: rhino3dm.Point3d):
+     edge1 = rhino3dm.LineCurve(a, b)
+     edge2 = rhino3dm.LineCurve(c, d)
+     return rhino3dm.NurbsSurface.CreateRuledSurface(edge1, edge2)
+
+@hops.component(
+    "/createBrep",
+    name="Create Brep",
+    nickname="Brep",
+    description="Create brep",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to create brep from")
+    ],
+    outputs=[hs.HopsBrep("Brep", "B", "Resulting brep")]
+)
+def create_brep(surface: rhino3dm.NurbsSurface):
+    return rhino3dm.Brep.CreateFromSurface(surface)
+
+
+# create hops line
+@hops.component(
+    "/createLine",
+    name="Create Line",
+    nickname="Ln",
+    description="Create line",
+    inputs=[
+        hs.HopsPoint("Start", "S", "Start point of line"),
+        hs.HopsPoint("End", "E", "End point of line")
+    ],
+    outputs=[hs.HopsLine("Line", "L", "Resulting line")]
+)
+def create_line(start: rhino3dm.Point3d, end: rhino3dm.Point3d):
+    return rhino3dm.LineCurve(start, end)
+
+
+
+# create hops vector
+@hops.component(
+    "/createVector",
+    name="Create Vector",
+    nickname="Vec",
+    description="Create vector",
+    inputs=[
+        hs.HopsNumber("X", "X", "X coordinate of vector"),
+        hs.HopsNumber("Y", "Y", "Y coordinate of vector"),
+        hs.HopsNumber("Z", "Z", "Z coordinate of vector")
+    ],
+    outputs=[hs.HopsVector("Vector", "V", "Resulting vector")]
+)
+def create_vector(x: float, y: float, z: float):
+    return rhino3dm.Vector3d(x, y, z)
+
+# create hops mesh
+# create hops subd
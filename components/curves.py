@@ -0,0 +1,1019 @@
+"""Curve components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import rhino3dm
+
+import hopskit
+
+from components import hops, tessellations, curve_index, evaluators
+
+
+"""
+ ██████╗██╗   ██╗██████╗ ██╗   ██╗███████╗███████╗
+██╔════╝██║   ██║██╔══██╗██║   ██║██╔════╝██╔════╝
+██║     ██║   ██║██████╔╝██║   ██║█████╗  ███████╗
+██║     ██║   ██║██╔══██╗╚██╗ ██╔╝██╔══╝  ╚════██║
+╚██████╗╚██████╔╝██║  ██║ ╚████╔╝ ███████╗███████║
+ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝  ╚═══╝  ╚══════╝╚══════╝
+                                                  
+"""
+
+"""curve domain
+Domain
+rhino3dm.Interval: Gets or sets the domain of the curve.
+"""
+@hops.component(
+    "/crvDomainT0T1",
+    name="Curve Domain",
+    nickname="CrvDom",
+    description="Curve domain",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get domain from")
+    ],
+    outputs=[hs.HopsNumber("T0", "T0", "T0 of domain"), hs.HopsNumber("T1", "T1", "T1 of domain")]
+)
+def crv_domain(curve: rhino3dm.Curve):
+    return curve.Domain.T0, curve.Domain.T1
+
+"""
+curve dimension
+Dimension
+int: Gets the dimension of the object. 
+The dimension is typically three. 
+For parameter space trimming curves the dimension is two. 
+In rare cases the dimension can be one or greater than three.
+"""
+@hops.component(
+    "/crvDimension",
+    name="Curve Dimension",
+    nickname="CrvDim",
+    description="Curve dimension",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get dimension from")
+    ],
+    outputs=[hs.HopsNumber("Dimension", "D", "Dimension of curve")],
+    batch=lambda curves: [c.Dimension for c in curves]
+)
+def crv_dimension(curve: rhino3dm.Curve):
+    return curve.Dimension
+
+"""
+curve span count
+SpanCount
+int: Gets the number of non-empty smooth (c-infinity) spans in the curve.
+"""
+@hops.component(
+    "/crvSpanCount",
+    name="Curve Span Count",
+    nickname="CrvSpan",
+    description="Curve span count",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get span count from")
+    ],
+    outputs=[hs.HopsNumber("SpanCount", "Span", "Span count of curve")],
+    batch=lambda curves: [c.SpanCount for c in curves]
+)
+def crv_span_count(curve: rhino3dm.Curve):
+    return curve.SpanCount
+
+"""
+curve degree
+Degree
+int: Gets the maximum algebraic degree 
+of any span or a good estimate if 
+curve spans are not algebraic.
+"""
+@hops.component(
+    "/crvDegree",
+    name="Curve Degree",
+    nickname="CrvDeg",
+    description="Curve degree",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get degree from")
+    ],
+    outputs=[hs.HopsNumber("Degree", "Deg", "Degree of curve")],
+    batch=lambda curves: [c.Degree for c in curves]
+)
+def crv_degree(curve: rhino3dm.Curve):
+    return curve.Degree
+
+"""
+curve IsClosed
+IsClosed
+bool: Gets a value indicating whether 
+or not this curve is a closed curve.
+"""
+@hops.component(
+    "/crvIsClosed",
+    name="Curve Is Closed",
+    nickname="CrvClosed",
+    description="Curve is closed",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get is closed from")
+    ],
+    outputs=[hs.HopsBoolean("IsClosed", "Closed", "Is curve closed")],
+    batch=lambda curves: [c.IsClosed for c in curves]
+)
+def crv_is_closed(curve: rhino3dm.Curve):
+    return curve.IsClosed
+
+"""
+curve IsPeriodic
+IsPeriodic
+bool: Gets a value indicating whether 
+or not this curve is considered to be Periodic.
+"""
+@hops.component(
+    "/crvIsPeriodic",
+    name="Curve Is Periodic",
+    nickname="CrvPeriodic",
+    description="Curve is periodic",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get is periodic from")
+    ],
+    outputs=[hs.HopsBoolean("IsPeriodic", "Periodic", "Is curve periodic")],
+    batch=lambda curves: [c.IsPeriodic for c in curves]
+)
+def crv_is_periodic(curve: rhino3dm.Curve):
+    return curve.IsPeriodic
+
+"""
+curve PointAtStart
+PointAtStart
+rhino3dm.Point3d: 
+Evaluates point at the start of the curve.
+"""
+@hops.component(
+    "/crvPointAtStart",
+    name="Curve Point At Start",
+    nickname="CrvStart",
+    description="Curve point at start",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get point at start from")
+    ],
+    outputs=[hs.HopsPoint("PointAtStart", "P", "Point at start of curve")]
+)
+def crv_point_at_start(curve: rhino3dm.Curve):
+    return curve.PointAtStart
+
+"""
+curve PointAtEnd
+PointAtEnd
+rhino3dm.Point3d:
+Evaluates point at the end of the curve.
+"""
+@hops.component(
+    "/crvPointAtEnd",
+    name="Curve Point At End",
+    nickname="CrvEnd",
+    description="Curve point at end",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get point at end from")
+    ],
+    outputs=[hs.HopsPoint("PointAtEnd", "P", "Point at end of curve")]
+)
+def crv_point_at_end(curve: rhino3dm.Curve):
+    return curve.PointAtEnd
+
+"""
+curve TangentAtStart
+TangentAtStart
+rhino3dm.Vector3d: Evaluates the unit 
+tangent vector at the start of the curve.
+"""
+@hops.component(
+    "/crvTangentAtStart",
+    name="Curve Tangent At Start",
+    nickname="CrvStartTang",
+    description="Curve tangent at start", 
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get tangent at start from")
+    ],
+    outputs=[hs.HopsVector("TangentAtStart", "T", "Tangent at start of curve")]
+)   
+def crv_tangent_at_start(curve: rhino3dm.Curve):
+    return curve.TangentAtStart
+
+"""
+curve TangentAtEnd
+TangentAtEnd
+rhino3dm.Vector3d: Evaluates the unit
+tangent vector at the end of the curve.
+"""
+@hops.component(
+    "/crvTangentAtEnd",
+    name="Curve Tangent At End",
+    nickname="CrvEndTang",
+    description="Curve tangent at end",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to get tangent at end from")
+    ],
+    outputs=[hs.HopsVector("TangentAtEnd", "T", "Tangent at end of curve")]
+)   
+def crv_tangent_at_end(curve: rhino3dm.Curve):
+    return curve.TangentAtEnd
+
+"""
+static Create Control Point Curve
+staticCreateControlPointCurve(points, degree)
+Constructs a curve from a set of control-point locations.
+
+Parameters:	
+points (list[rhino3dm.Point3d]) – Control points.
+degree (int) – Degree of curve. The number of control points must be at least degree+1.
+Return type:	
+rhino3dm.Curve
+"""
+@hops.component(
+    "/crvCP5",
+    name="Create Control Point Curve",
+    nickname="CrvCreateCP",
+    description="Create control point curve",
+    inputs=[
+        hs.HopsPoint("Points", "P", "Control points", access=hs.HopsParamAccess.LIST),
+        hs.HopsInteger("Degree", "D", "Degree of curve")
+    ],
+    outputs=[hs.HopsCurve("Curve", "C", "Curve")]
+)
+def crvCP5(points, degree):
+    return rhino3dm.Curve.CreateControlPointCurve(points, degree)
+
+"""
+curve Change Dimension
+ChangeDimension(desiredDimension)
+Changes the dimension of a curve.
+
+Parameters:	desiredDimension (int) – The desired dimension.
+Returns:	True if the curve’s dimension was already desired
+Dimension or if the curve’s dimension was successfully 
+changed to desiredDimension; otherwise false.
+Return type:	bool
+"""
+@hops.component(
+    "/crvChangeDimension",
+    name="Change Dimension",
+    nickname="CrvChangeDim",
+    description="Change dimension of curve",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to change dimension of"),
+        hs.HopsInteger("DesiredDimension", "D", "Desired dimension")
+    ],
+    outputs=[hs.HopsBoolean("Changed", "Ch", "Changed")]
+)
+def crv_change_dimension(curve: rhino3dm.Curve, desiredDimension):
+    return curve.ChangeDimension(desiredDimension)
+
+"""
+curve IsLinear
+IsLinear(tolerance)
+Test a curve to see if it is linear 
+to within RhinoMath.ZeroTolerance units (1e-12).
+
+Returns:	True if the curve is linear.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsLinear",
+    name="Is Linear",
+    nickname="CrvLinear",
+    description="Curve is linear",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsLinear", "Lin", "Is linear")]
+)
+def crv_is_linear(curve: rhino3dm.Curve):
+    return curve.IsLinear()
+
+"""
+curve is polyline
+IsPolyline()
+Several types of Curve can have the form of a polyline including a degree 1 NurbsCurve, a PolylineCurve, and a PolyCurve all of whose segments are some form of polyline. IsPolyline tests a curve to see if it can be represented as a polyline.
+
+Returns:	True if this curve can be represented as a polyline; otherwise, false.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsPolyline",
+    name="Is Polyline",
+    nickname="CrvPolyline",
+    description="Curve is polyline",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsPolyline", "Poly", "Is polyline")]
+)
+def crv_is_polyline(curve: rhino3dm.Curve):
+    return curve.IsPolyline()
+
+"""curve try get polyline
+TryGetPolyline()
+Several types of Curve can have the form of a 
+polyline including a degree 1 NurbsCurve, 
+a PolylineCurve, and a PolyCurve all of 
+whose segments are some form of polyline. 
+IsPolyline tests a curve to see if it can be represented as a polyline.
+
+Returns:	tuple (bool, rhino3dm.Polyline)
+True if this curve can be represented as a polyline; otherwise, false.
+If True is returned, then the polyline form is returned here.
+Return type:	(bool, rhino3dm.Polyline)
+"""
+# @hops.component(
+#     "/crvTryGetPolyline",
+#     name="Try Get Polyline",
+#     nickname="CrvTryPoly",
+#     description="Try get polyline",
+#     inputs=[
+#         hs.HopsCurve("Curve", "C", "Curve to test")
+#     ],
+#     outputs=[hs.HopsLine("Polyline", "Poly", "Polyline")]
+# )
+# def crv_try_get_polyline(curve: rhino3dm.Curve):
+#     polyline = rhino3dm.Polyline()
+#     if curve.TryGetPolyline(polyline):
+#         return polyline
+#     else:
+#         return None
+
+
+"""
+curve is arc
+IsArc(tolerance)
+Test a curve to see if it can be represented 
+by an arc or circle within RhinoMath.ZeroTolerance.
+
+Returns:	True if the curve can 
+be represented by an arc or a circle within tolerance.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsArc",
+    name="Is Arc",
+    nickname="CrvArc",
+    description="Curve is arc",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsArc", "Arc", "Is arc")]
+)
+def crv_is_arc(curve: rhino3dm.Curve):
+    return curve.IsArc()
+
+# curve try get arc
+
+"""
+curve is circle
+IsCircle(tolerance)
+Test a curve to see if it can be represented 
+by a circle within RhinoMath.ZeroTolerance.
+
+Returns:	True if the Curve can be 
+represented by a circle within tolerance.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsCircle",
+    name="Is Circle",
+    nickname="CrvCircle",
+    description="Curve is circle",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsCircle", "Circ", "Is circle")]
+)
+def crv_is_circle(curve: rhino3dm.Curve):
+    return curve.IsCircle()
+
+# curve try get circle
+
+"""
+curve is ellipse
+IsEllipse(tolerance)
+Test a curve to see if it can be represented 
+by an ellipse within RhinoMath.ZeroTolerance.
+
+Returns:	True if the Curve can be 
+represented by an ellipse within tolerance.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsEllipse",
+    name="Is Ellipse",
+    nickname="CrvEllipse",
+    description="Curve is ellipse",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsEllipse", "Ell", "Is ellipse")]
+)
+def crv_is_ellipse(curve: rhino3dm.Curve):
+    return curve.IsEllipse()
+
+# curve try get ellipse
+
+"""
+curve is planar
+IsPlanar(tolerance)
+Test a curve for planarity.
+
+Returns:	True if the curve is planar (flat) 
+to within RhinoMath.ZeroTolerance units (1e-12).
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsPlanar",
+    name="Is Planar",
+    nickname="CrvPlanar",
+    description="Curve is planar",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    outputs=[hs.HopsBoolean("IsPlanar", "Plan", "Is planar")]
+)
+def crv_is_planar(curve: rhino3dm.Curve):
+    return curve.IsPlanar()
+
+"""
+curve classify
+All of IsClosed, IsLinear, IsPolyline, IsArc, IsCircle,
+IsEllipse and IsPlanar for a whole list of curves in one request.
+Kind is the most specific shape:
+0 Line, 1 Polyline, 2 Circle, 3 Arc, 4 Ellipse, 5 Planar, 6 Free.
+"""
+@hops.component(
+    "/crvClassify",
+    name="Classify Curves",
+    nickname="CrvClassify",
+    description="Curve shape tests for a list of curves",
+    inputs=[
+        hs.HopsCurve("Curves", "C", "Curves to classify", hs.HopsParamAccess.LIST)
+    ],
+    outputs=[
+        hs.HopsInteger("Kind", "K", "0 Line, 1 Polyline, 2 Circle, 3 Arc, 4 Ellipse, 5 Planar, 6 Free", hs.HopsParamAccess.LIST),
+        hs.HopsString("Name", "N", "Kind name", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsClosed", "Closed", "Is closed", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsLinear", "Lin", "Is linear", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsPolyline", "Poly", "Is polyline", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsArc", "Arc", "Is arc", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsCircle", "Circ", "Is circle", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsEllipse", "Ell", "Is ellipse", hs.HopsParamAccess.LIST),
+        hs.HopsBoolean("IsPlanar", "Plan", "Is planar", hs.HopsParamAccess.LIST)
+    ]
+)
+def crv_classify(curves):
+    classes = [hopskit.classify_curve(c) for c in curves]
+    columns = [list(column) for column in zip(*classes)] or [[] for _ in hopskit.CurveClass._fields]
+    names = [hopskit.CURVE_KINDS[kind] for kind in columns[0]]
+    return (columns[0], names, *columns[1:])
+
+"""
+curve change closed seam
+ChangeClosedCurveSeam(t)
+If this curve is closed, then modify it 
+so that the start/end point is at 
+curve parameter t.
+
+Parameters:	t (float) – Curve parameter 
+of new start/end point. The returned 
+curves domain will start at t.
+Returns:	True on success, False on failure.
+Return type:	bool
+"""
+@hops.component(
+    "/crvChangeClosedCurveSeam",
+    name="Change Closed Curve Seam",
+    nickname="CrvChangeClosedCurveSeam",
+    description="Change closed curve seam",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to change seam of"),
+        hs.HopsNumber("Parameter", "T", "Parameter of new start/end point")
+    ],
+    outputs=[hs.HopsBoolean("Changed", "Ch", "Changed")]
+)
+def crv_change_closed_curve_seam(curve: rhino3dm.Curve, parameter):
+    return curve.ChangeClosedCurveSeam(parameter)
+
+"""
+curve is closable
+IsClosable(tolerance, minimumAbsoluteSize, 
+minimumRelativeSize)
+Decide if it makes sense to close off 
+this curve by moving the endpoint to the 
+start based on start-end gap size and 
+length of curve as approximated by 
+chord defined by 6 points.
+
+Returns:	True if start and end points 
+are close enough based on above conditions.
+Return type:	bool
+"""
+@hops.component(
+    "/crvIsClose",
+    name="Is Closable",
+    nickname="CrvClosable",
+    description="Curve is closable",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to test"),
+        hs.HopsNumber("Tolerance", "T", "Tolerance"),
+        hs.HopsNumber("MinimumAbsoluteSize", "MA", "Minimum absolute size"),
+        hs.HopsNumber("MinimumRelativeSize", "MR", "Minimum relative size")
+    ],
+    outputs=[hs.HopsBoolean("IsClosable", "Clos", "Is closable")]
+)
+def crv_is_close(curve: rhino3dm.Curve, tolerance, minimum_absolute_size, minimum_relative_size):
+    return curve.IsClosable(tolerance, minimum_absolute_size, minimum_relative_size)
+
+"""
+curve reverse
+Reverse()
+Reverses the direction of the curve.
+
+Returns:	True on success, False on failure.
+Return type:	bool
+"""
+@hops.component(
+    "/crvReverse",
+    name="Reverse",
+    nickname="CrvReverse",
+    description="Curve reverse",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to reverse")
+    ],
+    outputs=[hs.HopsBoolean("Reversed", "Rev", "Reversed")]
+)
+def crv_reverse(curve: rhino3dm.Curve):
+    return curve.Reverse()
+
+"""
+curve close curve orientation
+ClosedCurveOrientation()
+Determines the orientation (counterclockwise or clockwise) 
+of a closed, planar curve in the world XY plane. 
+Only works with simple (no self intersections) closed, planar curves.
+
+Returns:	The orientation of this curve with respect to world XY plane.
+Return type:	CurveOrientation
+"""
+@hops.component(
+    "/crvClosedCurveOrientation",
+    name="Closed Curve Orientation",
+    nickname="CrvClosedCurveOrientation",
+    description="Curve close curve orientation",
+    inputs=[    
+        hs.HopsCurve("Curve", "C", "Curve to test")
+    ],
+    # bugging out with hs.HopsEnum
+    outputs=[hs.HopsInteger("Orientation", "O", "Orientation", ["Clockwise", "Counterclockwise"])]
+)
+def crv_closed_curve_orientation(curve: rhino3dm.Curve):
+    return curve.ClosedCurveOrientation()
+
+"""
+curve point at parameter
+PointAt(t)
+Evaluates point at a curve parameter.
+
+Parameters:	t (float) – Evaluation parameter.
+Returns:	Point (location of curve at the parameter t).
+Return type:	rhino3dm.Point3d
+"""
+@hops.component(
+    "/crvPointAt",
+    name="Point At",
+    nickname="CrvPointAt",
+    description="Curve point at parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameter", "T", "Parameter to evaluate")
+    ],
+    outputs=[hopskit.HopsPointArray("Point", "P", "Point", hs.HopsParamAccess.ITEM)],
+    # whole trees are evaluated with numpy, one pass per curve
+    batch=lambda curves, parameters: hopskit.evaluate_curves(curves, parameters, evaluators).points
+)
+def crv_point_at(curve: rhino3dm.Curve, parameter):
+    return curve.PointAt(parameter)
+
+"""
+curve set start point
+SetStartPoint(point)
+Forces the curve to start at a specified point. Not all curve types support this operation.
+
+Parameters:	point (rhino3dm.Point3d) – New start point of curve.
+Returns:	True on success, False on failure.
+Return type:	bool
+"""
+@hops.component(
+    "/crvSetStartPoint",
+    name="Set Start Point",
+    nickname="CrvSetStartPoint",
+    description="Curve set start point",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to set start point of"),
+        hs.HopsPoint("Point", "P", "Point to set start point of")
+    ],
+    outputs=[hs.HopsBoolean("Set", "Set", "Set")]
+)
+def crv_set_start_point(curve: rhino3dm.Curve, point: rhino3dm.Point3d):
+    return curve.SetStartPoint(point)
+
+"""
+curve set end point
+SetEndPoint(point)
+Forces the curve to end at a specified point. Not all curve types support this operation.
+
+Parameters:	point (rhino3dm.Point3d) – New end point of curve.
+Returns:	True on success, False on failure.
+Return type:	bool
+"""
+@hops.component(
+    "/crvSetEndPoint",
+    name="Set End Point",
+    nickname="CrvSetEndPoint",
+    description="Curve set end point",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to set end point of"),
+        hs.HopsPoint("Point", "P", "Point to set end point of")
+    ],
+    outputs=[hs.HopsBoolean("Set", "Set", "Set")]
+)
+def crv_set_end_point(curve: rhino3dm.Curve, point: rhino3dm.Point3d):
+    return curve.SetEndPoint(point)
+
+""".
+TangentAt(t)
+Evaluates the unit tangent vector at a curve parameter.
+
+Parameters:	t (float) – Evaluation parameter.
+Returns:	Unit tangent vector of the curve at the parameter t.
+Return type:	rhino3dm.Vector3d
+"""
+@hops.component(
+    "/crvTangentAt",
+    name="Tangent At",
+    nickname="CrvTangentAt",
+    description="Curve tangent at parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameter", "T", "Parameter to evaluate")
+    ],
+    outputs=[hopskit.HopsVectorArray("Tangent", "T", "Tangent", hs.HopsParamAccess.ITEM)],
+    batch=lambda curves, parameters: hopskit.evaluate_curves(
+        curves, parameters, evaluators, points=False, tangents=True
+    ).tangents
+)
+def crv_tangent_at(curve: rhino3dm.Curve, parameter):
+    return curve.TangentAt(parameter)
+
+"""
+CurvatureAt(t)
+Evaluate the curvature vector at a curve parameter.
+
+Parameters:	t (float) – Evaluation parameter.
+Returns:	Curvature vector of the curve at the parameter t.
+Return type:	rhino3dm.Vector3d
+"""
+@hops.component(
+    "/crvCurvatureAt",
+    name="Curvature At",
+    nickname="CrvCurvatureAt",
+    description="Curve curvature at parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameter", "T", "Parameter to evaluate")
+    ],
+    outputs=[hopskit.HopsVectorArray("Curvature", "C", "Curvature", hs.HopsParamAccess.ITEM)],
+    batch=lambda curves, parameters: hopskit.evaluate_curves(
+        curves, parameters, evaluators, points=False, curvatures=True
+    ).curvatures
+)
+def crv_curvature_at(curve: rhino3dm.Curve, parameter):
+    return curve.CurvatureAt(parameter)
+
+"""
+curve frame at parameter
+FrameAt(t)
+Returns a 3d frame at a parameter.
+
+Parameters:	t (float) – Evaluation parameter.
+Returns:	tuple (bool, rhino3dm.Plane)
+True on success, False on failure.
+The frame is returned here.
+Return type:	(bool, rhino3dm.Plane)
+"""
+@hops.component(
+    "/crvFrameAt",
+    name="Frame At",
+    nickname="CrvFrameAt",
+    description="Curve frame at parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameter", "T", "Parameter to evaluate")
+    ],
+    # need to output an origin point and vectors for creating a plane in the UI
+    outputs=[
+        hs.HopsBoolean("Success", "Success", "Success"), 
+        hopskit.HopsPointArray("Origin", "O", "Origin", hs.HopsParamAccess.ITEM),
+        hopskit.HopsVectorArray("X", "X", "X", hs.HopsParamAccess.ITEM),
+        hopskit.HopsVectorArray("Y", "Y", "Y", hs.HopsParamAccess.ITEM),
+        hopskit.HopsVectorArray("Z", "Z", "Z", hs.HopsParamAccess.ITEM)
+    ],
+    batch=lambda curves, parameters: crv_frames_at(curves, parameters)
+)
+def crv_frame_at(curve: rhino3dm.Curve, parameter):
+    success, frame = curve.FrameAt(parameter)
+    return success, frame.Origin, frame.XAxis, frame.YAxis, frame.ZAxis
+
+def crv_frames_at(curves, parameters):
+    s = hopskit.evaluate_curves(curves, parameters, evaluators, frames=True)
+    return s.success.tolist(), s.origins, s.xaxes, s.yaxes, s.zaxes
+
+"""
+curve evaluate at many parameters
+Same as PointAt, TangentAt, CurvatureAt and FrameAt
+but for a whole list of parameters in one request.
+Results are returned as packed lists, one item per parameter,
+and the frames use the same Success/Origin/X/Y/Z layout as /crvFrameAt.
+"""
+@hops.component(
+    "/crvEvaluate",
+    name="Evaluate Curve",
+    nickname="CrvEval",
+    description="Curve points, tangents, curvature and frames at parameters",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameters", "T", "Parameters to evaluate", hs.HopsParamAccess.LIST)
+    ],
+    outputs=[
+        hopskit.HopsPointArray("Points", "P", "Points"),
+        hopskit.HopsVectorArray("Tangents", "T", "Tangents"),
+        hopskit.HopsVectorArray("Curvatures", "K", "Curvatures"),
+        hs.HopsBoolean("Success", "Success", "Success", hs.HopsParamAccess.LIST),
+        hopskit.HopsPointArray("Origin", "O", "Origin"),
+        hopskit.HopsVectorArray("X", "X", "X"),
+        hopskit.HopsVectorArray("Y", "Y", "Y"),
+        hopskit.HopsVectorArray("Z", "Z", "Z")
+    ],
+    # parameter lists change with every slider move and outputs are large
+    cache=False
+)
+def crv_evaluate(curve: rhino3dm.Curve, parameters):
+    s = hopskit.evaluate_curve(
+        curve, parameters, tangents=True, curvatures=True, frames=True, evaluator=evaluators.evaluator(curve)
+    )
+    return s.points, s.tangents, s.curvatures, s.success.tolist(), s.origins, s.xaxes, s.yaxes, s.zaxes
+
+"""
+curve closest points
+Closest point on a set of curves for every point of a point cloud.
+Each curve is tessellated into a segment tree once (cached per curve),
+hits are refined on the real curve. Index is the curve each point
+landed on.
+"""
+@hops.component(
+    "/crvClosestPoints",
+    name="Closest Points",
+    nickname="CrvCPs",
+    description="Closest points on curves for many points",
+    inputs=[
+        hs.HopsCurve("Curves", "C", "Curves to project to", hs.HopsParamAccess.LIST),
+        hs.HopsPoint("Points", "P", "Points to project", hs.HopsParamAccess.LIST)
+    ],
+    outputs=[
+        hopskit.HopsPointArray("Closest", "P", "Closest points"),
+        hopskit.HopsNumberArray("Parameters", "t", "Curve parameters"),
+        hs.HopsInteger("Index", "i", "Index of the closest curve", hs.HopsParamAccess.LIST),
+        hopskit.HopsNumberArray("Distance", "D", "Distances")
+    ]
+)
+def crv_closest_points(curves, points):
+    xyz = [(p.X, p.Y, p.Z) for p in points]
+    closest, params, index, distance = curve_index.closest_points(curves, xyz)
+    return closest, params, index.tolist(), distance
+
+"""
+curve divide by length
+Points every Length along the curve, starting at the curve start.
+Uses the cached arc length table of the curve, see /crvParamAtLength.
+"""
+@hops.component(
+    "/crvDivideLength",
+    name="Divide Length",
+    nickname="CrvDivLen",
+    description="Divide a curve into segments of a given length",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to divide"),
+        hs.HopsNumber("Length", "L", "Segment length")
+    ],
+    outputs=[
+        hopskit.HopsPointArray("Points", "P", "Division points"),
+        hopskit.HopsNumberArray("Parameters", "t", "Parameters at division points")
+    ]
+)
+def crv_divide_length(curve: rhino3dm.Curve, length):
+    tess = tessellations.tessellate(curve)
+    params = tess.divide_length(length)
+    return tess.evaluator.derivatives(params)[0], tess.curve_parameters(params)
+
+"""
+curve parameter at length
+Parameters at arc lengths measured from the curve start.
+Lengths outside [0, curve length] are clamped.
+"""
+@hops.component(
+    "/crvParamAtLength",
+    name="Parameter At Length",
+    nickname="CrvTAtLen",
+    description="Curve parameters at arc lengths from the start",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Lengths", "L", "Lengths from the curve start", hs.HopsParamAccess.LIST)
+    ],
+    outputs=[
+        hopskit.HopsNumberArray("Parameters", "t", "Parameters"),
+        hopskit.HopsPointArray("Points", "P", "Points at the parameters"),
+        hs.HopsNumber("Length", "L", "Curve length")
+    ]
+)
+def crv_param_at_length(curve: rhino3dm.Curve, lengths):
+    tess = tessellations.tessellate(curve)
+    params = tess.parameters_at_length(lengths)
+    return tess.curve_parameters(params), tess.evaluator.derivatives(params)[0], float(tess.length)
+
+"""
+curve get curve parameter form nurbs from parameter
+GetCurveParameterFromNurbsFormParameter(nurbsParameter)
+Convert a NURBS curve parameter to a curve parameter.
+
+Parameters:	nurbsParameter (float) – NURBS form parameter.
+Returns:	tuple (bool, float)
+True on success, False on failure.
+Curve parameter.
+Return type:	(bool, float)
+"""
+@hops.component(
+    "/crvGetCurveParameterFromNurbsFormParameter",
+    name="Get Curve Parameter From Nurbs Form Parameter",
+    nickname="CrvGetCurveParameterFromNurbsFormParameter",
+    description="Curve get curve parameter from nurbs form parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("NurbsFormParameter", "N", "Nurbs form parameter to evaluate")
+    ],
+    outputs=[
+            hs.HopsBoolean("Success", "Success", "Success"), 
+            hs.HopsNumber("CurveParameter", "P", "Curve parameter")]
+)
+def crv_get_curve_parameter_from_nurbs_form_parameter(curve: rhino3dm.Curve, nurbs_form_parameter):
+    success, curve_parameter = curve.GetCurveParameterFromNurbsFormParameter(nurbs_form_parameter)
+    return success, curve_parameter
+
+"""
+curve get nurbs form parameter from curve parameter
+GetNurbsFormParameterFromCurveParameter(curveParameter)
+Convert a curve parameter to a NURBS curve parameter.
+
+Parameters:	curveParameter (float) – Curve parameter.
+Returns:	tuple (bool, float)
+True on success, False on failure.
+NURBS form parameter.
+Return type:	(bool, float)
+"""
+@hops.component(
+    "/crvGetNurbsFormParameterFromCurveParameter",
+    name="Get Nurbs Form Parameter From Curve Parameter",
+    nickname="CrvGetNurbsFormParameterFromCurveParameter",
+    description="Curve get nurbs form parameter from curve parameter",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("CurveParameter", "P", "Curve parameter to evaluate")
+    ],
+    outputs=[
+            hs.HopsBoolean("Success", "Success", "Success"), 
+            hs.HopsNumber("NurbsFormParameter", "N", "Nurbs form parameter")]
+)
+def crv_get_nurbs_form_parameter_from_curve_parameter(curve: rhino3dm.Curve, curve_parameter):
+    success, nurbs_form_parameter = curve.GetNurbsFormParameterFromCurveParameter(curve_parameter)
+    return success, nurbs_form_parameter
+
+"""
+curve trim(t0, t1)
+Trim(t0, t1)
+Removes portions of the curve outside the specified interval.
+
+Parameters:	
+t0 (float) – Start of the trimming interval. Portions of the curve before curve(t0) are removed.
+t1 (float) – End of the trimming interval. Portions of the curve after curve(t1) are removed.
+Returns:	
+Trimmed portion of this curve is successful, None on failure.
+
+Return type:	
+rhino3dm.Curve
+"""
+@hops.component(
+    "/crvTrim",
+    name="Trim",
+    nickname="CrvTrim",
+    description="Curve trim",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Start", "S", "Start of the trimming interval"),
+        hs.HopsNumber("End", "E", "End of the trimming interval")
+    ],
+    outputs=[hs.HopsCurve("Trimmed", "T", "Trimmed curve")]
+)
+def crv_trim(curve: rhino3dm.Curve, start, end):
+    return curve.Trim(start, end)
+
+"""
+curve split(t)
+Split(t)
+Splits (divides) the curve at the specified parameter. 
+The parameter must be in the interior of the curve’s domain.
+
+Parameters:	t (float) – Parameter to split 
+the curve at in the interval returned by Domain().
+Returns:	Two curves on success, None on failure.
+Return type:	rhino3dm.Curve[]
+"""
+@hops.component(
+    "/crvSplit",
+    name="Split",
+    nickname="CrvSplit",
+    description="Curve split",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate"),
+        hs.HopsNumber("Parameter", "T", "Parameter to split the curve at in the interval returned by Domain()")
+    ],
+    outputs=[hs.HopsCurve("First", "F", "First curve"), hs.HopsCurve("Second", "S", "Second curve")]
+)
+def crv_split(curve: rhino3dm.Curve, parameter):
+    return curve.Split(parameter)
+
+"""
+curve to nurbs curve
+ToNurbsCurve()
+Constructs a NURBS curve representation of this curve.
+
+Returns:	NURBS representation of the curve on success, None on failure.
+Return type:	rhino3dm.NurbsCurve
+"""
+@hops.component(
+    "/crvToNurbsCurve",
+    name="To Nurbs Curve",
+    nickname="CrvToNurbsCurve",
+    description="Curve to nurbs curve",
+    inputs=[
+        hs.HopsCurve("Curve", "C", "Curve to evaluate")
+    ],
+    outputs=[hs.HopsCurve("Nurbs", "N", "Nurbs curve")]
+)
+def crv_to_nurbs_curve(curve: rhino3dm.Curve):
+    return curve.ToNurbsCurve()
+
+
+"""
+ ██████╗██╗   ██╗██████╗ ██╗   ██╗███████╗███████╗
+██╔════╝██║   ██║██╔══██╗██║   ██║██╔════╝██╔════╝
+██║     ██║   ██║██████╔╝██║   ██║█████╗  ███████╗
+██║     ██║   ██║██╔══██╗╚██╗ ██╔╝██╔══╝  ╚════██║
+╚██████╗╚██████╔╝██║  ██║ ╚████╔╝ ███████╗███████║
+ ╚═════╝ ╚═════╝ ╚═╝  ╚═╝  ╚═══╝  ╚══════╝╚══════╝
+                                                  
+"""
+
+"""
+classrhino3dm.Line
+Line(from, to)
+Constructs a new line segment between two points.
+
+Parameters:	
+from (rhino3dm.Point3d) – Start point of line.
+to (rhino3dm.Point3d) – End point of line.
+From
+rhino3dm.Point3d: Start point of line segment.
+
+To
+rhino3dm.Point3d: End point of line segment.
+"""
+# create line
+@hops.component(
+    "/lineFromAB",
+    name="LineFromAB",
+    nickname="LineFromAB",
+    description="LineFromAtoB",
+    inputs=[
+        hs.HopsPoint("A", "A", "A"),
+        hs.HopsPoint("B", "B", "B"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsCurve("Line", "L", "Line"),
+        ]
+)
+def lineFromAB(a: rhino3dm.Point, b: rhino3dm.Point):
+    success = True
+    line = rhino3dm.LineCurve(a, b)
+    return success, line
@@ -0,0 +1,118 @@
+"""Interval components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import rhino3dm
+
+from components import hops
+
+
+"""
+██╗███╗   ██╗████████╗███████╗██████╗ ██╗   ██╗ █████╗ ██╗     
+██║████╗  ██║╚══██╔══╝██╔════╝██╔══██╗██║   ██║██╔══██╗██║     
+██║██╔██╗ ██║   ██║   █████╗  ██████╔╝██║   ██║███████║██║     
+██║██║╚██╗██║   ██║   ██╔══╝  ██╔══██╗╚██╗ ██╔╝██╔══██║██║     
+██║██║ ╚████║   ██║   ███████╗██║  ██║ ╚████╔╝ ██║  ██║███████╗
+╚═╝╚═╝  ╚═══╝   ╚═╝   ╚══════╝╚═╝  ╚═╝  ╚═══╝  ╚═╝  ╚═╝╚══════╝
+"""
+"""
+create interval(t0, t1)
+Interval(t0, t1)
+Initializes a new instance of the Rhino.Geometry.Interval class.
+
+Parameters:	
+t0 (float) – The first value.
+t1 (float) – The second value.
+T0
+float: Gets or sets the lower bound of the Interval.
+
+T1
+float: Gets or sets the upper bound of the Interval.
+"""
+@hops.component(
+    "/intervalConcat",
+    name="Interval",
+    nickname="Intv",
+    description="Interval",
+    inputs=[
+        hs.HopsNumber("T0", "T0", "T0"),
+        hs.HopsNumber("T1", "T1", "T1")
+    ],
+    # output t0 (float) – The first value.
+    # output t1 (float) – The second value.
+    outputs=[
+        hs.HopsNumber("T0", "T0", "T0"), 
+        hs.HopsNumber("T1", "T1", "T1"),
+        hs.HopsString("concatenated", "C", "Concatenated")
+        ]
+)
+def intervalConcat(t0, t1):
+    num_t0 = float(t0)
+    num_t1 = float(t1)
+    concatenated = str(num_t0) + " to " + str(num_t1)
+    return num_t0, num_t1, concatenated
+
+"""
+surface domain(direction)
+Domain(direction)
+Gets the domain in a direction.
+
+Parameters:	direction (int) – 
+0 gets first parameter, 
+1 gets second parameter.
+Returns:	An interval value.
+Return type:	rhino3dm.Interval
+"""
+
+"""
+@hops.component(
+    "/srfDomain2",
+    name="Domain",
+    nickname="SrfDomain",
+    description="Surface domain",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("Umin", "Umin", "Umin"),
+        hs.HopsNumber("Umax", "Umax", "Umax"),
+        hs.HopsNumber("Vmin", "Vmin", "Vmin"),
+        hs.HopsNumber("Vmax", "Vmax", "Vmax")
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"), 
+        hs.HopsPoint("Start", "S", "Start"),
+        ]
+)
+"""
+
+"""
+NormalAt(u, v)
+Computes the surface normal at a point. This is the simple evaluation call - it does not support error handling.
+
+Parameters:	
+u (float) – A U parameter.
+v (float) – A V parameter.
+Returns:	
+The normal.
+
+Return type:	
+rhino3dm.Vector3d
+"""
+@hops.component(
+    "/srfNorAt",
+    name="NormalAt",
+    nickname="SrfNorAt",
+    description="Surface normal at",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("U", "U", "U"),
+        hs.HopsNumber("V", "V", "V"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"), 
+        hs.HopsVector("Normal", "N", "Normal"),
+        ]
+)
+def srf_nor_at(surface: rhino3dm.Surface, u, v):
+    success, normal = surface.NormalAt(u, v)
+    return success, normal
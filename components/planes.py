@@ -0,0 +1,250 @@
+"""Plane components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import numpy as np
+import rhino3dm
+
+import hopskit
+
+from components import hops
+
+
+"""
+██████╗ ██╗      █████╗ ███╗   ██╗███████╗███████╗
+██╔══██╗██║     ██╔══██╗████╗  ██║██╔════╝██╔════╝
+██████╔╝██║     ███████║██╔██╗ ██║█████╗  ███████╗
+██╔═══╝ ██║     ██╔══██║██║╚██╗██║██╔══╝  ╚════██║
+██║     ███████╗██║  ██║██║ ╚████║███████╗███████║
+╚═╝     ╚══════╝╚═╝  ╚═╝╚═╝  ╚═══╝╚══════╝╚══════╝
+"""
+
+"""
+Plane()
+Plane constructor
+
+Plane(origin, normal)
+Constructs a plane from a point and a normal vector.
+
+Parameters:	
+origin (rhino3dm.Point3d) – Origin point of the plane.
+normal (rhino3dm.Vector3d) – Non-zero normal to the plane.
+"""
+@hops.component(
+    "/plane4",
+    name="Plane",
+    nickname="Plane",
+    description="Plane",
+    inputs=[
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("Normal", "N", "Normal"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("Normal", "N", "Normal"),
+        ]
+)
+def plane4(origin, normal):
+    return True, origin, normal
+
+"""
+plane from equation Ax+By+Cz+D=0
+Plane()
+Constructs a plane from an equation Ax+By+Cz+D=0.
+"""
+
+
+@hops.component(
+    "/planeFromEquation2",
+    name="Plane",
+    nickname="Plane",
+    description="Plane",
+    inputs=[    
+        hs.HopsNumber("A", "A", "A"),
+        hs.HopsNumber("x", "x", "x"),
+        hs.HopsNumber("B", "B", "B"),
+        hs.HopsNumber("y", "y", "y"),
+        hs.HopsNumber("C", "C", "C"),
+        hs.HopsNumber("z", "z", "z"),
+        hs.HopsNumber("D", "D", "D"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        # Constructs a plane from an equation Ax+By+Cz+D=0
+        hs.HopsPoint("origin", "O", "Origin"),
+        hs.HopsVector("normal", "N", "Normal"),
+
+        ]
+)
+def planeFromEquation2(a, x, b, y, c, z, d):
+    # (A, B, C) is the normal, D only moves the plane
+    normal = rhino3dm.Vector3d(float(a), float(b), float(c))
+    success = normal.Length() > 0.0
+    origin = rhino3dm.Point3d(float(x), float(y), float(z))
+    return success, origin, normal
+
+
+def _longest(*lists):
+    # longest list matching, shorter lists repeat their last item
+    count = max(map(len, lists)) if all(lists) else 0
+    return [[items[min(i, len(items) - 1)] for i in range(count)] for items in lists]
+
+
+"""
+planes from equations
+Many planes Ax+By+Cz+D=0 at once, one per item of the A, B, C and D
+lists. Normals are unit length, origins are the plane points closest
+to the world origin. A zero normal fails.
+"""
+@hops.component(
+    "/planesFromEquations",
+    name="Planes From Equations",
+    nickname="Planes",
+    description="Planes from lists of equation coefficients",
+    inputs=[
+        hs.HopsNumber("A", "A", "A", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("B", "B", "B", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("C", "C", "C", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("D", "D", "D", hs.HopsParamAccess.LIST),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success", hs.HopsParamAccess.LIST),
+        hopskit.HopsPointArray("Origin", "O", "Origin"),
+        hopskit.HopsVectorArray("Normal", "N", "Unit normal"),
+        ]
+)
+def planes_from_equations(a, b, c, d):
+    planes = hopskit.PlaneSet.from_equations(np.column_stack(_longest(a, b, c, d)))
+    origins = np.where(planes.valid[:, None], planes.origins, 0.0)
+    normals = np.where(planes.valid[:, None], planes.normals, 0.0)
+    return planes.valid.tolist(), origins, normals
+
+"""
+plane classify points
+Signed distance of every point to every plane, and the side it lies
+on: 1 above (along the normal), -1 below, 0 within Tolerance. Branch
+{i} holds the values of plane i.
+"""
+@hops.component(
+    "/planeClassifyPoints",
+    name="Classify Points",
+    nickname="PlaneSide",
+    description="Signed distances and sides of points for many planes",
+    inputs=[
+        hs.HopsPoint("Points", "P", "Points to classify", hs.HopsParamAccess.LIST),
+        hs.HopsPoint("Origin", "O", "Plane origins", hs.HopsParamAccess.LIST),
+        hs.HopsVector("Normal", "N", "Plane normals", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("Tolerance", "T", "Distance that counts as on the plane"),
+    ],
+    outputs=[
+        hopskit.HopsNumberArray("Distance", "D", "Signed distances", hs.HopsParamAccess.TREE),
+        hopskit.HopsIntegerArray("Side", "S", "Sides", hs.HopsParamAccess.TREE),
+        ],
+    # point lists are large and change with every edit
+    cache=False
+)
+def plane_classify_points(points, origins, normals, tolerance):
+    planes = _plane_set(origins, normals)
+    distances, sides = planes.classify([(p.X, p.Y, p.Z) for p in points], tolerance)
+    branches = [f"{{{i}}}" for i in range(len(planes))]
+    return (
+        {path: distances[:, i] for i, path in enumerate(branches)},
+        {path: sides[:, i] for i, path in enumerate(branches)},
+    )
+
+
+def _plane_set(origins, normals):
+    origins, normals = _longest(origins, normals)
+    return hopskit.PlaneSet.from_origins_normals(
+        [(p.X, p.Y, p.Z) for p in origins], [(v.X, v.Y, v.Z) for v in normals]
+    )
+
+"""
+plane side counts
+How many points lie below, on and above each plane, without keeping
+the distances around, for point clouds too large to classify point by
+point.
+"""
+@hops.component(
+    "/planeSideCounts",
+    name="Side Counts",
+    nickname="PlaneCount",
+    description="Counts of points below, on and above many planes",
+    inputs=[
+        hs.HopsPoint("Points", "P", "Points to count", hs.HopsParamAccess.LIST),
+        hs.HopsPoint("Origin", "O", "Plane origins", hs.HopsParamAccess.LIST),
+        hs.HopsVector("Normal", "N", "Plane normals", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("Tolerance", "T", "Distance that counts as on the plane"),
+    ],
+    outputs=[
+        hs.HopsInteger("Below", "B", "Points below", hs.HopsParamAccess.LIST),
+        hs.HopsInteger("On", "O", "Points on", hs.HopsParamAccess.LIST),
+        hs.HopsInteger("Above", "A", "Points above", hs.HopsParamAccess.LIST),
+        ]
+)
+def plane_side_counts(points, origins, normals, tolerance):
+    planes = _plane_set(origins, normals)
+    counts = planes.side_counts([(p.X, p.Y, p.Z) for p in points], tolerance)
+    return counts[:, 0].tolist(), counts[:, 1].tolist(), counts[:, 2].tolist()
+    
+#plane from origin and 2 vectors
+"""
+Plane()
+Constructs a plane from an origin point and two vectors.
+"""
+
+"""
+@hops.component(
+    "/planeFromOriginAnd2Vectors",
+    name="Plane",
+    nickname="Plane",
+    description="Plane",
+    inputs=[
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("X", "X", "X"),
+        hs.HopsVector("Y", "Y", "Y"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("Normal", "N", "Normal"),
+        ]
+)
+"""
+
+"""
+create plane surface
+PlaneSurface()
+PlaneSurface constructor
+
+PlaneSurface()
+PlaneSurface constructor
+"""
+
+# create plane surface
+@hops.component(
+    "/planeSurface17",
+    name="PlaneSurface",
+    nickname="PlaneSurface",
+    description="PlaneSurface",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface"),
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("Normal", "N", "Normal"),
+        hs.HopsNumber("uMin", "uMin", "uMin"),
+        hs.HopsNumber("uMax", "uMax", "uMax"),
+        hs.HopsNumber("vMin", "vMin", "vMin"),
+        hs.HopsNumber("vMax", "vMax", "vMax"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsSurface("Surface", "S", "Surface"),
+        ]
+)
+def planeSurface17(surface, origin, normal, uMin, uMax, vMin, vMax):
+    success = True
+    plane = rhino3dm.Plane(origin, normal)
+    planeSurface = rhino3dm.PlaneSurface(plane, uMin, uMax, vMin, vMax)
+    return success, planeSurface
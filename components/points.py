@@ -0,0 +1,56 @@
+"""Point components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+
+import hopskit
+
+from components import hops
+
+
+"""
+██████╗  ██████╗ ██╗███╗   ██╗████████╗     ██████╗ ██████╗ ██╗██████╗ 
+██╔══██╗██╔═══██╗██║████╗  ██║╚══██╔══╝    ██╔════╝ ██╔══██╗██║██╔══██╗
+██████╔╝██║   ██║██║██╔██╗ ██║   ██║       ██║  ███╗██████╔╝██║██║  ██║
+██╔═══╝ ██║   ██║██║██║╚██╗██║   ██║       ██║   ██║██╔══██╗██║██║  ██║
+██║     ╚██████╔╝██║██║ ╚████║   ██║       ╚██████╔╝██║  ██║██║██████╔╝
+╚═╝      ╚═════╝ ╚═╝╚═╝  ╚═══╝   ╚═╝        ╚═════╝ ╚═╝  ╚═╝╚═╝╚═════╝ 
+"""
+
+"""
+PointGrid
+classrhino3dm.PointGrid
+PointGrid()
+PointGrid constructor
+"""
+
+"""
+point grid
+rhino3dm.PointGrid is not a point list, so the grid is built
+with numpy: point (i, j) = Origin + i * X + j * Y, U major.
+Large grids are generated and serialized in chunks.
+"""
+@hops.component(
+    "/pointGrid8",
+    name="PointGrid",
+    nickname="PointGrid",
+    description="PointGrid",
+    inputs=[
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("X", "X", "X"),
+        hs.HopsVector("Y", "Y", "Y"),
+        hs.HopsInteger("Ucount", "Ucount", "Ucount"),
+        hs.HopsInteger("Vcount", "Vcount", "Vcount"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hopskit.HopsPointArray("Point", "P", "Point"),
+        ],
+    stream=True
+)
+def pointGrid8(origin, x, y, ucount, vcount):
+    success = ucount > 0 and vcount > 0
+    ucount, vcount = max(ucount, 0), max(vcount, 0)
+    # sent while it is generated, 64k points at a time
+    return success, hopskit.iter_point_grid(origin, x, y, ucount, vcount)
@@ -0,0 +1,367 @@
+"""Surface components
+
+Imported on first use, see components/__init__.py
+"""
+import os
+
+import ghhops_server as hs
+import numpy as np
+import rhino3dm
+
+import hopskit
+
+from components import hops, meshes
+
+
+"""
+███████╗██╗   ██╗██████╗ ███████╗ █████╗  ██████╗███████╗███████╗
+██╔════╝██║   ██║██╔══██╗██╔════╝██╔══██╗██╔════╝██╔════╝██╔════╝
+███████╗██║   ██║██████╔╝█████╗  ███████║██║     █████╗  ███████╗
+╚════██║██║   ██║██╔══██╗██╔══╝  ██╔══██║██║     ██╔══╝  ╚════██║
+███████║╚██████╔╝██║  ██║██║     ██║  ██║╚██████╗███████╗███████║
+╚══════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝     ╚═╝  ╚═╝ ╚═════╝╚══════╝╚══════╝                                                                                                               
+"""
+
+"""
+surface is solid
+IsSolid
+bool: Gets a values indicating whether a surface is solid.
+"""
+@hops.component(
+    "/srfIsSolid",
+    name="Is Solid",
+    nickname="SrfIsSolid",
+    description="Surface is solid",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate")
+    ],
+    outputs=[hs.HopsBoolean("IsSolid", "S", "Is solid")]
+)
+def srf_is_solid(surface: rhino3dm.Surface):
+    return surface.IsSolid
+
+"""
+surface set domain
+SetDomain(direction, domain)
+Sets the domain in a direction.
+
+Parameters:	
+direction (int) – 0 sets first parameter’s domain, 1 sets second parameter’s domain.
+domain (rhino3dm.Interval) – A new domain to be assigned.
+Returns:	
+True if setting succeeded, otherwise false.
+
+Return type:	
+bool
+"""
+
+"""
+@hops.component(
+    "/srfSetDomain",
+    name="Set Domain",
+    nickname="SrfSetDomain",
+    description="Surface set domain",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("Direction", "D", "Direction"),
+        # this is going to need an interval and no hs.HopsInterval exists currently
+        # need to create and interval component for this to work
+        # put on hold until I can figure out how to do this
+        hs.HopsInterval("Domain", "D", "Domain")
+    ],
+    outputs=[hs.HopsBoolean("Success", "S", "Success")]
+)
+def srf_set_domain(surface: rhino3dm.Surface, direction, domain):
+    return surface.SetDomain(direction, domain)
+"""
+
+"""
+surface degree(direction)
+Degree(direction)
+Returns the maximum algebraic degree of any span 
+(or a good estimate if curve spans are not algebraic).
+
+Parameters:	direction (int) – 
+0 gets first parameter’s domain, 
+1 gets second parameter’s domain.
+Returns:	The maximum degree.
+Return type:	int
+"""
+@hops.component(
+    "/srfDeg",
+    name="Degree",
+    nickname="SrfDegree",
+    description="Surface degree",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsInteger("Direction", "D", "Direction")
+    ],
+    outputs=[hs.HopsNumber("Degree", "D", "Degree")],
+    batch=lambda surfaces, directions: [s.Degree(d) for s, d in zip(surfaces, directions)]
+)
+def srf_deg(surface: rhino3dm.Surface, direction):
+    return surface.Degree(direction)
+
+"""
+surface span count (direction)
+SpanCount(direction)
+Gets number of smooth nonempty spans in the parameter direction.
+
+Parameters:	direction (int) – 
+0 gets first parameter’s domain, 
+1 gets second parameter’s domain.
+Returns:	The span count.
+Return type:	int
+"""
+@hops.component(
+    "/srfSpanCount",
+    name="Span Count",
+    nickname="SrfSpanCount",
+    description="Surface span count",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsInteger("Direction", "D", "Direction")
+    ],
+    outputs=[hs.HopsNumber("SpanCount", "S", "Span count")],
+    batch=lambda surfaces, directions: [s.SpanCount(d) for s, d in zip(surfaces, directions)]
+)
+def srf_span_count(surface: rhino3dm.Surface, direction):
+    return surface.SpanCount(direction)
+
+"""
+surface pointAt(u, v)
+PointAt(u, v)
+Evaluates a point at a given parameter.
+
+Parameters:	
+u (float) – evaluation parameters.
+v (float) – evaluation parameters.
+Returns:	
+Point3d.Unset on failure.
+
+Return type:	
+rhino3dm.Point3d
+"""
+@hops.component(
+    "/srfPointAt",
+    name="Point At",
+    nickname="SrfPointAt",
+    description="Surface point at",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("U", "U", "U"),
+        hs.HopsNumber("V", "V", "V")
+    ],
+    outputs=[hs.HopsPoint("Point", "P", "Point")]
+)
+def srf_point_at(surface: rhino3dm.Surface, u, v):
+    return surface.PointAt(u, v)
+
+"""
+surface frame(u, v)
+FrameAt(u, v)
+Computes the orient plane on a surface given a U and V parameter. 
+This is the simple evaluation call with no error handling.
+
+Parameters:	
+u (float) – A first parameter.
+v (float) – A second parameter.
+Returns:	
+tuple (bool, rhino3dm.Plane) 
+BUT WE MUST RETURN AN ORIGIN AND THREE VECTORS INSTEAD FOR NOW
+
+True if this operation succeeded; otherwise false.
+A frame plane that will be computed during this call.
+Return type:	
+(bool, rhino3dm.Plane)
+"""
+
+
+@hops.component(
+    "/srfFrame11",
+    name="Frame",
+    nickname="SrfFrame",
+    description="Surface frame",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("U", "U", "U"),
+        hs.HopsNumber("V", "V", "V"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"), 
+        hs.HopsPoint("Origin", "O", "Origin"),
+        hs.HopsVector("X", "X", "X"),
+        hs.HopsVector("Y", "Y", "Y"),
+        hs.HopsVector("Z", "Z", "Z")
+    ]
+)
+def srf_frame11(surface: rhino3dm.Surface, u, v):
+    success, frame = surface.FrameAt(u, v)
+    # origin and vectors are not returned by the frameAt function
+    # we need to manually compute them
+    origin = surface.PointAt(u, v)
+    x = frame.XAxis
+    y = frame.YAxis
+    z = frame.ZAxis
+    return success, origin, x, y, z
+
+"""
+surface sample grid
+Same as PointAt, NormalAt and FrameAt over a whole U x V grid,
+evaluated in one pass by hopskit.nurbs instead of one call per point.
+Outputs use the /srfFrame11 layout as packed lists, U major
+(index = i * len(V) + j). Origin holds the points and Z the unit
+normals, the same vectors /srfNorAt returns.
+"""
+def _sample_surface(surface, u, v):
+    evaluator = hopskit.SurfaceEvaluator(surface)
+    if u is None:
+        u, v = evaluator.grid_params(*v)
+    d = evaluator.grid(u, v)
+    success, x, y, z = hopskit.frames(d["Su"], d["Sv"])
+    flat = lambda a: a.reshape(-1, 3)
+    return success.ravel().tolist(), flat(d["S"]), flat(x), flat(y), flat(z)
+
+
+_SAMPLE_OUTPUTS = [
+    hs.HopsBoolean("Success", "S", "Success", hs.HopsParamAccess.LIST),
+    hopskit.HopsPointArray("Origin", "O", "Origin"),
+    hopskit.HopsVectorArray("X", "X", "X"),
+    hopskit.HopsVectorArray("Y", "Y", "Y"),
+    hopskit.HopsVectorArray("Z", "Z", "Z")
+]
+
+
+@hops.component(
+    "/srfSampleGrid",
+    name="Sample Grid",
+    nickname="SrfSampleGrid",
+    description="Surface points and frames on an evenly spaced U x V grid",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsInteger("U Count", "U", "Number of samples in U", default=10),
+        hs.HopsInteger("V Count", "V", "Number of samples in V", default=10),
+    ],
+    outputs=_SAMPLE_OUTPUTS,
+    cache=False
+)
+def srf_sample_grid(surface: rhino3dm.Surface, u_count, v_count):
+    return _sample_surface(surface, None, (max(u_count, 1), max(v_count, 1)))
+
+
+@hops.component(
+    "/srfSampleUV",
+    name="Sample UV",
+    nickname="SrfSampleUV",
+    description="Surface points and frames on the grid of U and V parameters",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to evaluate"),
+        hs.HopsNumber("U", "U", "U parameters", hs.HopsParamAccess.LIST),
+        hs.HopsNumber("V", "V", "V parameters", hs.HopsParamAccess.LIST),
+    ],
+    outputs=_SAMPLE_OUTPUTS,
+    cache=False
+)
+def srf_sample_uv(surface: rhino3dm.Surface, u, v):
+    return _sample_surface(surface, u, v)
+
+"""
+surface curvature grid
+Points, unit normals and Gaussian and mean curvature on an evenly
+spaced U x V grid, U major like /srfSampleGrid, for curvature heat
+maps. The grid is evaluated in blocks of rows on up to Threads
+threads. Min and max skip the points where the surface is singular.
+"""
+@hops.component(
+    "/srfCurvatureGrid",
+    name="Curvature Grid",
+    nickname="SrfCurvature",
+    description="Surface normals and Gaussian and mean curvature on a U x V grid",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to analyze"),
+        hs.HopsInteger("U Count", "U", "Number of samples in U", default=10),
+        hs.HopsInteger("V Count", "V", "Number of samples in V", default=10),
+        hs.HopsInteger("Threads", "T", "Threads to evaluate on", default=1),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success", hs.HopsParamAccess.LIST),
+        hopskit.HopsPointArray("Points", "P", "Points"),
+        hopskit.HopsVectorArray("Normals", "N", "Unit normals"),
+        hopskit.HopsNumberArray("Gaussian", "K", "Gaussian curvature"),
+        hopskit.HopsNumberArray("Mean", "H", "Mean curvature"),
+        hs.HopsNumber("Gaussian Min", "Kmin", "Smallest Gaussian curvature"),
+        hs.HopsNumber("Gaussian Max", "Kmax", "Largest Gaussian curvature"),
+        hs.HopsNumber("Mean Min", "Hmin", "Smallest mean curvature"),
+        hs.HopsNumber("Mean Max", "Hmax", "Largest mean curvature"),
+    ],
+    cache=False
+)
+def srf_curvature_grid(surface: rhino3dm.Surface, u_count, v_count, threads):
+    evaluator = hopskit.SurfaceEvaluator(surface)
+    u, v = evaluator.grid_params(max(u_count, 1), max(v_count, 1))
+    workers = min(max(threads, 1), os.cpu_count() or 1)
+    success, points, normals, gaussian, mean = hopskit.curvature_grid(evaluator, u, v, workers)
+    k, h = gaussian[success], mean[success]
+    bounds = [float(f(a)) if a.size else 0.0 for a in (k, h) for f in (np.min, np.max)]
+    return (success.tolist(), points, normals, gaussian, mean, *bounds)
+
+"""
+surface mesh
+Server side tessellation as an indexed quad mesh: Density segments
+per knot span (one along degree 1 directions), shared vertices, and
+Faces as four vertex indices per face, triangles repeat their third
+index. Meshes are cached per geometry and density, see
+hopskit.meshing. /brepMesh meshes every face of a brep; trims are
+not applied unless the brep carries render meshes.
+"""
+_MESH_OUTPUTS = [
+    hs.HopsMesh("Mesh", "M", "Mesh"),
+    hopskit.HopsPointArray("Vertices", "V", "Vertices"),
+    hopskit.HopsIntegerArray("Faces", "F", "Four vertex indices per face"),
+    hopskit.HopsVectorArray("Normals", "N", "Vertex normals")
+]
+
+
+def _mesh_outputs(geometry, density):
+    mesh = meshes.mesh(geometry, max(density, 1))
+    return mesh.to_rhino(), mesh.vertices, mesh.faces, mesh.normals
+
+
+@hops.component(
+    "/srfMesh",
+    name="Mesh Surface",
+    nickname="SrfMesh",
+    description="Indexed mesh of a surface",
+    inputs=[
+        hs.HopsSurface("Surface", "S", "Surface to mesh"),
+        hs.HopsInteger("Density", "D", "Segments per knot span", default=4),
+    ],
+    outputs=_MESH_OUTPUTS
+)
+def srf_mesh(surface: rhino3dm.Surface, density):
+    return _mesh_outputs(surface, density)
+
+
+@hops.component(
+    "/brepMesh",
+    name="Mesh Brep",
+    nickname="BrepMesh",
+    description="Indexed mesh of every face of a brep",
+    inputs=[
+        hs.HopsBrep("Brep", "B", "Brep to mesh"),
+        hs.HopsInteger("Density", "D", "Segments per knot span", default=4),
+    ],
+    outputs=_MESH_OUTPUTS
+)
+def brep_mesh(brep: rhino3dm.Brep, density):
+    return _mesh_outputs(brep, density)
+
+"""
+surface domain(direction)
+Domain(direction)
+Gets the domain in a direction.
+
+Parameters:	direction (int) – 0 gets first parameter, 1 gets second parameter.
+Returns:	An interval value.
+Return type:	rhino3dm.Interval
+"""
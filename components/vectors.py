@@ -0,0 +1,91 @@
+"""Vector components
+
+Imported on first use, see components/__init__.py
+"""
+import ghhops_server as hs
+import rhino3dm
+
+from components import hops
+
+
+"""
+██╗   ██╗███████╗ ██████╗████████╗ ██████╗ ██████╗ ███████╗
+██║   ██║██╔════╝██╔════╝╚══██╔══╝██╔═══██╗██╔══██╗██╔════╝
+██║   ██║█████╗  ██║        ██║   ██║   ██║██████╔╝███████╗
+╚██╗ ██╔╝██╔══╝  ██║        ██║   ██║   ██║██╔══██╗╚════██║
+ ╚████╔╝ ███████╗╚██████╗   ██║   ╚██████╔╝██║  ██║███████║
+  ╚═══╝  ╚══════╝ ╚═════╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚══════╝
+"""
+"""
+classrhino3dm.Vector2d
+Vector2d(x, y)
+Initializes a new instance of the vector based on two, X and Y, components.
+
+Parameters:	
+x (float) – The X (first) component.
+y (float) – The Y (second) component.
+X
+float: Gets or sets the X (first) component of this vector.
+
+Y
+float: Gets or sets the Y (second) component of this vector.
+"""
+    
+# create vector 2d
+@hops.component(
+    "/vector2dim",
+    name="Vector2d",
+    nickname="Vector2d",
+    description="Vector2d",
+    inputs=[
+        hs.HopsNumber("X", "X", "X"),
+        hs.HopsNumber("Y", "Y", "Y"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsVector("Vector2d", "V", "Vector2d"),
+        ]
+)
+def vector2dim(x: float, y: float):
+    success = True
+    vector2d = rhino3dm.Vector3d(x, y, 0)
+    return success, vector2d
+
+"""
+classrhino3dm.Vector3d
+Vector3d(x, y, z)
+Initializes a new instance of a vector, using its three components.
+
+Parameters:	
+x (float) – The X (first) component.
+y (float) – The Y (second) component.
+z (float) – The Z (third) component.
+X
+float: Gets or sets the X (first) component of the vector.
+
+Y
+float: Gets or sets the Y (second) component of the vector.
+
+Z
+float: Gets or sets the Z (third) component of the vector.
+"""
+# create vector 3d
+@hops.component(
+    "/vector3dim",
+    name="Vector3d",
+    nickname="Vector3d",
+    description="Vector3d",
+    inputs=[
+        hs.HopsNumber("X", "X", "X"),
+        hs.HopsNumber("Y", "Y", "Y"),
+        hs.HopsNumber("Z", "Z", "Z"),
+    ],
+    outputs=[
+        hs.HopsBoolean("Success", "S", "Success"),
+        hs.HopsVector("Vector3d", "V", "Vector3d"),
+        ]
+)
+def vector3dim(x: float, y: float, z: float):
+    success = True
+    vector3d = rhino3dm.Vector3d(x, y, z)
+    return success, vector3d
@@ -0,0 +1,24 @@
+"""Helpers shared by the Hops example apps"""
+# flake8: noqa
+from hopskit.arrays import HopsPointArray, HopsVectorArray, HopsNumberArray, HopsIntegerArray
+from hopskit.curves import CurveSamples, CurveEvaluatorCache, evaluate_curve, evaluate_curves
+from hopskit.curves import CURVE_KINDS, CurveClass, classify_curve
+from hopskit.cache import LRUCache, SolveCache, payload_digest
+from hopskit.store import SolveStore, component_version
+from hopskit.singleflight import SingleFlight
+from hopskit.geometry import GeometryCache, geometry_digest
+from hopskit.serve import serve_prefork
+from hopskit.trees import TreeSolver
+from hopskit.streaming import Streaming, StreamedOutputs
+from hopskit.metrics import Metrics
+from hopskit.compression import Compression
+from hopskit.http import HopsWSGI, respond, serve_http
+from hopskit.aio import AsyncHopsServer, serve_async
+from hopskit.nurbs import CurveEvaluator, SurfaceEvaluator, frames, curvatures, curvature_grid
+from hopskit.planes import PlaneSet
+from hopskit.grids import point_grid, iter_point_grid
+from hopskit.tessellation import CurveTessellation, TessellationCache
+from hopskit.meshing import IndexedMesh, MeshCache, mesh_geometry
+from hopskit.closest import CurveBVH, CurveIndexCache
+from hopskit.lazy import LazyComponent, LazyComponents
+from hopskit.rhinopool import RhinoPool
@@ -0,0 +1,151 @@
+"""asyncio server for the default hops app
+
+serve_async() accepts any number of keep-alive connections on one
+event loop and hands each solve to an executor, so a slow component
+only holds up its own client. Use a thread pool for components that
+release the GIL (rhino3dm, numpy) or a process pool for pure Python
+ones. Requests go through hopskit.http.respond(), so the binary format
+and compression work here too.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from ghhops_server.logger import logging, hlogger
+
+from hopskit.compression import Compression
+from hopskit.http import respond
+
+
+MAX_HEADER_BYTES = 64 * 1024
+
+# hops app used by process pool workers, inherited through fork
+_HOPS = None
+
+
+def _respond_in_worker(method, path, headers, body, compression):
+    status, response_headers, data = respond(_HOPS, method, path, headers, body, compression=compression)
+    # generators don't pickle, send streamed responses back whole
+    if not isinstance(data, bytes):
+        data = b"".join(data)
+    return status, response_headers, data
+
+
+def make_executor(kind="thread", workers=None):
+    """Thread or process pool for solves"""
+    workers = workers or os.cpu_count() or 1
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hops-solve")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+    raise ValueError(f"Unknown executor {kind!r}, use 'thread' or 'process'")
+
+
+class AsyncHopsServer:
+    """HTTP/1.1 keep-alive server answering hops requests"""
+
+    def __init__(self, hops, executor=None, keep_alive=75.0, max_body=1024 * 2**20, compression=None):
+        global _HOPS
+        _HOPS = hops
+        self.hops = hops
+        self.executor = executor or make_executor()
+        self.keep_alive = keep_alive
+        self.max_body = max_body
+        self.compression = compression
+
+    def _solve(self, method, path, headers, body):
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return loop.run_in_executor(
+                self.executor, _respond_in_worker, method, path, headers, body, self.compression
+            )
+        return loop.run_in_executor(
+            self.executor, respond, self.hops, method, path, headers, body, 500, self.compression
+        )
+
+    async def _read_request(self, reader):
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keep_alive)
+        if len(head) > MAX_HEADER_BYTES:
+            raise ValueError("Request header too large")
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().title()] = value.strip()
+        length = int(headers.get("Content-Length") or 0)
+        if length > self.max_body:
+            raise ValueError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, target, version, headers, body
+
+    async def _write(self, writer, status, headers, body, keep_alive, head_only=False):
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines += [f"{name}: {value}" for name, value in headers]
+        streamed = not isinstance(body, bytes)
+        lines.append("Transfer-Encoding: chunked" if streamed else f"Content-Length: {len(body)}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if streamed:
+            await self._write_chunks(writer, iter(body))
+        elif not head_only:
+            writer.write(body)
+        await writer.drain()
+
+    async def _write_chunks(self, writer, chunks):
+        # chunks are encoded on the executor, the loop only sends them
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(self.executor, next, chunks, None)
+            if chunk is None:
+                break
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    method, target, version, headers, body = await self._read_request(reader)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except (ValueError, asyncio.LimitOverrunError) as ex:
+                    await self._write(writer, 400, [("Content-Type", "text/plain")], str(ex).encode(), False)
+                    break
+
+                connection = headers.get("Connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                status, response_headers, data = await self._solve(method, target, headers, body)
+                hlogger.info('%s "%s %s" %s', writer.get_extra_info("peername"), method, target, status)
+                await self._write(writer, status, response_headers, data, keep_alive, method == "HEAD")
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def serve(self, address="localhost", port=5000):
+        server = await asyncio.start_server(self.handle, address, port, limit=MAX_HEADER_BYTES)
+        hlogger.info("Starting async hops server on %s:%s", address, port)
+        async with server:
+            await server.serve_forever()
+
+
+def serve_async(hops, address="localhost", port=5000, executor="thread", workers=None, debug=False, compression=None):
+    """Run hops on the asyncio server until interrupted
+
+    Compression works as in serve_http().
+    """
+    hlogger.setLevel(logging.DEBUG if debug else logging.INFO)
+    if compression is None:
+        compression = Compression()
+    server = AsyncHopsServer(hops, make_executor(executor, workers), compression=compression or None)
+    try:
+        asyncio.run(server.serve(address, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown(wait=False, cancel_futures=True)
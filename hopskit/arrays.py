@@ -0,0 +1,97 @@
+"""Hops output params that accept packed NumPy arrays
+
+The stock params serialize one rhino3dm object at a time through
+json.dumps. These subclasses take a (N, 3) or (N,) array instead and
+write the Grasshopper value items straight from the packed data.
+
+A generator of arrays is accepted too. Its chunks are converted one at
+a time, so only one chunk is held as an array or float list, but the
+value items of every chunk still end up in one list for the response.
+Components registered with stream=True are written a chunk at a time
+instead, see hopskit.streaming. A dict of branch path to array gives a
+data tree.
+"""
+import types
+
+import numpy as np
+import ghhops_server as hs
+
+
+def _xyz_items(result_type, values):
+    values = np.asarray(values, dtype=float).reshape(-1, 3)
+    return [
+        {"type": result_type, "data": f'{{"X": {x!r}, "Y": {y!r}, "Z": {z!r}}}'}
+        for x, y, z in values.tolist()
+    ]
+
+
+class _PackedParam:
+    """Mixin that serializes packed arrays for output"""
+
+    def _items(self, values):
+        raise NotImplementedError
+
+    def from_result(self, value):
+        if isinstance(value, dict) and all(isinstance(v, np.ndarray) for v in value.values()):
+            return {
+                "ParamName": self.name,
+                "InnerTree": {path: self._items(branch) for path, branch in value.items()},
+            }
+        if isinstance(value, types.GeneratorType):
+            items = []
+            for chunk in value:
+                items.extend(self._items(chunk))
+        elif isinstance(value, np.ndarray):
+            items = self._items(value)
+        else:
+            return super().from_result(value)
+        return {
+            "ParamName": self.name,
+            "InnerTree": {"0": items},
+        }
+
+
+class HopsPointArray(_PackedParam, hs.HopsPoint):
+    """Point list output from a (N, 3) array"""
+
+    def __init__(self, name, nickname=None, desc=None, access=hs.HopsParamAccess.LIST, **kwargs):
+        super().__init__(name, nickname, desc, access, **kwargs)
+
+    def _items(self, values):
+        return _xyz_items(self.result_type, values)
+
+
+class HopsVectorArray(_PackedParam, hs.HopsVector):
+    """Vector list output from a (N, 3) array"""
+
+    def __init__(self, name, nickname=None, desc=None, access=hs.HopsParamAccess.LIST, **kwargs):
+        super().__init__(name, nickname, desc, access, **kwargs)
+
+    def _items(self, values):
+        return _xyz_items(self.result_type, values)
+
+
+class HopsNumberArray(_PackedParam, hs.HopsNumber):
+    """Number list output from a (N,) array"""
+
+    def __init__(self, name, nickname=None, desc=None, access=hs.HopsParamAccess.LIST, **kwargs):
+        super().__init__(name, nickname, desc, access, **kwargs)
+
+    def _items(self, values):
+        return [
+            {"type": self.result_type, "data": repr(v)}
+            for v in np.asarray(values, dtype=float).ravel().tolist()
+        ]
+
+
+class HopsIntegerArray(_PackedParam, hs.HopsInteger):
+    """Integer list output from a (N,) array"""
+
+    def __init__(self, name, nickname=None, desc=None, access=hs.HopsParamAccess.LIST, **kwargs):
+        super().__init__(name, nickname, desc, access, **kwargs)
+
+    def _items(self, values):
+        return [
+            {"type": self.result_type, "data": str(v)}
+            for v in np.asarray(values).astype(np.int64).ravel().tolist()
+        ]
@@ -0,0 +1,210 @@
+"""Binary wire format for Hops payloads
+
+Hops payloads are JSON, and each geometry item carries opennurbs data
+as base64 inside a JSON string. This codec stores the same
+{"values": [...]} structure in length-prefixed frames instead:
+
+    payload := b"HOPB" u8:version u32:param_count param*
+    param   := str:name str:extra_json u32:branch_count branch*
+    branch  := str:path u8:kind u32:item_count items
+
+Branches where every item is a number, integer, boolean, point or
+vector are packed as one little-endian array (kind 1-5). Any other
+branch (kind 0) holds its items one by one as a type name, the JSON
+envelope without its data, and the raw opennurbs bytes (or the plain
+data text for non geometry items). `str` is u32 length + utf-8.
+
+Everything else in the JSON object (pointer, errors, warnings, ...) is
+kept as JSON in a trailing str.
+"""
+import base64
+import json
+import struct
+
+import numpy as np
+
+
+CONTENT_TYPE = "application/x-hops-binary"
+MAGIC = b"HOPB"
+VERSION = 1
+
+_ITEMS, _DOUBLES, _INTS, _BOOLS, _POINTS, _VECTORS = range(6)
+
+_PACKED = {
+    "System.Double": _DOUBLES,
+    "System.Int32": _INTS,
+    "System.Boolean": _BOOLS,
+    "Rhino.Geometry.Point3d": _POINTS,
+    "Rhino.Geometry.Vector3d": _VECTORS,
+}
+_PACKED_TYPES = {kind: name for name, kind in _PACKED.items()}
+
+_U32 = struct.Struct("<I")
+
+
+class _Writer:
+    def __init__(self):
+        self.parts = []
+
+    def u8(self, value):
+        self.parts.append(bytes((value,)))
+
+    def u32(self, value):
+        self.parts.append(_U32.pack(value))
+
+    def raw(self, data):
+        self.u32(len(data))
+        self.parts.append(data)
+
+    def str(self, text):
+        self.raw(text.encode("utf-8"))
+
+    def bytes(self):
+        return b"".join(self.parts)
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def take(self, size):
+        if self.pos + size > len(self.data):
+            raise ValueError("Truncated hops binary payload")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def u8(self):
+        return self.take(1)[0]
+
+    def u32(self):
+        return _U32.unpack(self.take(4))[0]
+
+    def raw(self):
+        return self.take(self.u32())
+
+    def str(self):
+        return bytes(self.raw()).decode("utf-8")
+
+
+def _branch_kind(items):
+    kinds = {_PACKED.get(item["type"], _ITEMS) for item in items}
+    return kinds.pop() if len(kinds) == 1 else _ITEMS
+
+
+def _pack(kind, items):
+    if kind == _DOUBLES:
+        return np.array([float(i["data"]) for i in items], "<f8").tobytes()
+    if kind == _INTS:
+        return np.array([int(i["data"]) for i in items], "<i4").tobytes()
+    if kind == _BOOLS:
+        return np.array([str(i["data"]).strip().lower() == "true" for i in items], "u1").tobytes()
+    xyz = [json.loads(i["data"]) for i in items]
+    return np.array([(p["X"], p["Y"], p["Z"]) for p in xyz], "<f8").tobytes()
+
+
+def _unpack(kind, data, count):
+    type_name = _PACKED_TYPES[kind]
+    if kind == _DOUBLES:
+        return [{"type": type_name, "data": repr(v)} for v in np.frombuffer(data, "<f8", count).tolist()]
+    if kind == _INTS:
+        return [{"type": type_name, "data": str(v)} for v in np.frombuffer(data, "<i4", count).tolist()]
+    if kind == _BOOLS:
+        return [{"type": type_name, "data": "true" if v else "false"} for v in np.frombuffer(data, "u1", count).tolist()]
+    xyz = np.frombuffer(data, "<f8", count * 3).reshape(count, 3).tolist()
+    return [{"type": type_name, "data": f'{{"X": {x!r}, "Y": {y!r}, "Z": {z!r}}}'} for x, y, z in xyz]
+
+
+def _write_item(w, item):
+    w.str(item["type"])
+    data = item["data"]
+    envelope = None
+    # only geometry carries opennurbs data, strings may hold any JSON text
+    if item["type"].startswith("Rhino.Geometry.") and isinstance(data, str) and '"data"' in data:
+        try:
+            envelope = json.loads(data)
+        except ValueError:
+            envelope = None
+    if isinstance(envelope, dict) and isinstance(envelope.get("data"), str):
+        raw = base64.b64decode(envelope.pop("data"))
+        w.str(json.dumps(envelope))
+        w.raw(raw)
+    else:
+        w.str("")
+        w.str(data if isinstance(data, str) else json.dumps(data))
+
+
+def _read_item(r):
+    item_type = r.str()
+    envelope = r.str()
+    if envelope:
+        data = json.loads(envelope)
+        data["data"] = base64.b64encode(r.raw()).decode("ascii")
+        return {"type": item_type, "data": json.dumps(data)}
+    return {"type": item_type, "data": r.str()}
+
+
+def encode(payload):
+    """Hops JSON payload (str, bytes or dict) to binary"""
+    if not isinstance(payload, dict):
+        payload = json.loads(payload)
+    payload = dict(payload)
+    values = payload.pop("values", [])
+
+    w = _Writer()
+    w.parts.append(MAGIC)
+    w.u8(VERSION)
+    w.u32(len(values))
+    for param in values:
+        param = dict(param)
+        w.str(param.pop("ParamName"))
+        tree = param.pop("InnerTree", {})
+        w.str(json.dumps(param) if param else "")
+        w.u32(len(tree))
+        for path, items in tree.items():
+            w.str(path)
+            kind = _branch_kind(items) if items else _ITEMS
+            w.u8(kind)
+            w.u32(len(items))
+            if kind == _ITEMS:
+                for item in items:
+                    _write_item(w, item)
+            else:
+                w.raw(_pack(kind, items))
+    w.str(json.dumps(payload))
+    return w.bytes()
+
+
+def decode(data):
+    """Binary payload to the Hops JSON structure (a dict)"""
+    r = _Reader(data)
+    if bytes(r.take(4)) != MAGIC:
+        raise ValueError("Not a hops binary payload")
+    version = r.u8()
+    if version != VERSION:
+        raise ValueError(f"Unsupported hops binary version {version}")
+    values = []
+    for _ in range(r.u32()):
+        param = {"ParamName": r.str()}
+        extra = r.str()
+        if extra:
+            param.update(json.loads(extra))
+        tree = {}
+        for _ in range(r.u32()):
+            path = r.str()
+            kind = r.u8()
+            count = r.u32()
+            if kind == _ITEMS:
+                tree[path] = [_read_item(r) for _ in range(count)]
+            else:
+                tree[path] = _unpack(kind, r.raw(), count)
+        param["InnerTree"] = tree
+        values.append(param)
+    payload = json.loads(r.str())
+    payload["values"] = values
+    return payload
+
+
+def is_binary(data):
+    return bytes(data[:4]) == MAGIC
@@ -0,0 +1,160 @@
+"""Solve cache for Hops components
+
+Grasshopper sends the same inputs again every time the canvas
+recomputes. SolveCache keys each solve on a canonical hash of the
+request payload and returns the encoded response it produced last time.
+A hopskit.store.SolveStore can back it on disk, so results survive
+restarts.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from hopskit import options
+from hopskit.store import component_version
+
+
+class LRUCache:
+    """Thread-safe LRU bounded by entry count, total size and age"""
+
+    def __init__(self, max_entries=1024, max_bytes=None, ttl=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._bytes = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, size, expires = entry
+            if expires is not None and expires < time.monotonic():
+                self._drop(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, size=1):
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._items:
+                self._drop(key)
+            self._items[key] = (value, size, expires)
+            self._bytes += size
+            while len(self._items) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._drop(next(iter(self._items)))
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def _drop(self, key):
+        _, size, _ = self._items.pop(key)
+        self._bytes -= size
+
+    def stats(self):
+        """Counters for sizing the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+_last_digest = threading.local()
+
+
+def payload_digest(uri, payload):
+    """Hash of a solve request that ignores key order and whitespace"""
+    # SingleFlight and SolveCache both hash the payload of one request,
+    # remember the last one per thread
+    last = getattr(_last_digest, "value", None)
+    if last is not None and last[0] == uri and last[1] is payload:
+        return last[2]
+    data = json.loads(payload)
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(uri.encode("utf-8"))
+    digest.update(canonical.encode("utf-8"))
+    _last_digest.value = (uri, payload, digest.hexdigest())
+    return _last_digest.value[2]
+
+
+class SolveCache(LRUCache):
+    """Caches encoded solve results of a Hops app
+
+    Components opt in or out with `@hops.component(..., cache=False)`.
+    Components that do not say use `default`. With a `store`, results
+    are also written to disk, and memory misses are looked up there
+    under the payload digest and component version.
+    """
+
+    def __init__(self, hops, max_entries=1024, max_bytes=64 * 2**20, ttl=None, default=True, store=None):
+        super(SolveCache, self).__init__(max_entries, max_bytes, ttl)
+        self.default = default
+        self.store = store
+        self._versions = {}
+        options.install(hops)
+        # wrap the solve of the hops app, the same way hops wraps wsgi_app
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        if not options.option(comp, "cache", self.default):
+            return self._process_solve_request(comp, payload)
+
+        key = payload_digest(comp.uri, payload)
+        outputs = self.get(key)
+        if outputs is not None:
+            return True, outputs
+
+        stored = None
+        if self.store is not None:
+            stored = f"{key}:{self._version(comp)}"
+            outputs = self.store.get(stored)
+            if outputs is not None:
+                self.put(key, outputs, len(outputs))
+                return True, outputs
+
+        res, outputs = self._process_solve_request(comp, payload)
+        if res:
+            self.put(key, outputs, len(outputs))
+            if stored is not None:
+                self.store.put(stored, outputs)
+        return res, outputs
+
+    def _version(self, comp):
+        version = self._versions.get(comp)
+        if version is None:
+            version = self._versions[comp] = component_version(comp)
+        return version
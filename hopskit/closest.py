@@ -0,0 +1,323 @@
+"""Batch closest point queries on curves
+
+rhino3dm curves have no ClosestPoint and one request per point is far
+too slow for point clouds. CurveBVH builds a bounding volume hierarchy
+over the segments of a curve tessellation. Queries run level by level
+over all points at once:
+
+1. every point descends greedily to one leaf, which gives an upper
+   bound on its distance,
+2. the tree is walked again keeping only the nodes whose box is within
+   that bound,
+3. every segment that may hold the closest curve point is projected
+   back to a curve parameter and refined with Newton steps on the real
+   curve, and the nearest refined point wins. The curve can be up to
+   the chord sag of the tessellation away from its segments, so near
+   ties between segments are all refined.
+
+The segments come from hopskit.tessellation. CurveIndexCache keeps
+built trees keyed by the curve digest so queries against the same
+curves skip tessellation and building.
+"""
+import numpy as np
+
+from hopskit.cache import LRUCache
+from hopskit.geometry import geometry_digest
+from hopskit.tessellation import CurveTessellation
+
+
+LEAF_SIZE = 8
+
+# fractions of a segment where the chord sag is measured, and the
+# margin on the sampled sag for the deviation between the samples
+_SAG_SAMPLES = np.array([0.25, 0.5, 0.75])
+_SAG_MARGIN = 1.5
+
+
+def _box_distance2(points, lo, hi):
+    d = np.maximum(lo - points, 0.0) + np.maximum(points - hi, 0.0)
+    return np.einsum("ij,ij->i", d, d)
+
+
+class CurveBVH:
+    """Segment hierarchy over one curve"""
+
+    def __init__(self, tessellation):
+        self.tessellation = tessellation
+        self.params = tessellation.params
+        self._build(tessellation.points, self._sags(tessellation))
+        self.sag = float(self.sags.max(initial=0.0))
+
+    def _build(self, points, sags):
+        a, b = points[:-1], points[1:]
+        count = len(a)
+        leaves = 1
+        while leaves * LEAF_SIZE < count:
+            leaves *= 2
+        order = np.arange(leaves * LEAF_SIZE)
+        # pad with copies of the last segment so every leaf is full
+        order[count:] = count - 1
+        centers = (a + b) * 0.5
+
+        groups = [order]
+        while len(groups) < leaves:
+            split = []
+            for group in groups:
+                c = centers[group]
+                axis = np.argmax(c.max(axis=0) - c.min(axis=0))
+                half = len(group) // 2
+                part = np.argpartition(c[:, axis], half)
+                split += [group[part[:half]], group[part[half:]]]
+            groups = split
+        order = np.concatenate(groups)
+
+        self.a = a[order].reshape(leaves, LEAF_SIZE, 3)
+        self.b = b[order].reshape(leaves, LEAF_SIZE, 3)
+        self.t0 = self.params[:-1][order].reshape(leaves, LEAF_SIZE)
+        self.t1 = self.params[1:][order].reshape(leaves, LEAF_SIZE)
+        self.sags = sags[order].reshape(leaves, LEAF_SIZE)
+
+        lo = np.minimum(self.a, self.b).min(axis=1)
+        hi = np.maximum(self.a, self.b).max(axis=1)
+        self.levels = [(lo, hi)]
+        while len(lo) > 1:
+            lo = np.minimum(lo[0::2], lo[1::2])
+            hi = np.maximum(hi[0::2], hi[1::2])
+            self.levels.append((lo, hi))
+        self.levels.reverse()
+
+    @staticmethod
+    def _sags(tessellation):
+        """Bound on the distance between the curve and each segment"""
+        t0, t1 = tessellation.params[:-1], tessellation.params[1:]
+        if tessellation.linear:
+            return np.zeros(len(t0))
+        t = (t0[:, None] + (t1 - t0)[:, None] * _SAG_SAMPLES).ravel()
+        c = tessellation.evaluator.derivatives(t)[0].reshape(len(t0), len(_SAG_SAMPLES), 3)
+        a, b = tessellation.points[:-1, None], tessellation.points[1:, None]
+        ab = b - a
+        len2 = np.einsum("ijk,ijk->ij", ab, ab)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            s = np.where(len2 > 0, np.einsum("ijk,ijk->ij", c - a, ab) / len2, 0.0)
+        d = c - a - np.clip(s, 0.0, 1.0)[..., None] * ab
+        return np.sqrt(np.einsum("ijk,ijk->ij", d, d).max(axis=1)) * _SAG_MARGIN
+
+    @property
+    def nbytes(self):
+        arrays = [self.a, self.b, self.t0, self.t1, self.sags]
+        arrays += [x for level in self.levels for x in level]
+        return sum(x.nbytes for x in arrays)
+
+    def _leaf_segments(self, points, leaves):
+        """Squared distances and parameters of the nearest points on every
+        segment of each (point, leaf) pair, (len(leaves), LEAF_SIZE) each"""
+        a, b = self.a[leaves], self.b[leaves]
+        ab = b - a
+        ap = points[:, None, :] - a
+        len2 = np.einsum("ijk,ijk->ij", ab, ab)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            s = np.where(len2 > 0, np.einsum("ijk,ijk->ij", ap, ab) / len2, 0.0)
+        s = np.clip(s, 0.0, 1.0)
+        d = ap - s[..., None] * ab
+        d2 = np.einsum("ijk,ijk->ij", d, d)
+        t0, t1 = self.t0[leaves], self.t1[leaves]
+        return d2, t0 + s * (t1 - t0)
+
+    def _leaf_hits(self, points, leaves):
+        """Nearest segment of each (point, leaf) pair"""
+        d2, t = self._leaf_segments(points, leaves)
+        k = np.argmin(d2, axis=1)
+        rows = np.arange(len(leaves))
+        return d2[rows, k], t[rows, k]
+
+    def _walk(self, points, bound2):
+        """(point, leaf) pairs whose leaf box is within sqrt(bound2)"""
+        query = np.arange(len(points))
+        node = np.zeros(len(points), dtype=np.int64)
+        keep = _box_distance2(points, *self.levels[0]) <= bound2
+        query, node = query[keep], node[keep]
+        for lo, hi in self.levels[1:]:
+            query = np.repeat(query, 2)
+            node = 2 * np.repeat(node, 2) + np.tile((0, 1), len(node))
+            keep = _box_distance2(points[query], lo[node], hi[node]) <= bound2[query]
+            query, node = query[keep], node[keep]
+        return query, node
+
+    def descend(self, points):
+        """Greedy descent to one leaf per point, for a first upper bound
+
+        Returns the squared distance and NURBS form parameter of the
+        nearest point of that leaf, which need not be the nearest overall.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        node = np.zeros(len(points), dtype=np.int64)
+        for lo, hi in self.levels[1:]:
+            left, right = 2 * node, 2 * node + 1
+            go_right = _box_distance2(points, lo[right], hi[right]) < _box_distance2(points, lo[left], hi[left])
+            node = np.where(go_right, right, left)
+        return self._leaf_hits(points, node)
+
+    def query(self, points, bound2=None, chunk_size=1 << 18):
+        """Squared distance and NURBS form parameter of the nearest tessellation point
+
+        Points further than sqrt(bound2) are not searched and come back
+        with an infinite distance.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n = len(points)
+        best = np.full(n, np.inf) if bound2 is None else np.array(bound2, dtype=float)
+        best_t = np.full(n, np.nan)
+
+        d2, t = self.descend(points)
+        better = d2 < best
+        best[better] = d2[better]
+        best_t[better] = t[better]
+
+        # walk all nodes within the bound
+        query, node = self._walk(points, best)
+
+        for start in range(0, len(query), chunk_size // LEAF_SIZE):
+            q = query[start:start + chunk_size // LEAF_SIZE]
+            d2, t = self._leaf_hits(points[q], node[start:start + len(q)])
+            # nearest pair per point: sort by distance, first row per point wins
+            order = np.lexsort((d2, q))
+            q, d2, t = q[order], d2[order], t[order]
+            first = np.ones(len(q), dtype=bool)
+            first[1:] = q[1:] != q[:-1]
+            q, d2, t = q[first], d2[first], t[first]
+            better = d2 < best[q]
+            best[q[better]] = d2[better]
+            best_t[q[better]] = t[better]
+
+        found = ~np.isnan(best_t)
+        best[~found] = np.inf
+        return best, best_t
+
+    def candidates(self, points, radius):
+        """Every segment within `radius` of each point
+
+        Returns (point indices, squared distances, NURBS form
+        parameters of the nearest point on the segment, segment sags),
+        one entry per segment found.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        # a radius of sqrt(d2) can square to just below d2, widen it so the
+        # segment the radius was measured on is found again
+        bound2 = np.square(np.asarray(radius, dtype=float) * np.ones(len(points)) * (1.0 + 1e-9))
+        query, node = self._walk(points, bound2)
+        found = []
+        for start in range(0, len(query), 1 << 15):
+            q, leaves = query[start:start + (1 << 15)], node[start:start + (1 << 15)]
+            d2, t = self._leaf_segments(points[q], leaves)
+            inside = d2 <= bound2[q][:, None]
+            found.append((np.broadcast_to(q[:, None], d2.shape)[inside], d2[inside], t[inside], self.sags[leaves][inside]))
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0), np.empty(0)
+        return tuple(np.concatenate(column) for column in zip(*found))
+
+    def refine(self, points, params, iterations=3):
+        """Closest points on the real curve, starting from params
+
+        Returns (closest points, NURBS form parameters).
+        """
+        tess = self.tessellation
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        start = np.array(params, dtype=float)
+        if tess.linear:
+            return tess.evaluator.derivatives(start)[0], start
+
+        t0, t1 = tess.domain
+        tolerance = 1e-10 * (t1 - t0)
+        params = start.copy()
+        active = np.arange(len(params))
+        for _ in range(iterations):
+            c, d1, d2 = tess.evaluator.derivatives(params[active], 2)
+            r = c - points[active]
+            df = np.einsum("ij,ij->i", d1, d1) + np.einsum("ij,ij->i", r, d2)
+            ok = df > 0.0
+            step = np.where(ok, np.einsum("ij,ij->i", r, d1) / np.where(ok, df, 1.0), 0.0)
+            params[active] = np.clip(params[active] - step, t0, t1)
+            active = active[np.abs(step) >= tolerance]
+            if not len(active):
+                break
+
+        closest = tess.evaluator.derivatives(params)[0]
+        # Newton can run off to another extremum, keep the start then
+        before = tess.evaluator.derivatives(start)[0]
+        worse = np.linalg.norm(closest - points, axis=1) > np.linalg.norm(before - points, axis=1)
+        closest[worse], params[worse] = before[worse], start[worse]
+        return closest, params
+
+
+class CurveIndexCache(LRUCache):
+    """Memory bounded cache of CurveBVH keyed by curve digest
+
+    Tessellations come from `tessellations` (a TessellationCache) when
+    given, so other curve components can share them.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=None, ttl=None, tessellations=None):
+        super(CurveIndexCache, self).__init__(max_entries, max_bytes, ttl)
+        self.tessellations = tessellations
+
+    def index(self, curve):
+        key = geometry_digest(curve.Encode())
+        bvh = self.get(key)
+        if bvh is None:
+            if self.tessellations is not None:
+                tessellation = self.tessellations.tessellate(curve, key)
+            else:
+                tessellation = CurveTessellation(curve)
+            bvh = CurveBVH(tessellation)
+            self.put(key, bvh, bvh.nbytes)
+        return bvh
+
+    def closest_points(self, curves, points):
+        """Closest points on any of the curves
+
+        Returns (points, parameters, curve indices, distances) arrays.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n = len(points)
+        best = np.full(n, np.inf)
+        best_t = np.zeros(n)
+        best_curve = np.zeros(n, dtype=np.int64)
+        indexes = [self.index(curve) for curve in curves]
+        # each curve is within its sag of its segments: the closest curve
+        # point is no further than `upper`, and it lies on a segment that
+        # is at most `upper` plus the sag away
+        upper = np.full(n, np.inf)
+        for bvh in indexes:
+            d2, _ = bvh.descend(points)
+            upper = np.minimum(upper, np.sqrt(d2) + bvh.sag)
+        found = []
+        for bvh in indexes:
+            q, d2, t, sag = bvh.candidates(points, upper + bvh.sag)
+            d = np.sqrt(d2)
+            np.minimum.at(upper, q, d + sag)
+            found.append((q, d - sag, t))
+
+        closest = np.zeros((n, 3))
+        for i, (bvh, (q, nearest, t)) in enumerate(zip(indexes, found)):
+            # the bound is tighter now than during the walks, and each
+            # segment only needs its own sag
+            keep = nearest <= upper[q]
+            q, t = q[keep], t[keep]
+            if not len(q):
+                continue
+            c, params = bvh.refine(points[q], t)
+            d2 = np.einsum("ij,ij->i", c - points[q], c - points[q])
+            # nearest refined candidate per point
+            order = np.lexsort((d2, q))
+            q, d2, c, params = q[order], d2[order], c[order], params[order]
+            first = np.ones(len(q), dtype=bool)
+            first[1:] = q[1:] != q[:-1]
+            q, d2, c, params = q[first], d2[first], c[first], params[first]
+            better = d2 < best[q]
+            q = q[better]
+            best[q] = d2[better]
+            closest[q] = c[better]
+            best_t[q] = bvh.tessellation.curve_parameters(params[better])
+            best_curve[q] = i
+        distances = np.sqrt(best)
+        return closest, best_t, best_curve, distances
@@ -0,0 +1,121 @@
+"""gzip and zstd content codings for hops requests and responses
+
+Surfaces and breps travel as base64 opennurbs data inside JSON, which
+compresses several times over. Compression picks a coding from the
+client's Accept-Encoding and compresses responses above `min_size`
+bytes, and decodes request bodies sent with a Content-Encoding.
+hopskit.http.respond() applies it, so every component gets it.
+
+zstd needs the zstandard package and is skipped without it.
+"""
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _gzip_compressor(level):
+    return zlib.compressobj(level, zlib.DEFLATED, 31)
+
+
+def _gzip_decompress(data):
+    try:
+        return zlib.decompress(data, 31)
+    except zlib.error as ex:
+        raise ValueError(f"Bad gzip request body: {ex}")
+
+
+class _ZstdCompressor:
+    """compressobj() look-alike over a zstandard stream"""
+
+    def __init__(self, level):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._obj.compress(data)
+
+    def flush(self):
+        return self._obj.flush()
+
+
+def _zstd_decompress(data):
+    # frames written by a stream compressor don't record their size
+    try:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    except zstandard.ZstdError as ex:
+        raise ValueError(f"Bad zstd request body: {ex}")
+
+
+class Compression:
+    """Content coding negotiation for hops requests and responses
+
+    `codings` lists the codings to offer in order of preference.
+    Responses smaller than `min_size` bytes
+    are sent as they are, compressing them costs more than it saves.
+    """
+
+    def __init__(self, min_size=1024, gzip_level=6, zstd_level=3, codings=("zstd", "gzip")):
+        self.min_size = min_size
+        self.levels = {"gzip": gzip_level, "zstd": zstd_level}
+        self.codings = [c for c in codings if c in self.supported()]
+
+    @staticmethod
+    def supported():
+        return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+    def choose(self, accept_encoding):
+        """Preferred coding the client accepts, None for identity"""
+        accepted = {}
+        for part in (accept_encoding or "").split(","):
+            name, _, params = part.strip().partition(";")
+            q = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    q = float(params[2:])
+                except ValueError:
+                    q = 0.0
+            accepted[name.strip().lower()] = q
+        for coding in self.codings:
+            if accepted.get(coding, accepted.get("*", 0.0)) > 0.0:
+                return coding
+        return None
+
+    def compressor(self, coding):
+        if coding == "zstd":
+            return _ZstdCompressor(self.levels["zstd"])
+        return _gzip_compressor(self.levels["gzip"])
+
+    def compress(self, data, coding):
+        """Compressed body or None when data is below min_size"""
+        if len(data) < self.min_size:
+            return None
+        obj = self.compressor(coding)
+        return obj.compress(data) + obj.flush()
+
+    def compress_stream(self, chunks, coding):
+        """Compress an iterable of byte chunks as one stream"""
+        obj = self.compressor(coding)
+        for chunk in chunks:
+            data = obj.compress(chunk)
+            if data:
+                yield data
+        yield obj.flush()
+
+    def decompress(self, data, content_encoding):
+        """Request body without its Content-Encoding
+
+        Raises ValueError for codings that are unknown or not installed.
+        """
+        for coding in reversed([c.strip().lower() for c in (content_encoding or "").split(",") if c.strip()]):
+            if coding == "identity":
+                continue
+            if coding in ("gzip", "x-gzip"):
+                data = _gzip_decompress(data)
+            elif coding == "zstd" and zstandard is not None:
+                data = _zstd_decompress(data)
+            else:
+                raise ValueError(f"Unsupported Content-Encoding {coding!r}")
+        return data
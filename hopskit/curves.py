@@ -0,0 +1,243 @@
+"""Bulk curve evaluation into packed NumPy arrays
+
+Points, tangents, curvature and frames come from the NURBS form of the
+curve through hopskit.nurbs.CurveEvaluator, all parameters at once, and
+follow the opennurbs definitions so they match rhino3dm's PointAt,
+TangentAt, CurvatureAt and FrameAt:
+
+- the tangent is the unit first derivative (the second where the first
+  vanishes),
+- the curvature vector is K = (D2 - (D2.T)T) / |D1|^2,
+- frames have X = T and Y = K / |K|, or the opennurbs
+  PerpendicularTo(T) where the curve is straight, and fail outside the
+  domain with the world XY plane.
+
+Parameters of arcs, ellipses and other curves whose NURBS form is
+parameterized differently are converted first.
+"""
+from collections import namedtuple
+
+import numpy as np
+import rhino3dm
+
+from hopskit.cache import LRUCache
+from hopskit.geometry import geometry_digest
+from hopskit.nurbs import CurveEvaluator
+
+
+CurveSamples = namedtuple(
+    "CurveSamples",
+    ["points", "tangents", "curvatures", "success", "origins", "xaxes", "yaxes", "zaxes"],
+)
+
+CurveClass = namedtuple(
+    "CurveClass",
+    ["kind", "closed", "linear", "polyline", "arc", "circle", "ellipse", "planar"],
+)
+
+# CurveClass.kind is an index into this, the most specific shape first
+CURVE_KINDS = ("Line", "Polyline", "Circle", "Arc", "Ellipse", "Planar", "Free")
+
+# ON_ZERO_TOLERANCE, curvature below it counts as straight
+ZERO_TOLERANCE = 2.0**-32
+
+# curve types whose NURBS form keeps their parameterization
+_SAME_PARAMETERS = (rhino3dm.NurbsCurve, rhino3dm.LineCurve, rhino3dm.PolylineCurve)
+
+
+def nurbs_form(curve):
+    """The curve itself if it is a NurbsCurve, else its NURBS form"""
+    return curve if hasattr(curve, "Knots") else curve.ToNurbsCurve()
+
+
+def nurbs_parameters(curve, params):
+    """The curve's own parameters to parameters of nurbs_form(curve)"""
+    params = np.asarray(params, dtype=float)
+    if isinstance(curve, _SAME_PARAMETERS):
+        return params
+    convert = curve.GetNurbsFormParameterFromCurveParameter
+    return np.array([convert(t)[1] for t in params.ravel().tolist()]).reshape(params.shape)
+
+
+def curve_parameters(curve, params):
+    """Parameters of nurbs_form(curve) to the curve's own parameters"""
+    params = np.asarray(params, dtype=float)
+    if isinstance(curve, _SAME_PARAMETERS):
+        return params
+    convert = curve.GetCurveParameterFromNurbsFormParameter
+    return np.array([convert(t)[1] for t in params.ravel().tolist()]).reshape(params.shape)
+
+
+def _xyz(v):
+    return v.X, v.Y, v.Z
+
+
+def _unit(v):
+    length = np.linalg.norm(v, axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(length > 0.0, v / length, 0.0), length[..., 0]
+
+
+def tangents_and_curvatures(d1, d2):
+    """Unit tangents and curvature vectors from first and second derivatives"""
+    tangent, speed = _unit(d1)
+    # cusps and degenerate spans: opennurbs falls back to the second derivative
+    stopped = speed == 0.0
+    if stopped.any():
+        tangent[stopped] = _unit(d2[stopped])[0]
+    normal_part = d2 - np.einsum("ij,ij->i", d2, tangent)[:, None] * tangent
+    with np.errstate(invalid="ignore", divide="ignore"):
+        curvature = np.where(stopped[:, None], 0.0, normal_part / (speed * speed)[:, None])
+    return tangent, curvature
+
+
+def perpendicular_to(v):
+    """opennurbs ON_3dVector::PerpendicularTo, row by row"""
+    a = np.abs(v)
+    x, y, z = v[:, 0], v[:, 1], v[:, 2]
+    zero = np.zeros(len(v))
+    y_gt_x = a[:, 1] > a[:, 0]
+    cases = [
+        # (condition, result) in the order opennurbs tests them
+        (y_gt_x & (a[:, 2] > a[:, 1]), (zero, z, -y)),
+        (y_gt_x & (a[:, 2] >= a[:, 0]), (zero, -z, y)),
+        (y_gt_x, (y, -x, zero)),
+        (a[:, 2] > a[:, 0], (z, zero, -x)),
+        (a[:, 2] > a[:, 1], (-z, zero, x)),
+    ]
+    result = np.stack((-y, x, zero), axis=1)
+    taken = np.zeros(len(v), dtype=bool)
+    for condition, xyz in cases:
+        pick = condition & ~taken
+        result[pick] = np.stack(xyz, axis=1)[pick]
+        taken |= condition
+    return result
+
+
+def curve_frames(params, domain, points, tangents, curvatures):
+    """FrameAt for every parameter: (success, origins, X, Y, Z)"""
+    k_unit, k_length = _unit(curvatures)
+    straight = k_length <= ZERO_TOLERANCE
+    y_axis = k_unit
+    if straight.any():
+        y_axis[straight] = _unit(perpendicular_to(tangents[straight]))[0]
+    z_axis = np.cross(tangents, y_axis)
+
+    t0, t1 = domain
+    success = (params >= t0) & (params <= t1) & (np.linalg.norm(tangents, axis=1) > 0.0)
+    origins = np.where(success[:, None], points, 0.0)
+    world = np.eye(3)
+    x_axis = np.where(success[:, None], tangents, world[0])
+    y_axis = np.where(success[:, None], y_axis, world[1])
+    z_axis = np.where(success[:, None], z_axis, world[2])
+    return success, origins, x_axis, y_axis, z_axis
+
+
+def evaluate_curve(curve, parameters, points=True, tangents=False, curvatures=False, frames=False, evaluator=None):
+    """Evaluate a curve at every parameter in one pass
+
+    Returns a CurveSamples tuple of (N, 3) float arrays. Quantities that
+    were not requested are left as None. Frame origins are the curve
+    points, so asking for frames also fills `points`. Pass the
+    curve's `evaluator` when it is cached, see CurveEvaluatorCache.
+    """
+    t = np.asarray(parameters, dtype=float).ravel()
+    if evaluator is None:
+        evaluator = CurveEvaluator(nurbs_form(curve))
+    nurbs_t = nurbs_parameters(curve, t)
+    count = 2 if tangents or curvatures or frames else 0
+    ders = evaluator.derivatives(nurbs_t, count)
+
+    tan = crv = None
+    if count:
+        tan, crv = tangents_and_curvatures(ders[1], ders[2])
+    if not isinstance(curve, _SAME_PARAMETERS):
+        # arcs extend along their circle, not along the NURBS polynomial
+        outside = np.flatnonzero((t < curve.Domain.T0) | (t > curve.Domain.T1))
+        for i in outside.tolist():
+            ders[0][i] = _xyz(curve.PointAt(t[i]))
+            if count:
+                tan[i] = _xyz(curve.TangentAt(t[i]))
+                crv[i] = _xyz(curve.CurvatureAt(t[i]))
+    ok = origins = None
+    axes = [None] * 3
+    if frames:
+        # the domain test uses the curve's own parameters, like FrameAt
+        domain = (curve.Domain.T0, curve.Domain.T1)
+        ok, origins, *axes = curve_frames(t, domain, ders[0], tan, crv)
+
+    return CurveSamples(
+        points=ders[0] if points else None,
+        tangents=tan if tangents else None,
+        curvatures=crv if curvatures else None,
+        success=ok,
+        origins=origins,
+        xaxes=axes[0],
+        yaxes=axes[1],
+        zaxes=axes[2],
+    )
+
+
+def evaluate_curves(curves, parameters, cache=None, **wanted):
+    """evaluate_curve over aligned lists of curves and parameters
+
+    Items that share a curve object (one curve with many parameters in
+    a tree solve) are evaluated together. `wanted` takes the same
+    flags as evaluate_curve; results are aligned with the inputs.
+    """
+    t = np.asarray(parameters, dtype=float).ravel()
+    groups = {}
+    for i, curve in enumerate(curves):
+        groups.setdefault(id(curve), (curve, []))[1].append(i)
+
+    results = None
+    for curve, rows in groups.values():
+        evaluator = cache.evaluator(curve) if cache is not None else None
+        samples = evaluate_curve(curve, t[rows], evaluator=evaluator, **wanted)
+        if results is None:
+            results = [
+                None if value is None else np.empty((len(t),) + value.shape[1:], dtype=value.dtype)
+                for value in samples
+            ]
+        for out, value in zip(results, samples):
+            if value is not None:
+                out[rows] = value
+    if results is None:
+        results = [None] * len(CurveSamples._fields)
+    return CurveSamples(*results)
+
+
+class CurveEvaluatorCache(LRUCache):
+    """Memory bounded cache of CurveEvaluator keyed by curve digest"""
+
+    def evaluator(self, curve, key=None):
+        key = key or geometry_digest(curve.Encode())
+        evaluator = self.get(key)
+        if evaluator is None:
+            evaluator = CurveEvaluator(nurbs_form(curve))
+            self.put(key, evaluator, evaluator.points.nbytes + evaluator.knots.nbytes)
+        return evaluator
+
+
+def classify_curve(curve):
+    """Every rhino3dm shape predicate of a curve, as a CurveClass
+
+    Gives the same answers as calling IsClosed, IsLinear, IsPolyline,
+    IsArc, IsCircle, IsEllipse and IsPlanar one by one, but skips the
+    tests an earlier answer already decides: lines are planar
+    polylines, polylines are no conics, an open curve is no circle,
+    and circles are arcs and ellipses, which are planar.
+    """
+    closed = curve.IsClosed
+    if curve.IsLinear():
+        return CurveClass(0, closed, True, True, False, False, False, True)
+    if curve.IsPolyline():
+        return CurveClass(1, closed, False, True, False, False, False, curve.IsPlanar())
+    if closed and curve.IsCircle():
+        return CurveClass(2, closed, False, False, True, True, True, True)
+    if curve.IsArc():
+        return CurveClass(3, closed, False, False, True, False, True, True)
+    if curve.IsEllipse():
+        return CurveClass(4, closed, False, False, False, False, True, True)
+    planar = curve.IsPlanar()
+    return CurveClass(5 if planar else 6, closed, False, False, False, False, False, planar)
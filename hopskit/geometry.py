@@ -0,0 +1,54 @@
+"""Decoded geometry cache for Hops inputs
+
+Curves, surfaces and breps arrive as opennurbs JSON and are decoded
+with rhino3dm.CommonObject.Decode on every request, even when only a
+number input changed. GeometryCache keeps the decoded objects keyed by
+a digest of the encoded data.
+
+Every lookup hands out a Duplicate() of the cached object, so
+components that modify their input in place (crv_reverse,
+crv_change_closed_curve_seam, srf_set_domain, ...) never touch the
+cached copy. Duplicating is much cheaper than decoding.
+"""
+import hashlib
+
+from ghhops_server import params
+
+from hopskit.cache import LRUCache
+
+
+def geometry_digest(data):
+    """Digest of an opennurbs JSON object"""
+    digest = hashlib.sha256()
+    for key in ("archive3dm", "opennurbs", "data"):
+        digest.update(str(data.get(key, "")).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class GeometryCache(LRUCache):
+    """Memory bounded cache of decoded rhino3dm objects"""
+
+    def __init__(self, hops, max_entries=1024, max_bytes=256 * 2**20):
+        super(GeometryCache, self).__init__(max_entries, max_bytes)
+        # hops sets the param decoder when the app is created,
+        # so take over the one it installed
+        self.hops = hops
+        self._from_json = params.RHINO_FROMJSON
+        params.RHINO_FROMJSON = self.decode
+
+    def decode(self, data):
+        """Decode opennurbs JSON, reusing earlier results"""
+        if not isinstance(data, dict) or "data" not in data:
+            return self._from_json(data)
+
+        key = geometry_digest(data)
+        obj = self.get(key)
+        if obj is None:
+            obj = self._from_json(data)
+            if obj is None:
+                return None
+            # base64 size is a fair estimate of the decoded size
+            self.put(key, obj, len(data["data"]))
+        duplicate = getattr(obj, "Duplicate", None)
+        return duplicate() if duplicate else obj
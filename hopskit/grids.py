@@ -0,0 +1,28 @@
+"""Point lattices built with NumPy broadcasting"""
+import numpy as np
+
+
+def _xyz(value):
+    if hasattr(value, "X"):
+        return np.array((value.X, value.Y, value.Z), dtype=float)
+    return np.asarray(value, dtype=float).reshape(3)
+
+
+def point_grid(origin, x, y, u_count, v_count):
+    """(u_count * v_count, 3) points origin + i * x + j * y
+
+    Points are U major: index = i * v_count + j.
+    """
+    o, x, y = _xyz(origin), _xyz(x), _xyz(y)
+    i = np.arange(u_count, dtype=float)[:, None, None]
+    j = np.arange(v_count, dtype=float)[None, :, None]
+    return (o + i * x + j * y).reshape(-1, 3)
+
+
+def iter_point_grid(origin, x, y, u_count, v_count, chunk_size=65536):
+    """point_grid() in chunks of whole U rows, about chunk_size points each"""
+    o, x, y = _xyz(origin), _xyz(x), _xyz(y)
+    rows = max(1, chunk_size // max(v_count, 1))
+    for start in range(0, u_count, rows):
+        stop = min(start + rows, u_count)
+        yield point_grid(o + start * x, x, y, stop - start, v_count)
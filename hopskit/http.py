@@ -0,0 +1,187 @@
+"""HTTP front ends for a hops app with content negotiation
+
+ghhops_server answers every request with JSON. respond() does the same
+work (query on GET, solve on POST) but also speaks the binary format
+from hopskit.binary: a request body sent with that Content-Type is
+decoded before the solve, and the result is encoded when the client
+lists it in Accept. Streamed solves (hopskit.streaming) come back as an
+iterator of JSON chunks and are sent with chunked transfer encoding.
+With a hopskit.compression.Compression, request bodies are decoded
+from their Content-Encoding and responses compressed as Accept-Encoding
+allows.
+
+HopsWSGI puts respond() in front of the Flask middleware and
+serve_http() runs it on the stdlib threading server, replacing
+hops.start().
+"""
+import json
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ghhops_server.logger import logging, hlogger
+
+from hopskit import binary
+from hopskit.compression import Compression
+from hopskit.streaming import StreamedOutputs
+
+
+JSON_TYPE = "application/json"
+
+
+def _accepts(headers, content_type):
+    return content_type in (headers.get("Accept") or "")
+
+
+def respond(hops, method, path, headers, body=b"", error_status=500, compression=None):
+    """Handle one hops request
+
+    Returns (status, headers, body bytes). `headers` is any mapping
+    with a get() method. The body of a streamed solve is an iterable
+    of bytes instead.
+    """
+    if compression is None:
+        return _respond(hops, method, path, headers, body, error_status)
+
+    if body and headers.get("Content-Encoding"):
+        try:
+            body = compression.decompress(body, headers.get("Content-Encoding"))
+        except ValueError as ex:
+            return 415, [("Content-Type", JSON_TYPE)], hops._return_with_err(str(ex)).encode("utf-8")
+    status, response_headers, data = _respond(hops, method, path, headers, body, error_status)
+
+    coding = compression.choose(headers.get("Accept-Encoding"))
+    if coding is None or method == "HEAD":
+        return status, response_headers, data
+    if isinstance(data, bytes):
+        compressed = compression.compress(data, coding)
+        if compressed is None:
+            return status, response_headers, data
+        data = compressed
+    else:
+        data = compression.compress_stream(data, coding)
+    response_headers += [("Content-Encoding", coding), ("Vary", "Accept-Encoding")]
+    return status, response_headers, data
+
+
+def _respond(hops, method, path, headers, body, error_status):
+    path = path.split("?")[0]
+    if method == "HEAD":
+        return 200, [("Content-Type", JSON_TYPE)], b""
+
+    if method == "GET":
+        if path == hops.SOLVE_ROUTE:
+            return 405, [("Content-Type", "text/html")], hops.ERROR_PAGE_405.encode("utf-8")
+        res, results = hops.query(uri=path)
+        if not res:
+            return 404, [("Content-Type", JSON_TYPE)], results.encode("utf-8")
+        return 200, [("Content-Type", JSON_TYPE)], results.encode("utf-8")
+
+    if method != "POST":
+        return 405, [("Content-Type", "text/html")], hops.ERROR_PAGE_405.encode("utf-8")
+
+    content_type = headers.get("Content-Type") or ""
+    if binary.CONTENT_TYPE in content_type:
+        try:
+            body = json.dumps(binary.decode(body))
+        except ValueError as ex:
+            return 400, [("Content-Type", JSON_TYPE)], hops._return_with_err(str(ex)).encode("utf-8")
+
+    res, results = hops.solve(uri=path, payload=body)
+    status = 200 if res else error_status
+    if isinstance(results, StreamedOutputs):
+        return status, [("Content-Type", JSON_TYPE)], results
+    if _accepts(headers, binary.CONTENT_TYPE):
+        return status, [("Content-Type", binary.CONTENT_TYPE)], binary.encode(results)
+    return status, [("Content-Type", JSON_TYPE)], results.encode("utf-8")
+
+
+class HopsWSGI:
+    """WSGI app answering hops routes with respond()
+
+    install() puts it in front of a Flask app wrapped by hs.Hops(app),
+    other routes still reach the Flask app.
+    """
+
+    def __init__(self, hops, wsgi_app, error_status=404, compression=None):
+        self.hops = hops
+        self.wsgi_app = wsgi_app
+        self.error_status = error_status
+        self.compression = compression
+
+    @classmethod
+    def install(cls, hops, **kwargs):
+        flask_app = hops.app
+        flask_app.wsgi_app = cls(hops, flask_app.wsgi_app, **kwargs)
+        return flask_app.wsgi_app
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO") or "/"
+        if path not in self.hops.BUILTIN_ROUTES and path not in self.hops._components:
+            return self.wsgi_app(environ, start_response)
+
+        headers = {
+            "Content-Type": environ.get("CONTENT_TYPE"),
+            "Accept": environ.get("HTTP_ACCEPT"),
+            "Accept-Encoding": environ.get("HTTP_ACCEPT_ENCODING"),
+            "Content-Encoding": environ.get("HTTP_CONTENT_ENCODING"),
+        }
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        status, response_headers, data = respond(
+            self.hops, environ["REQUEST_METHOD"], path, headers, body, self.error_status, self.compression
+        )
+        if isinstance(data, bytes):
+            response_headers.append(("Content-Length", str(len(data))))
+            data = [data]
+        # without a length the server sends the iterable chunked (or until close)
+        start_response(f"{status} {HTTPStatus(status).phrase}", response_headers)
+        return data
+
+
+class HopsHTTPRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for the stdlib server, see serve_http()"""
+
+    hops = None
+    compression = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        hlogger.info("%s - - [%s] %s" % (self.address_string(), self.log_date_time_string(), format % args))
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, data = respond(
+            self.hops, self.command, self.path, self.headers, body, compression=self.compression
+        )
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if not isinstance(data, bytes):
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in data:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(data)
+
+    do_GET = do_POST = do_HEAD = _handle
+
+
+def serve_http(hops, address="localhost", port=5000, debug=False, compression=None):
+    """Drop-in for hops.start() on the default hops app
+
+    Responses are compressed for clients that accept it unless
+    compression=False, pass a Compression to tune it.
+    """
+    hlogger.setLevel(logging.DEBUG if debug else logging.INFO)
+    if compression is None:
+        compression = Compression()
+    handler = type("Handler", (HopsHTTPRequestHandler,), {"hops": hops, "compression": compression or None})
+    httpd = ThreadingHTTPServer((address, port), handler)
+    hlogger.info("Starting hops python server on %s:%s", address, port)
+    httpd.serve_forever()
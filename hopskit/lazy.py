@@ -0,0 +1,141 @@
+"""Lazy component registration from a metadata manifest
+
+Registering a component runs the hops.component decorator, which walks
+the call stack and builds every param object. LazyComponents registers
+placeholders from a JSON manifest of component metadata instead, so
+GET / and GET /<uri> are answered without importing any component
+code. The module that defines a component is imported the first time
+one of its routes is solved and registers the real components then.
+
+The manifest keeps a digest of each module's source. Modules whose
+source changed since are imported at startup and their entries
+rewritten, so the manifest never serves stale metadata. Digests don't
+depend on file times, so a committed manifest stays valid after a
+checkout.
+"""
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import threading
+import time
+
+from ghhops_server.base import _HopsEncoder
+from ghhops_server.logger import hlogger
+
+
+class LazyComponent:
+    """Stands in for a HopsComponent until its module is imported"""
+
+    def __init__(self, module, metadata):
+        self.module = module
+        self.metadata = metadata
+        self.uri = self.solve_uri = metadata["Uri"]
+        self.name = metadata["Name"]
+
+    def encode(self):
+        return self.metadata
+
+    def __repr__(self):
+        return f"<LazyComponent {self.uri} from {self.module}>"
+
+
+def _signature(module):
+    origin = importlib.util.find_spec(module).origin
+    with open(origin, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class LazyComponents:
+    """Registers component modules on a hops app on first use
+
+    Create it after the other solve wrappers. With lazy=False every
+    module is imported right away (and the manifest refreshed).
+    """
+
+    def __init__(self, hops, modules, manifest, lazy=True):
+        self.hops = hops
+        self.modules = list(modules)
+        self.manifest = manifest
+        self._loaded = set()
+        self._lock = threading.RLock()
+
+        start = time.perf_counter()
+        entries = self._read_manifest()
+        changed = False
+        for module in self.modules:
+            entry = entries.get(module)
+            if not lazy or entry is None or entry["signature"] != _signature(module):
+                self.load(module)
+                entries[module] = self.describe(module)
+                changed = True
+                continue
+            for metadata in entry["components"]:
+                placeholder = LazyComponent(module, metadata)
+                hops._components[placeholder.uri] = placeholder
+        if changed:
+            self._write_manifest(entries)
+        self.startup_seconds = time.perf_counter() - start
+        hlogger.info(
+            "Registered components in %.1f ms, %d of %d modules deferred",
+            self.startup_seconds * 1000, len(self.modules) - len(self._loaded), len(self.modules),
+        )
+
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        if isinstance(comp, LazyComponent):
+            self.load(comp.module)
+            comp = self.hops._components.get(comp.uri)
+            if comp is None or isinstance(comp, LazyComponent):
+                return False, self.hops._return_with_err("Unknown Hops component url")
+        return self._process_solve_request(comp, payload)
+
+    def load(self, module):
+        """Import a component module, replacing its placeholders"""
+        with self._lock:
+            if module in self._loaded:
+                return
+            start = time.perf_counter()
+            importlib.import_module(module)
+            self._loaded.add(module)
+            # drop placeholders the module no longer defines
+            for uri, comp in list(self.hops._components.items()):
+                if isinstance(comp, LazyComponent) and comp.module == module:
+                    hlogger.error("Component %s missing from %s, manifest is out of date", uri, module)
+                    del self.hops._components[uri]
+            hlogger.info("Loaded %s in %.1f ms", module, (time.perf_counter() - start) * 1000)
+
+    def load_all(self):
+        for module in self.modules:
+            self.load(module)
+
+    def describe(self, module):
+        """Manifest entry of an imported module"""
+        comps = []
+        for comp in self.hops._components.values():
+            handler = getattr(comp, "handler", None)
+            if handler is not None and handler.__module__ == module and comp not in comps:
+                comps.append(comp)
+        return {
+            "signature": _signature(module),
+            "components": [json.loads(json.dumps(comp, cls=_HopsEncoder)) for comp in comps],
+        }
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, entries):
+        tmp = f"{self.manifest}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=1)
+            os.replace(tmp, self.manifest)
+        except OSError as ex:
+            hlogger.warning("Can not write component manifest %s: %s", self.manifest, ex)
@@ -0,0 +1,167 @@
+"""Indexed quad meshes of surfaces and breps
+
+rhino3dm cannot mesh breps itself. mesh_geometry() samples each NURBS
+surface on a grid that follows its knot spans, `density` segments per
+span (one for degree 1 directions, which are exact), with
+hopskit.nurbs.SurfaceEvaluator, and returns shared vertex, normal and
+quad face index arrays.
+
+Brep faces use their cached render mesh when the brep carries one and
+are sampled over the underlying surface otherwise. Trims are not
+applied to sampled faces, so trimmed faces come out untrimmed.
+
+MeshCache keeps the meshes keyed by geometry digest and density.
+"""
+import numpy as np
+import rhino3dm
+
+from hopskit.cache import LRUCache
+from hopskit.geometry import geometry_digest
+from hopskit.nurbs import SurfaceEvaluator, as_nurbs_surface, frames
+
+
+def span_grid(knots, degree, domain, density):
+    """Increasing parameters, `density` steps per knot span"""
+    t0, t1 = domain
+    knots = np.unique(np.clip(knots, t0, t1))
+    if len(knots) < 2:
+        knots = np.array([t0, t1])
+    steps = 1 if degree == 1 else max(int(density), 1)
+    spans = knots[:-1, None] + (knots[1:] - knots[:-1])[:, None] * np.linspace(0.0, 1.0, steps + 1)[:-1]
+    return np.append(spans.ravel(), knots[-1])
+
+
+class IndexedMesh:
+    """Vertices and normals (N, 3) and quad faces (F, 4) as indices"""
+
+    def __init__(self, vertices, normals, faces):
+        self.vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        self.normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        self.faces = np.asarray(faces, dtype=np.int32).reshape(-1, 4)
+
+    @property
+    def nbytes(self):
+        return self.vertices.nbytes + self.normals.nbytes + self.faces.nbytes
+
+    @classmethod
+    def join(cls, meshes):
+        """One mesh of several, face indices shifted to the joined vertices"""
+        meshes = list(meshes)
+        if not meshes:
+            return cls(np.empty((0, 3)), np.empty((0, 3)), np.empty((0, 4)))
+        offsets = np.cumsum([0] + [len(m.vertices) for m in meshes[:-1]])
+        return cls(
+            np.concatenate([m.vertices for m in meshes]),
+            np.concatenate([m.normals for m in meshes]),
+            np.concatenate([m.faces + offset for m, offset in zip(meshes, offsets)]),
+        )
+
+    def reversed(self):
+        """The same mesh facing the other way"""
+        triangles = self.faces[:, 2] == self.faces[:, 3]
+        faces = np.where(triangles[:, None], self.faces[:, [2, 1, 0, 0]], self.faces[:, [2, 1, 0, 3]])
+        return IndexedMesh(self.vertices, -self.normals, faces)
+
+    def to_rhino(self):
+        """rhino3dm.Mesh with the same vertices, normals and faces"""
+        mesh = rhino3dm.Mesh()
+        for x, y, z in self.vertices.tolist():
+            mesh.Vertices.Add(x, y, z)
+        for x, y, z in self.normals.tolist():
+            mesh.Normals.Add(x, y, z)
+        for a, b, c, d in self.faces.tolist():
+            if c == d:
+                mesh.Faces.AddFace(a, b, c)
+            else:
+                mesh.Faces.AddFace(a, b, c, d)
+        return mesh
+
+    @classmethod
+    def from_rhino(cls, mesh):
+        vertices = [(p.X, p.Y, p.Z) for p in mesh.Vertices.ToPoint3dArray()]
+        normals = [(n.X, n.Y, n.Z) for n in (mesh.Normals[i] for i in range(len(mesh.Normals)))]
+        if len(normals) != len(vertices):
+            normals = np.zeros((len(vertices), 3))
+        faces = [mesh.Faces[i] for i in range(mesh.Faces.Count)]
+        return cls(vertices, normals, [f[:4] for f in faces])
+
+
+def mesh_surface(surface, density=4):
+    """IndexedMesh of a surface sampled on its knot span grid"""
+    srf = as_nurbs_surface(surface)
+    evaluator = SurfaceEvaluator(srf)
+    u = span_grid(srf.KnotsU.ToList(), evaluator.degree[0], evaluator.nurbs_domain[0], density)
+    v = span_grid(srf.KnotsV.ToList(), evaluator.degree[1], evaluator.nurbs_domain[1], density)
+    d = evaluator.nurbs_grid(u, v)
+    success, _, _, normals = frames(d["Su"], d["Sv"])
+
+    # quad (i, j) runs counterclockwise around the U x V cell, so faces
+    # point along the surface normal
+    nu, nv = len(u), len(v)
+    index = np.arange(nu * nv).reshape(nu, nv)
+    faces = np.stack(
+        (index[:-1, :-1], index[1:, :-1], index[1:, 1:], index[:-1, 1:]), axis=-1
+    ).reshape(-1, 4)
+    vertices = d["S"].reshape(-1, 3)
+    normals = normals.reshape(-1, 3)
+    singular = ~success.ravel()
+    if singular.any():
+        # poles and collapsed edges: average the normals of the faces around
+        q = vertices[faces]
+        face_normals = np.cross(q[:, 2] - q[:, 0], q[:, 3] - q[:, 1])
+        sums = np.zeros_like(vertices)
+        for corner in range(4):
+            np.add.at(sums, faces[:, corner], face_normals)
+        # a pole is one point repeated along the grid, pool all of its faces
+        _, group = np.unique(vertices[singular].round(9), axis=0, return_inverse=True)
+        pooled = np.zeros((group.max() + 1, 3))
+        np.add.at(pooled, group.ravel(), sums[singular])
+        pooled = pooled[group.ravel()]
+        length = np.linalg.norm(pooled, axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normals[singular] = np.where(length > 0.0, pooled / length, 0.0)
+    return IndexedMesh(vertices, normals, _collapse(vertices, faces))
+
+
+def _collapse(vertices, faces):
+    """Quads with one collapsed edge as triangles (a, b, c, c), without the empty ones"""
+    q = vertices[faces]
+    tolerance = 1e-12 * (1.0 + np.abs(vertices).max(initial=0.0))
+    same = np.linalg.norm(q - np.roll(q, -1, axis=1), axis=-1) <= tolerance
+    count = same.sum(axis=1)
+    triangles = faces[count == 1]
+    if len(triangles):
+        # drop the corner that repeats the one before it
+        drop = (np.argmax(same[count == 1], axis=1) + 1) % 4
+        triangles = triangles[np.arange(4) != drop[:, None]].reshape(-1, 3)
+        triangles = np.column_stack((triangles, triangles[:, 2]))
+    return np.concatenate((faces[count == 0], triangles.reshape(-1, 4)))
+
+
+def mesh_geometry(geometry, density=4):
+    """IndexedMesh of a surface or of every face of a brep"""
+    faces = getattr(geometry, "Faces", None)
+    if faces is None:
+        return mesh_surface(geometry, density)
+    meshes = []
+    for i in range(len(faces)):
+        face = faces[i]
+        cached = face.GetMesh(rhino3dm.MeshType.Render)
+        if cached is not None:
+            meshes.append(IndexedMesh.from_rhino(cached))
+            continue
+        mesh = mesh_surface(face.UnderlyingSurface(), density)
+        meshes.append(mesh.reversed() if face.OrientationIsReversed else mesh)
+    return IndexedMesh.join(meshes)
+
+
+class MeshCache(LRUCache):
+    """Memory bounded cache of IndexedMesh keyed by geometry digest and density"""
+
+    def mesh(self, geometry, density=4, key=None):
+        key = (key or geometry_digest(geometry.Encode()), density)
+        mesh = self.get(key)
+        if mesh is None:
+            mesh = mesh_geometry(geometry, density)
+            self.put(key, mesh, mesh.nbytes)
+        return mesh
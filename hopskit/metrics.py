@@ -0,0 +1,129 @@
+"""Per-route request metrics in Prometheus text format
+
+Metrics wraps the solve step of a hops app and records, per component
+route, the request count, error count, latency and payload sizes.
+Recording is a few dict lookups and a bisect per request.
+
+Each process keeps its own numbers. With the prefork server every
+worker reports only the requests it served.
+"""
+import bisect
+import threading
+import time
+
+from hopskit.streaming import StreamedOutputs
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(10))  # 256B .. 64MB
+
+
+def _nbytes(data):
+    """Size of a payload on the wire, str is sent as utf-8"""
+    return len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def render(self, name, labels):
+        lines = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {total}')
+        total += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {total}')
+        lines.append(f"{name}_sum{{{labels}}} {self.sum:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {total}")
+        return lines
+
+
+class _RouteStats:
+    __slots__ = ("requests", "errors", "latency", "request_size", "response_size")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.request_size = _Histogram(SIZE_BUCKETS)
+        self.response_size = _Histogram(SIZE_BUCKETS)
+
+
+class Metrics:
+    """Collects solve metrics of a hops app
+
+    Create it after the other solve wrappers (caches, tree solver) so
+    the latency covers them too.
+    """
+
+    def __init__(self, hops, prefix="hops"):
+        self.prefix = prefix
+        self.started = time.time()
+        self._routes = {}
+        self._lock = threading.Lock()
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        start = time.perf_counter()
+        res, outputs = False, ""
+        try:
+            res, outputs = self._process_solve_request(comp, payload)
+            if isinstance(outputs, StreamedOutputs):
+                # recorded once the response has been sent
+                outputs.on_close.append(
+                    lambda size, ok: self.observe(comp.uri, time.perf_counter() - start, _nbytes(payload), size, ok)
+                )
+            return res, outputs
+        finally:
+            if not isinstance(outputs, StreamedOutputs):
+                self.observe(comp.uri, time.perf_counter() - start, _nbytes(payload), _nbytes(outputs), res)
+
+    def observe(self, route, seconds, request_bytes, response_bytes, ok=True):
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = _RouteStats()
+            stats.requests += 1
+            if not ok:
+                stats.errors += 1
+            stats.latency.observe(seconds)
+            stats.request_size.observe(request_bytes)
+            stats.response_size.observe(response_bytes)
+
+    def render(self):
+        """Prometheus text exposition of everything recorded so far"""
+        p = self.prefix
+        with self._lock:
+            routes = sorted(self._routes.items())
+            sections = [
+                ("requests_total", "counter", "Solve requests per route", lambda s, l: [f"{p}_requests_total{{{l}}} {s.requests}"]),
+                ("errors_total", "counter", "Failed solve requests per route", lambda s, l: [f"{p}_errors_total{{{l}}} {s.errors}"]),
+                ("request_duration_seconds", "histogram", "Solve latency per route",
+                 lambda s, l: s.latency.render(f"{p}_request_duration_seconds", l)),
+                ("request_size_bytes", "histogram", "Solve request payload size per route",
+                 lambda s, l: s.request_size.render(f"{p}_request_size_bytes", l)),
+                ("response_size_bytes", "histogram", "Solve response payload size per route",
+                 lambda s, l: s.response_size.render(f"{p}_response_size_bytes", l)),
+            ]
+            lines = [
+                f"# HELP {p}_start_time_seconds Start time of the process",
+                f"# TYPE {p}_start_time_seconds gauge",
+                f"{p}_start_time_seconds {self.started:.3f}",
+            ]
+            for name, kind, help_text, render in sections:
+                lines.append(f"# HELP {p}_{name} {help_text}")
+                lines.append(f"# TYPE {p}_{name} {kind}")
+                for route, stats in routes:
+                    lines.extend(render(stats, f'route="{route}"'))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,309 @@
+"""Vectorized NURBS evaluation with NumPy
+
+rhino3dm evaluates one parameter per call. These evaluators read the
+knots, weights and control points of a NURBS once and evaluate many
+parameters at a time with B-spline basis function matrices.
+
+opennurbs stores knot vectors without the two superfluous end knots
+and control points in homogeneous form (x*w, y*w, z*w, w), which is
+what rhino3dm returns too.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from math import comb
+
+import numpy as np
+
+
+def full_knots(knots):
+    """opennurbs knot vector to the textbook one (one extra knot per end)"""
+    knots = np.asarray(knots, dtype=float)
+    return np.concatenate(([knots[0]], knots, [knots[-1]]))
+
+
+def basis_derivatives(knots, degree, count, params, derivs=0):
+    """Non-zero basis functions and their derivatives at many parameters
+
+    knots is the full knot vector. Returns (spans, ders) where ders has
+    shape (derivs + 1, len(params), degree + 1) and ders[k, i, r] is the
+    k-th derivative of basis function spans[i] - degree + r at
+    params[i] (The NURBS Book, A2.3, over all parameters at once).
+    """
+    t = np.asarray(params, dtype=float)
+    n = len(t)
+    p = degree
+    spans = np.clip(np.searchsorted(knots, t, side="right") - 1, p, count - 1)
+
+    ndu = np.empty((p + 1, p + 1, n))
+    ndu[0, 0] = 1.0
+    left = np.empty((p + 1, n))
+    right = np.empty((p + 1, n))
+    for j in range(1, p + 1):
+        left[j] = t - knots[spans + 1 - j]
+        right[j] = knots[spans + j] - t
+        saved = np.zeros(n)
+        for r in range(j):
+            ndu[j, r] = right[r + 1] + left[j - r]
+            temp = ndu[r, j - 1] / ndu[j, r]
+            ndu[r, j] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        ndu[j, j] = saved
+
+    ders = np.zeros((derivs + 1, n, p + 1))
+    ders[0] = ndu[:, p].T
+    a = np.zeros((2, p + 1, n))
+    for r in range(p + 1):
+        s1, s2 = 0, 1
+        a[0, 0] = 1.0
+        for k in range(1, derivs + 1):
+            d = np.zeros(n)
+            rk, pk = r - k, p - k
+            if r >= k:
+                a[s2, 0] = a[s1, 0] / ndu[pk + 1, rk]
+                d = a[s2, 0] * ndu[rk, pk]
+            j1 = 1 if rk >= -1 else -rk
+            j2 = k - 1 if r - 1 <= pk else p - r
+            for j in range(j1, j2 + 1):
+                a[s2, j] = (a[s1, j] - a[s1, j - 1]) / ndu[pk + 1, rk + j]
+                d = d + a[s2, j] * ndu[rk + j, pk]
+            if r <= pk:
+                a[s2, k] = -a[s1, k - 1] / ndu[pk + 1, r]
+                d = d + a[s2, k] * ndu[r, pk]
+            ders[k, :, r] = d
+            s1, s2 = s2, s1
+
+    factor = p
+    for k in range(1, derivs + 1):
+        ders[k] *= factor
+        factor *= p - k
+    return spans, ders
+
+
+def basis_matrices(knots, degree, count, params, derivs=0):
+    """Dense (len(params), count) basis matrices, one per derivative"""
+    spans, ders = basis_derivatives(knots, degree, count, params, derivs)
+    n = len(spans)
+    rows = np.repeat(np.arange(n), degree + 1)
+    cols = (spans[:, None] - degree + np.arange(degree + 1)).ravel()
+    matrices = np.zeros((derivs + 1, n, count))
+    for k in range(derivs + 1):
+        matrices[k, rows, cols] = ders[k].ravel()
+    return matrices
+
+
+def _rational_derivatives(hom, count):
+    """Euclidean derivatives from homogeneous ones (The NURBS Book, eq. 4.8)"""
+    w = hom[..., 3:]
+    ders = []
+    for k in range(count + 1):
+        value = hom[k, ..., :3].copy()
+        for i in range(1, k + 1):
+            value -= comb(k, i) * w[i] * ders[k - i]
+        ders.append(value / w[0])
+    return np.stack(ders)
+
+
+class CurveEvaluator:
+    """Evaluates a NurbsCurve at many parameters"""
+
+    def __init__(self, curve):
+        self.degree = curve.Degree
+        self.knots = full_knots(curve.Knots.ToList())
+        self.domain = (curve.Domain.T0, curve.Domain.T1)
+        points = curve.Points
+        self.points = np.array([(p.X, p.Y, p.Z, p.W) for p in (points[i] for i in range(len(points)))])
+        self.count = len(self.points)
+
+    def derivatives(self, params, count=0):
+        """(count + 1, len(params), 3) array: positions then derivatives"""
+        spans, ders = basis_derivatives(self.knots, self.degree, self.count, params, count)
+        index = spans[:, None] - self.degree + np.arange(self.degree + 1)
+        hom = np.matmul(ders[:, :, None, :], self.points[index])[:, :, 0]
+        return _rational_derivatives(hom, count)
+
+
+def as_surface(geometry):
+    """The surface itself, or the surface of a single face brep
+
+    Raises ValueError for breps with several faces.
+    """
+    faces = getattr(geometry, "Faces", None)
+    if faces is None:
+        return geometry
+    if len(faces) != 1:
+        raise ValueError(f"Expected a single face brep, got {len(faces)} faces")
+    return faces[0].UnderlyingSurface()
+
+
+def as_nurbs_surface(geometry):
+    """NurbsSurface for a surface or a single face brep"""
+    geometry = as_surface(geometry)
+    if hasattr(geometry, "KnotsU"):
+        return geometry
+    return geometry.ToNurbsSurface()
+
+
+def _domain(srf):
+    return (srf.Domain(0).T0, srf.Domain(0).T1), (srf.Domain(1).T0, srf.Domain(1).T1)
+
+
+class SurfaceEvaluator:
+    """Evaluates a NURBS surface on parameter grids
+
+    grid() and grid_params() use the parameters of the surface given,
+    like PointAt. Spheres, revolved surfaces and other non-NURBS
+    surfaces are parameterized differently from their NURBS form, so
+    their parameters are converted first; the conversion is separate
+    in U and V. nurbs_grid() takes NURBS form parameters directly.
+    """
+
+    def __init__(self, surface):
+        surface = as_surface(surface)
+        srf = as_nurbs_surface(surface)
+        # NurbsSurfaces need no conversion
+        self.surface = None if srf is surface else surface
+        self.degree = (srf.OrderU - 1, srf.OrderV - 1)
+        self.count = (srf.Points.CountU, srf.Points.CountV)
+        self.knots = (full_knots(srf.KnotsU.ToList()), full_knots(srf.KnotsV.ToList()))
+        self.nurbs_domain = _domain(srf)
+        self.domain = _domain(surface)
+        cu, cv = self.count
+        points = np.empty((cu, cv, 4))
+        for i in range(cu):
+            for j in range(cv):
+                p = srf.Points.GetControlPoint(i, j)
+                points[i, j] = (p.X, p.Y, p.Z, p.W)
+        self.points = points
+        self.rational = bool(srf.IsRational)
+
+    def grid_params(self, u_count, v_count):
+        """Evenly spaced surface parameters over the domain, ends included"""
+        (u0, u1), (v0, v1) = self.domain
+        return np.linspace(u0, u1, u_count), np.linspace(v0, v1, v_count)
+
+    def nurbs_parameters(self, u, v):
+        """Surface parameters to NURBS form parameters, per direction"""
+        u = np.asarray(u, dtype=float).ravel()
+        v = np.asarray(v, dtype=float).ravel()
+        if self.surface is None:
+            return u, v
+        convert = self.surface.GetNurbsFormParameterFromSurfaceParameter
+        u0, v0 = self.domain[0][0], self.domain[1][0]
+        return (
+            np.array([convert(t, v0)[1] for t in u.tolist()]),
+            np.array([convert(u0, t)[2] for t in v.tolist()]),
+        )
+
+    def grid(self, u, v, derivs=1):
+        """Positions and partial derivatives on the grid u x v
+
+        u and v are surface parameters. Returns a dict of
+        (len(u), len(v), 3) arrays: "S", plus "Su" and "Sv" for
+        derivs >= 1 and "Suu", "Suv", "Svv" for derivs 2. Derivatives
+        are those of the NURBS form, which point the same way as the
+        surface's own, so frames, normals and curvature agree.
+        """
+        return self.nurbs_grid(*self.nurbs_parameters(u, v), derivs=derivs)
+
+    def nurbs_grid(self, u, v, derivs=1):
+        """grid() at NURBS form parameters"""
+        Bu = basis_matrices(self.knots[0], self.degree[0], self.count[0], u, derivs)
+        Bv = basis_matrices(self.knots[1], self.degree[1], self.count[1], v, derivs)
+        names = {(0, 0): "S", (1, 0): "Su", (0, 1): "Sv", (2, 0): "Suu", (1, 1): "Suv", (0, 2): "Svv"}
+        # homogeneous derivatives A(k, l) = Bu[k] . P . Bv[l]^T
+        hom = {}
+        for k, l in names:
+            if k + l <= derivs:
+                hom[(k, l)] = np.einsum("ai,ijc,bj->abc", Bu[k], self.points, Bv[l], optimize=True)
+
+        w = {key: value[..., 3:] for key, value in hom.items()}
+        out = {}
+        # rational derivatives, The NURBS Book eq. 4.20
+        for (k, l) in sorted(hom, key=sum):
+            value = hom[(k, l)][..., :3].copy()
+            for i in range(k + 1):
+                for j in range(l + 1):
+                    if i == 0 and j == 0:
+                        continue
+                    value -= comb(k, i) * comb(l, j) * w[(i, j)] * out[(k - i, l - j)]
+            out[(k, l)] = value / w[(0, 0)]
+        return {names[key]: value for key, value in out.items()}
+
+
+def frames(Su, Sv):
+    """Surface frames from partial derivatives, as rhino FrameAt
+
+    X is the unit U direction, Z the unit normal and Y = Z x X.
+    Returns (success, X, Y, Z) where success is False where the
+    surface is singular.
+    """
+    normal = np.cross(Su, Sv)
+    n_len = np.linalg.norm(normal, axis=-1, keepdims=True)
+    x_len = np.linalg.norm(Su, axis=-1, keepdims=True)
+    success = (n_len[..., 0] > 1e-12) & (x_len[..., 0] > 1e-12)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Z = np.where(n_len > 1e-12, normal / n_len, 0.0)
+        X = np.where(x_len > 1e-12, Su / x_len, 0.0)
+    Y = np.cross(Z, X)
+    return success, X, Y, Z
+
+
+def curvatures(Su, Sv, Suu, Suv, Svv):
+    """Unit normals, Gaussian and mean curvature from partial derivatives
+
+    Uses the first and second fundamental forms with the normal
+    Su x Sv, as opennurbs does, so the mean curvature is negative where
+    the surface bends away from its normal (-1/r on a sphere with
+    outward normals). Returns (success, normals, gaussian, mean);
+    singular points fail and get zeros.
+    """
+    normal = np.cross(Su, Sv)
+    n_len = np.linalg.norm(normal, axis=-1, keepdims=True)
+    success = n_len[..., 0] > 1e-12
+    dot = lambda a, b: np.einsum("...i,...i->...", a, b)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normal = np.where(success[..., None], normal / n_len, 0.0)
+        e, f, g = dot(Su, Su), dot(Su, Sv), dot(Sv, Sv)
+        l, m, n = dot(Suu, normal), dot(Suv, normal), dot(Svv, normal)
+        det = e * g - f * f
+        gaussian = np.where(success, (l * n - m * m) / det, 0.0)
+        mean = np.where(success, (e * n - 2.0 * f * m + g * l) / (2.0 * det), 0.0)
+    return success, normal, gaussian, mean
+
+
+def curvature_grid(evaluator, u, v, workers=1, block=1 << 16):
+    """Points, normals, Gaussian and mean curvature on the grid u x v
+
+    The grid is evaluated in blocks of U rows of about `block` points,
+    which bounds the memory of the second derivatives, on up to
+    `workers` threads; NumPy releases the GIL in the products. Returns
+    (success, points, normals, gaussian, mean), U major, as
+    (len(u) * len(v), ...) arrays.
+    """
+    u = np.asarray(u, dtype=float)
+    v = np.asarray(v, dtype=float)
+    rows = max(1, block // max(len(v), 1))
+    count = len(u) * len(v)
+    success = np.zeros(count, dtype=bool)
+    points = np.zeros((count, 3))
+    normals = np.zeros((count, 3))
+    gaussian = np.zeros(count)
+    mean = np.zeros(count)
+
+    def evaluate(start):
+        d = evaluator.grid(u[start:start + rows], v, derivs=2)
+        ok, nor, k, h = curvatures(d["Su"], d["Sv"], d["Suu"], d["Suv"], d["Svv"])
+        out = slice(start * len(v), start * len(v) + ok.size)
+        success[out] = ok.ravel()
+        points[out] = d["S"].reshape(-1, 3)
+        normals[out] = nor.reshape(-1, 3)
+        gaussian[out] = k.ravel()
+        mean[out] = h.ravel()
+
+    starts = range(0, len(u), rows)
+    if workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(min(workers, len(starts))) as pool:
+            list(pool.map(evaluate, starts))
+    else:
+        for start in starts:
+            evaluate(start)
+    return success, points, normals, gaussian, mean
@@ -0,0 +1,64 @@
+"""Extra per-component options for hops.component
+
+ghhops_server.HopsBase.component only accepts the metadata it knows
+about. install() wraps it so components can also pass keyword options
+such as `cache=False` or `stream=True`; they are kept on the registered HopsComponent
+and read back with option().
+"""
+import inspect
+import os.path as op
+
+
+_HOPS_ARGS = (
+    "rule",
+    "name",
+    "nickname",
+    "description",
+    "category",
+    "subcategory",
+    "icon",
+    "inputs",
+    "outputs",
+)
+
+
+def install(hops):
+    """Make hops.component accept extra keyword options"""
+    if getattr(hops.component, "accepts_options", False):
+        return hops
+    register = hops.component
+
+    def component(*args, **kwargs):
+        options = {k: kwargs.pop(k) for k in list(kwargs) if k not in _HOPS_ARGS}
+        bound = dict(zip(_HOPS_ARGS, args), **kwargs)
+
+        # the wrapped decorator resolves relative icons next to its caller,
+        # which is now this module. resolve them against the real caller
+        icon = bound.get("icon")
+        if icon and not op.isabs(icon):
+            caller = inspect.getmodule(inspect.stack()[1][0])
+            if caller and getattr(caller, "__file__", None):
+                sidecar = op.join(op.dirname(caller.__file__), icon)
+                if op.exists(sidecar) and not op.exists(icon):
+                    bound["icon"] = sidecar
+
+        def __func_wrapper__(comp_func):
+            register(**bound)(comp_func)
+            uri = bound.get("rule") or "/" + (bound.get("name") or comp_func.__qualname__)
+            # a streamed response can be sent once only
+            if options.get("stream"):
+                options.setdefault("cache", False)
+                options.setdefault("coalesce", False)
+            hops._components[uri].options = options
+            return comp_func
+
+        return __func_wrapper__
+
+    component.accepts_options = True
+    hops.component = component
+    return hops
+
+
+def option(comp, name, default=None):
+    """Read a keyword option given to hops.component"""
+    return getattr(comp, "options", {}).get(name, default)
@@ -0,0 +1,95 @@
+"""Many planes at once, for point classification and slicing
+
+PlaneSet keeps M planes as unit normals n and offsets d, so the signed
+distance of a point p is n.p + d, and evaluates all points against all
+planes as one matrix product. Point arrays are processed in chunks, so
+millions of points never need the full (N, M) matrix in memory unless
+it is asked for.
+
+Planes with a zero normal (a degenerate equation or normal) are marked
+invalid: their distances are NaN and no point counts as on either side.
+"""
+import numpy as np
+
+
+class PlaneSet:
+    """M planes as unit normals and offsets"""
+
+    def __init__(self, normals, offsets, origins=None):
+        normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        offsets = np.asarray(offsets, dtype=float).ravel()
+        length = np.linalg.norm(normals, axis=1)
+        self.valid = length > 0.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.where(self.valid, 1.0 / length, np.nan)
+        self.normals = normals * scale[:, None]
+        self.offsets = offsets * scale
+        if origins is None:
+            # the point of each plane closest to the world origin
+            origins = -self.normals * self.offsets[:, None]
+        self.origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.normals)
+
+    @classmethod
+    def from_equations(cls, equations):
+        """Planes Ax + By + Cz + D = 0 from an (M, 4) array of A, B, C, D"""
+        equations = np.asarray(equations, dtype=float).reshape(-1, 4)
+        return cls(equations[:, :3], equations[:, 3])
+
+    @classmethod
+    def from_origins_normals(cls, origins, normals):
+        """Planes through origins, (M, 3) each"""
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        return cls(normals, -np.einsum("ij,ij->i", origins, normals), origins)
+
+    @property
+    def equations(self):
+        """(M, 4) normalized A, B, C, D"""
+        return np.column_stack((self.normals, self.offsets))
+
+    def iter_distances(self, points, chunk_size=1 << 16):
+        """Yield (start, (n, M) signed distances) for chunks of points"""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        for start in range(0, len(points), chunk_size):
+            yield start, points[start:start + chunk_size] @ self.normals.T + self.offsets
+
+    def distances(self, points, chunk_size=1 << 16):
+        """(N, M) signed distances of every point to every plane"""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        out = np.empty((len(points), len(self)))
+        for start, block in self.iter_distances(points, chunk_size):
+            out[start:start + len(block)] = block
+        return out
+
+    def sides(self, points, tolerance=0.0, chunk_size=1 << 16):
+        """(N, M) int8: 1 above, -1 below, 0 within tolerance (or invalid plane)"""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        out = np.zeros((len(points), len(self)), dtype=np.int8)
+        for start, block in self.iter_distances(points, chunk_size):
+            out[start:start + len(block)] = _sides(block, tolerance)
+        return out
+
+    def classify(self, points, tolerance=0.0, chunk_size=1 << 16):
+        """distances() and sides() together, from one pass over the points"""
+        distances = self.distances(points, chunk_size)
+        return distances, _sides(distances, tolerance)
+
+    def side_counts(self, points, tolerance=0.0, chunk_size=1 << 16):
+        """(M, 3) counts of points below, on and above each plane"""
+        counts = np.zeros((len(self), 3), dtype=np.int64)
+        for _, block in self.iter_distances(points, chunk_size):
+            sides = _sides(block, tolerance)
+            counts[:, 0] += (sides < 0).sum(axis=0)
+            counts[:, 2] += (sides > 0).sum(axis=0)
+            counts[:, 1] += (np.abs(block) <= tolerance).sum(axis=0)
+        return counts
+
+
+def _sides(distances, tolerance):
+    with np.errstate(invalid="ignore"):
+        above = distances > tolerance
+        below = distances < -tolerance
+    return above.astype(np.int8) - below.astype(np.int8)
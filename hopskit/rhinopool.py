@@ -0,0 +1,286 @@
+"""Pool of warm Rhino.Inside workers behind one hops server
+
+Loading Rhino.Inside takes seconds and the .NET runtime does not
+survive fork, so app_rhinside.py normally runs every RhinoCommon call
+in the one process that loaded it. RhinoPool keeps `workers` spawned
+processes that each import the component module (loading Rhino once)
+and answers hops requests from the parent, which never loads Rhino:
+
+- the component list comes from the first worker that is ready and is
+  served by the parent,
+- each solve goes to an idle worker over a pipe,
+- a worker that crashes or hangs is killed and replaced in the
+  background; a crashed request is retried once on another worker,
+- a worker past `max_requests` solves or `max_memory` bytes of resident
+  memory keeps serving until its replacement has loaded, then exits.
+"""
+import importlib
+import json
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+import traceback
+
+from ghhops_server.base import _HopsEncoder
+from ghhops_server.logger import hlogger
+from ghhops_server.middlewares import HopsDefault
+
+from hopskit.lazy import LazyComponent
+from hopskit.streaming import joined
+
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _rss():
+    """Resident memory of this process in bytes, None if unknown"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        import resource
+    except ImportError:
+        return None
+    # peak, not current, but good enough to notice a leak
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _worker_main(module, conn):
+    try:
+        hops = importlib.import_module(module).hops
+        comps = []
+        for comp in hops._components.values():
+            if comp not in comps:
+                comps.append(comp)
+        conn.send(("ready", json.dumps(comps, cls=_HopsEncoder)))
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+        return
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        uri, payload = job
+        try:
+            res, results = hops.solve(uri=uri, payload=payload)
+            results = joined(results)
+        except Exception as ex:
+            res, results = False, hops._return_with_err(str(ex))
+        conn.send((res, results, _rss()))
+
+
+class _Worker:
+    __slots__ = ("process", "conn", "requests", "started", "retiring", "stop", "dead", "busy")
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.requests = 0
+        self.started = time.monotonic()
+        # replacement requested / replacement ready, exit when idle
+        self.retiring = False
+        self.stop = False
+        self.dead = False
+        # handed to a request, not in the idle queue
+        self.busy = False
+
+
+class RhinoPool(HopsDefault):
+    """Hops server solving in a pool of Rhino.Inside worker processes
+
+    `module` is imported by every worker and must define `hops` with
+    the components registered, e.g. "app_rhinside".
+    """
+
+    def __init__(
+        self,
+        module,
+        workers=2,
+        max_requests=0,
+        max_memory=None,
+        timeout=300.0,
+        start_timeout=120.0,
+        poll_interval=1.0,
+    ):
+        super(RhinoPool, self).__init__()
+        self.module = module
+        self.size = workers
+        self.max_requests = max_requests
+        self.max_memory = max_memory
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = set()
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._closed = threading.Event()
+
+    def open(self):
+        """Start the workers, returns once one of them is ready"""
+        for _ in range(self.size):
+            self._replace()
+        threading.Thread(target=self._monitor, name="rhinopool-monitor", daemon=True).start()
+        if not self._ready.wait(self.start_timeout * 2):
+            raise RuntimeError(f"No Rhino worker started for {self.module}")
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            self._stop(worker)
+
+    def start(self, address="localhost", port=5000, debug=False):
+        self.open()
+        try:
+            super(RhinoPool, self).start(address, port, debug)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def stats(self):
+        with self._lock:
+            workers = list(self._workers)
+        return {
+            "workers": len(workers),
+            "idle": self._idle.qsize(),
+            "requests": [w.requests for w in workers],
+        }
+
+    def _replace(self, old=None):
+        if not self._closed.is_set():
+            threading.Thread(target=self._spawn, args=(old,), name="rhinopool-spawn", daemon=True).start()
+
+    def _spawn(self, old=None):
+        delay = 1.0
+        while not self._closed.is_set():
+            parent, child = self._context.Pipe()
+            process = self._context.Process(target=_worker_main, args=(self.module, child), daemon=True)
+            start = time.monotonic()
+            process.start()
+            child.close()
+            message = parent.recv() if parent.poll(self.start_timeout) else ("error", "start timed out")
+            if message[0] == "ready":
+                break
+            hlogger.error("Rhino worker failed to start: %s", message[1])
+            process.kill()
+            # don't spin when the module itself is broken
+            self._closed.wait(delay)
+            delay = min(delay * 2, 60.0)
+        else:
+            return
+
+        worker = _Worker(process, parent)
+        with self._lock:
+            self._workers.add(worker)
+            if not self._ready.is_set():
+                for metadata in json.loads(message[1]):
+                    placeholder = LazyComponent(self.module, metadata)
+                    self._components[placeholder.uri] = placeholder
+                self._ready.set()
+        hlogger.info("Rhino worker %s ready in %.1f s", process.pid, time.monotonic() - start)
+        self._idle.put(worker)
+        if old is not None:
+            with self._lock:
+                old.stop = True
+                idle = not old.busy
+            # an idle worker would wait for the next request to notice,
+            # a busy one stops when its request is done
+            if idle:
+                self._stop(old)
+
+    def _stop(self, worker, kill=False):
+        """Stop a worker, False when it was stopped already"""
+        with self._lock:
+            if worker.dead:
+                return False
+            worker.dead = True
+            self._workers.discard(worker)
+        try:
+            if kill:
+                worker.process.kill()
+            else:
+                worker.conn.send(None)
+        except OSError:
+            pass
+        # reap in the background, Rhino can take a while to shut down
+        threading.Thread(target=worker.process.join, args=(30,), daemon=True).start()
+        return True
+
+    def _kill(self, worker):
+        # the monitor and a request thread can both find the same worker
+        # dead, only the first one replaces it. a retiring worker has its
+        # replacement on the way already
+        if self._stop(worker, kill=True) and not worker.retiring:
+            self._replace()
+
+    def _monitor(self):
+        while not self._closed.wait(self.poll_interval):
+            with self._lock:
+                workers = list(self._workers)
+            for worker in workers:
+                if not worker.process.is_alive() and not worker.dead:
+                    hlogger.error("Rhino worker %s died, exit code %s", worker.process.pid, worker.process.exitcode)
+                    self._kill(worker)
+
+    def _get_idle(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            worker = self._idle.get(timeout=max(0.0, deadline - time.monotonic()))
+            with self._lock:
+                usable = not worker.dead and not worker.stop
+                worker.busy = usable
+            if usable:
+                return worker
+            self._stop(worker)
+
+    def _process_solve_request(self, comp, payload):
+        for _ in range(2):
+            try:
+                worker = self._get_idle()
+            except queue.Empty:
+                return False, self._return_with_err("No Rhino worker available")
+            try:
+                worker.conn.send((comp.uri, payload))
+                if not worker.conn.poll(self.timeout):
+                    hlogger.error("Rhino worker %s timed out on %s", worker.process.pid, comp.uri)
+                    self._kill(worker)
+                    return False, self._return_with_err("Rhino worker timed out")
+                res, results, rss = worker.conn.recv()
+            except (EOFError, OSError):
+                hlogger.error("Rhino worker %s crashed on %s", worker.process.pid, comp.uri)
+                self._kill(worker)
+                continue
+
+            worker.requests += 1
+            worn = self.max_requests and worker.requests >= self.max_requests
+            leaking = self.max_memory and rss and rss > self.max_memory
+            if (worn or leaking) and not worker.retiring:
+                hlogger.info(
+                    "Recycling Rhino worker %s after %s requests, %s bytes",
+                    worker.process.pid, worker.requests, rss,
+                )
+                worker.retiring = True
+                self._replace(worker)
+            with self._lock:
+                stop = worker.stop
+                worker.busy = False
+            if stop:
+                self._stop(worker)
+            else:
+                self._idle.put(worker)
+            return res, results
+        return False, self._return_with_err("Rhino worker crashed")
@@ -0,0 +1,123 @@
+"""Prefork multi-process server for Hops WSGI apps
+
+The flask debug server runs every solve in one process behind the GIL.
+serve_prefork() binds the listening socket once, then forks N workers
+that all accept from it. Whatever the app module imported before the
+call (rhino3dm, the registered components) is shared by every worker
+through fork.
+
+Workers are recycled gracefully: a worker exits after `max_requests`
+requests (with some jitter so they do not all restart together) or on
+SIGHUP to the master, finishing the request it is serving first, and
+the master starts a replacement.
+"""
+import os
+import random
+import signal
+import socket
+import time
+
+from werkzeug.serving import make_server
+
+from ghhops_server.logger import hlogger
+
+
+def _worker(app, sock, max_requests, poll_interval):
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_DFL)
+
+    host, port = sock.getsockname()[:2]
+    server = make_server(host, port, app, fd=sock.fileno())
+    # wake up regularly so a stop request is noticed between requests
+    server.timeout = poll_interval
+
+    served = 0
+    idle = []
+    server.handle_timeout = lambda: idle.append(True)
+    while not stopping and (not max_requests or served < max_requests):
+        server.handle_request()
+        if idle:
+            idle.clear()
+        else:
+            served += 1
+    hlogger.info("Worker %s exiting after %s requests", os.getpid(), served)
+
+
+def _spawn(app, sock, max_requests, poll_interval):
+    if max_requests:
+        max_requests += random.randint(0, max(1, max_requests // 10))
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _worker(app, sock, max_requests, poll_interval)
+        except Exception:
+            hlogger.exception("Worker %s crashed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve_prefork(app, host="127.0.0.1", port=5000, workers=None, max_requests=0, backlog=128, poll_interval=1.0):
+    """Serve a WSGI app from `workers` forked processes
+
+    workers: number of processes, defaults to the cpu count
+    max_requests: recycle a worker after this many requests, 0 never
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Prefork serving needs os.fork, it is not available on this platform")
+    workers = workers or os.cpu_count() or 1
+
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    hlogger.info("Starting %s hops workers on %s:%s", workers, host, port)
+
+    children = set()
+    state = {"running": True, "recycle": False}
+
+    def stop(*_):
+        state["running"] = False
+
+    def recycle(*_):
+        state["recycle"] = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGHUP, recycle)
+
+    try:
+        while state["running"]:
+            while len(children) < workers and state["running"]:
+                children.add(_spawn(app, sock, max_requests, poll_interval))
+
+            if state["recycle"]:
+                state["recycle"] = False
+                hlogger.info("Recycling %s workers", len(children))
+                for pid in list(children):
+                    os.kill(pid, signal.SIGTERM)
+
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if not pid:
+                time.sleep(poll_interval / 4)
+                continue
+            children.discard(pid)
+            if status and state["running"]:
+                hlogger.error("Worker %s died with status %s, replacing it", pid, status)
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        sock.close()
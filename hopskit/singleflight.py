@@ -0,0 +1,79 @@
+"""Coalescing of identical in-flight solves
+
+Several Grasshopper clients opening the same definition send the same
+request to the same route at nearly the same moment. The solve cache
+only helps once the first of them has finished. SingleFlight makes the
+later ones wait for the solve that is already running and hands them
+its encoded response, so the work is done once.
+
+Requests are identical when their payload digests match, see
+hopskit.cache.payload_digest. Components opt out with
+`@hops.component(..., coalesce=False)`.
+"""
+import threading
+
+from hopskit import options
+from hopskit.cache import payload_digest
+
+
+class _Call:
+    __slots__ = ("done", "result")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class SingleFlight:
+    """Shares one solve between concurrent identical requests
+
+    Create it before the SolveCache. The cache then wraps it and
+    answers hits itself, so only cache misses are coalesced and
+    `solves` counts real solves. Created after the cache it would
+    also coalesce hits and count them as solves.
+    """
+
+    def __init__(self, hops, default=True):
+        self.hops = hops
+        self.default = default
+        self.leaders = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+        options.install(hops)
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        if not options.option(comp, "coalesce", self.default):
+            return self._process_solve_request(comp, payload)
+
+        key = payload_digest(comp.uri, payload)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            return call.result
+
+        try:
+            call.result = self._process_solve_request(comp, payload)
+        except BaseException as ex:
+            call.result = False, self.hops._return_with_err(str(ex))
+            raise
+        finally:
+            # later requests start a new solve, the response may be stale by then
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self):
+        with self._lock:
+            in_flight = len(self._calls)
+        return {"solves": self.leaders, "coalesced": self.coalesced, "in_flight": in_flight}
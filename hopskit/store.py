@@ -0,0 +1,227 @@
+"""Persistent solve results in SQLite
+
+SolveStore is the disk tier under SolveCache: encoded responses keyed
+by store version, payload digest and component version, in one SQLite
+file that survives restarts and can be shared by the processes of
+hopskit.serve_prefork. Each process opens its own connection on first
+use, SQLite connections must not cross a fork. Nothing is loaded up
+front; a memory miss looks the key up on disk and a hit is promoted
+back into memory.
+
+The store version is HOPS_CACHE_VERSION or a digest of the hopskit
+sources, so results computed by an older hopskit are never served.
+
+The total size is kept in the file itself, so every process sees the
+same bound, and the least recently used entries are evicted once it
+is exceeded. Database errors are logged and count as misses, a broken
+store never fails a solve.
+"""
+import hashlib
+import inspect
+import os
+import os.path as op
+import sqlite3
+import threading
+import time
+
+from ghhops_server.logger import hlogger
+
+from hopskit import options
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solves (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solves_used ON solves (used);
+CREATE TABLE IF NOT EXISTS meta (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES (0, (SELECT COALESCE(SUM(size), 0) FROM solves));
+"""
+
+
+def package_version():
+    """HOPS_CACHE_VERSION, else a digest of the hopskit sources"""
+    version = os.environ.get("HOPS_CACHE_VERSION")
+    if version:
+        return version
+    root = op.dirname(op.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(root)):
+        if name.endswith(".py"):
+            digest.update(name.encode("utf-8"))
+            with open(op.join(root, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def component_version(comp):
+    """`version` option of a component, else a digest of its code
+
+    The digest covers the module that defines the handler, helpers
+    next to it included, and the outputs, so editing them retires the
+    results of the old code. Pass `@hops.component(..., version="2")`
+    when a change elsewhere changes its results.
+    """
+    version = options.option(comp, "version")
+    if version is not None:
+        return str(version)
+    handler = getattr(comp, "handler", None)
+    try:
+        source = inspect.getsource(inspect.getmodule(handler) or handler)
+    except (OSError, TypeError):
+        code = getattr(handler, "__code__", None)
+        source = repr((code.co_code, code.co_consts)) if code else ""
+    digest = hashlib.sha256(source.encode("utf-8"))
+    for param in comp.outputs:
+        digest.update(f"{type(param).__name__}:{param.name}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class SolveStore:
+    """SQLite table of encoded solve results bounded by total size
+
+    Eviction removes the least recently used entries until the store
+    is back under `low_water` times `max_bytes`, so it runs rarely.
+    `version` is part of every key, package_version() by default.
+    """
+
+    def __init__(self, path, max_bytes=1 * 2**30, low_water=0.9, version=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.version = version or package_version()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        # counters are updated from several request threads
+        self._lock = threading.Lock()
+        # pid -> (connection, lock), connections of a parent process stay
+        # referenced but unused in a forked child
+        self._connections = {}
+
+    def _connection(self):
+        """(connection, lock) of this process, opened on first use"""
+        pid = os.getpid()
+        connection = self._connections.get(pid)
+        if connection is None:
+            # explicit transactions, see put()
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            connection = self._connections.setdefault(pid, (db, threading.Lock()))
+            if connection[0] is not db:
+                # another thread got there first
+                db.close()
+        return connection
+
+    def get(self, key, default=None):
+        key = f"{self.version}:{key}"
+        try:
+            db, lock = self._connection()
+            with lock:
+                row = db.execute("SELECT value FROM solves WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    db.execute("UPDATE solves SET used = ? WHERE key = ?", (time.time(), key))
+        except sqlite3.Error as ex:
+            self._failed("read", ex)
+            return default
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return row[0]
+
+    def put(self, key, value):
+        key = f"{self.version}:{key}"
+        size = len(value)
+        if size > self.max_bytes:
+            return False
+        try:
+            db, lock = self._connection()
+            with lock:
+                # IMMEDIATE takes the write lock up front, so processes
+                # sharing the file update the size total one at a time
+                db.execute("BEGIN IMMEDIATE")
+                try:
+                    row = db.execute("SELECT size FROM solves WHERE key = ?", (key,)).fetchone()
+                    db.execute(
+                        "INSERT OR REPLACE INTO solves VALUES (?, ?, ?, ?)", (key, value, size, time.time())
+                    )
+                    total = self._add_bytes(db, size - (row[0] if row else 0))
+                    if total > self.max_bytes:
+                        self._evict(db, total - int(self.max_bytes * self.low_water))
+                    db.execute("COMMIT")
+                except BaseException:
+                    db.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as ex:
+            self._failed("write", ex)
+            return False
+        return True
+
+    def _add_bytes(self, db, delta):
+        db.execute("UPDATE meta SET bytes = bytes + ? WHERE id = 0", (delta,))
+        return db.execute("SELECT bytes FROM meta WHERE id = 0").fetchone()[0]
+
+    def _evict(self, db, excess):
+        freed, keys = 0, []
+        for key, size in db.execute("SELECT key, size FROM solves ORDER BY used"):
+            if freed >= excess:
+                break
+            keys.append((key,))
+            freed += size
+        db.executemany("DELETE FROM solves WHERE key = ?", keys)
+        self._add_bytes(db, -freed)
+        with self._lock:
+            self.evictions += len(keys)
+
+    def _failed(self, action, ex):
+        with self._lock:
+            self.errors += 1
+        hlogger.warning("Solve store %s failed on %s: %s", action, self.path, ex)
+
+    def clear(self):
+        db, lock = self._connection()
+        with lock:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute("DELETE FROM solves")
+            db.execute("UPDATE meta SET bytes = 0 WHERE id = 0")
+            db.execute("COMMIT")
+
+    def close(self):
+        """Close the connection of this process"""
+        connection = self._connections.pop(os.getpid(), None)
+        if connection is not None:
+            with connection[1]:
+                connection[0].close()
+
+    def stats(self):
+        """Counters for sizing the store"""
+        try:
+            db, lock = self._connection()
+            with lock:
+                entries = db.execute("SELECT COUNT(*) FROM solves").fetchone()[0]
+                size = db.execute("SELECT bytes FROM meta WHERE id = 0").fetchone()[0]
+        except sqlite3.Error:
+            entries = size = None
+        with self._lock:
+            hits, misses, evictions, errors = self.hits, self.misses, self.evictions, self.errors
+        lookups = hits + misses
+        return {
+            "path": self.path,
+            "version": self.version,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "evictions": evictions,
+            "errors": errors,
+        }
@@ -0,0 +1,135 @@
+"""Streamed solve responses for very large outputs
+
+ghhops_server builds every output as one list of items and encodes the
+whole response as one JSON string, so a few million points take
+gigabytes before the first byte is sent. A component registered with
+`@hops.component(..., stream=True)` may return generators for list
+outputs instead. Streaming solves such components itself and returns a
+StreamedOutputs, which encodes the response chunk by chunk while it is
+being sent. Only one chunk of items exists at a time.
+
+Generators work with HopsPointArray and friends (chunks are arrays) and
+with the stock params (chunks are lists of values). Streamed responses
+are always JSON and are neither cached nor coalesced. Whole-tree
+requests still go through TreeSolver and are encoded in one piece.
+
+Streaming has to sit below TreeSolver, so create it first.
+"""
+import json
+import sys
+import traceback
+import types
+
+import ghhops_server as hs
+
+from hopskit import options
+
+
+CHUNK_BYTES = 64 * 1024
+
+
+def _encode(value):
+    return json.dumps(value, cls=hs.base._HopsEncoder)
+
+
+class StreamedOutputs:
+    """Solve response that is encoded while it is sent
+
+    Iterating yields the utf-8 JSON response in chunks of about
+    `chunk_bytes` and can be done once. An error raised by a generator
+    half way ends the values early and is reported in "errors".
+    Callables in on_close get (bytes sent, ok) when it is done.
+    """
+
+    def __init__(self, comp, returned, chunk_bytes=CHUNK_BYTES):
+        self.comp = comp
+        self.returned = returned
+        self.chunk_bytes = chunk_bytes
+        self.size = 0
+        self.ok = True
+        self.on_close = []
+
+    def _parts(self):
+        tail = "]}"
+        try:
+            yield '{"values": ['
+            for i, (param, value) in enumerate(zip(self.comp.outputs, self.returned)):
+                separator = ", " if i else ""
+                if not isinstance(value, types.GeneratorType):
+                    yield separator + _encode(param.from_result(value))
+                    continue
+                yield separator + '{"ParamName": %s, "InnerTree": {"0": [' % json.dumps(param.name)
+                tail = "]}}]}"
+                first = True
+                for chunk in value:
+                    items = param.from_result(chunk)["InnerTree"]["0"]
+                    if items:
+                        text = _encode(items)[1:-1]
+                        yield text if first else ", " + text
+                        first = False
+                tail = "]}"
+                yield "]}}"
+            yield tail
+        except Exception as ex:
+            self.ok = False
+            _, _, exc_traceback = sys.exc_info()
+            ex_msg = str(ex) + "\n" + "\n".join(traceback.format_tb(exc_traceback)[1:])
+            yield tail[:-1] + ', "errors": %s}' % _encode(["Exception occured in handler:\n%s" % ex_msg])
+
+    def __iter__(self):
+        buffer, buffered = [], 0
+        try:
+            for part in self._parts():
+                buffer.append(part)
+                buffered += len(part)
+                if buffered >= self.chunk_bytes:
+                    data = "".join(buffer).encode("utf-8")
+                    buffer, buffered = [], 0
+                    self.size += len(data)
+                    yield data
+            if buffer:
+                data = "".join(buffer).encode("utf-8")
+                self.size += len(data)
+                yield data
+        finally:
+            for callback in self.on_close:
+                callback(self.size, self.ok)
+
+    def read(self):
+        """The whole response as one string"""
+        return b"".join(self).decode("utf-8")
+
+
+def joined(results):
+    """Solve results as a string, for callers that can not stream"""
+    if isinstance(results, StreamedOutputs):
+        return results.read()
+    return results
+
+
+class Streaming:
+    """Solves stream=True components into a StreamedOutputs"""
+
+    def __init__(self, hops, chunk_bytes=CHUNK_BYTES):
+        options.install(hops)
+        self.hops = hops
+        self.chunk_bytes = chunk_bytes
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        if not options.option(comp, "stream"):
+            return self._process_solve_request(comp, payload)
+
+        res, inputs = self.hops._prepare_inputs(comp, payload)
+        if not res:
+            return res, self.hops._return_with_err("Bad inputs")
+        try:
+            returned = self.hops._solve(comp, inputs)
+        except Exception as solve_ex:
+            _, _, exc_traceback = sys.exc_info()
+            ex_msg = str(solve_ex) + "\n" + "\n".join(traceback.format_tb(exc_traceback)[1:])
+            return False, self.hops._return_with_err("Exception occured in handler:\n%s" % ex_msg)
+        if not isinstance(returned, tuple):
+            returned = (returned,)
+        return True, StreamedOutputs(comp, returned, self.chunk_bytes)
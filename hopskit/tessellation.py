@@ -0,0 +1,138 @@
+"""Cached curve tessellations with arc length tables
+
+CurveTessellation samples a curve a few times per knot span and stores
+the polyline together with the arc length from the start to every
+sample, integrated once with Gauss-Legendre quadrature. Lengths and
+parameters at a length are then a binary search into that table plus a
+short Newton solve inside one interval, instead of integrating the
+whole curve again.
+
+All evaluation runs on the NURBS form of the curve with
+hopskit.nurbs.CurveEvaluator. Parameters handed out are converted back
+to the curve's own parameterization (arcs and ellipses differ).
+
+TessellationCache keeps tessellations keyed by curve digest.
+"""
+import numpy as np
+
+from hopskit.cache import LRUCache
+from hopskit.curves import curve_parameters, nurbs_parameters
+from hopskit.geometry import geometry_digest
+from hopskit.nurbs import CurveEvaluator
+
+
+_GAUSS_X, _GAUSS_W = np.polynomial.legendre.leggauss(5)
+
+
+def span_parameters(curve, samples_per_span=None):
+    """Increasing sample parameters, dense enough to tessellate the curve"""
+    nurbs = curve.ToNurbsCurve() if hasattr(curve, "ToNurbsCurve") else curve
+    degree = nurbs.Degree
+    domain = nurbs.Domain
+    knots = np.unique(np.clip(np.asarray(nurbs.Knots.ToList(), dtype=float), domain.T0, domain.T1))
+    if len(knots) < 2:
+        knots = np.array([domain.T0, domain.T1])
+    if samples_per_span is None:
+        samples_per_span = 1 if degree == 1 else max(8, 4 * degree)
+    steps = np.linspace(0.0, 1.0, samples_per_span + 1)[:-1]
+    spans = knots[:-1, None] + (knots[1:] - knots[:-1])[:, None] * steps
+    return np.append(spans.ravel(), knots[-1])
+
+
+class CurveTessellation:
+    """Polyline samples and cumulative arc length of one curve
+
+    params are NURBS form parameters, see curve_parameters().
+    """
+
+    def __init__(self, curve, samples_per_span=None):
+        self.curve = curve
+        # True when evaluation runs on a NURBS copy of the curve
+        self.converted = not hasattr(curve, "Knots")
+        nurbs = curve.ToNurbsCurve() if self.converted else curve
+        self.evaluator = CurveEvaluator(nurbs)
+        self.domain = self.evaluator.domain
+        # polylines are their own tessellation
+        self.linear = nurbs.Degree == 1 and not nurbs.IsRational
+        self.params = span_parameters(nurbs, samples_per_span)
+        self.points = self.evaluator.derivatives(self.params)[0]
+        self.lengths = np.concatenate(([0.0], np.cumsum(self._integrate(self.params[:-1], self.params[1:]))))
+        self.length = self.lengths[-1]
+
+    @property
+    def nbytes(self):
+        return self.params.nbytes + self.points.nbytes + self.lengths.nbytes + self.evaluator.points.nbytes
+
+    def _speed(self, params):
+        return np.linalg.norm(self.evaluator.derivatives(params, 1)[1], axis=-1)
+
+    def _integrate(self, a, b):
+        """Arc length between parameters a and b, elementwise"""
+        a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+        half = (b - a) * 0.5
+        nodes = (a + half)[:, None] + half[:, None] * _GAUSS_X
+        speed = self._speed(nodes.ravel()).reshape(nodes.shape)
+        return half * (speed @ _GAUSS_W)
+
+    def _interval(self, params):
+        i = np.searchsorted(self.params, params, side="right") - 1
+        return np.clip(i, 0, len(self.params) - 2)
+
+    def length_at(self, params):
+        """Arc length from the start to NURBS form parameters"""
+        t = np.clip(np.asarray(params, dtype=float), *self.domain)
+        i = self._interval(t)
+        return self.lengths[i] + self._integrate(self.params[i], t)
+
+    def parameters_at_length(self, lengths, iterations=4):
+        """NURBS form parameters at arc lengths from the start
+
+        Lengths are clamped to [0, length].
+        """
+        s = np.clip(np.asarray(lengths, dtype=float).ravel(), 0.0, self.length)
+        i = np.clip(np.searchsorted(self.lengths, s, side="right") - 1, 0, len(self.params) - 2)
+        t0, t1 = self.params[i], self.params[i + 1]
+        l0, span = self.lengths[i], self.lengths[i + 1] - self.lengths[i]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = np.where(span > 0, t0 + (s - l0) / span * (t1 - t0), t0)
+        if self.linear:
+            return t
+        tolerance = 1e-12 * max(self.length, 1.0)
+        active = np.arange(len(t))
+        for _ in range(iterations):
+            ta, a = t[active], t0[active]
+            f = l0[active] + self._integrate(a, ta) - s[active]
+            speed = self._speed(ta)
+            ok = speed > 0
+            t[active] = np.clip(ta - np.where(ok, f / np.where(ok, speed, 1.0), 0.0), a, t1[active])
+            active = active[np.abs(f) > tolerance]
+            if not len(active):
+                break
+        return t
+
+    def curve_parameters(self, params):
+        """NURBS form parameters to the curve's own parameters"""
+        return curve_parameters(self.curve, params)
+
+    def nurbs_parameters(self, params):
+        """The curve's own parameters to NURBS form parameters"""
+        return nurbs_parameters(self.curve, params)
+
+    def divide_length(self, segment_length):
+        """NURBS form parameters every segment_length along the curve, start included"""
+        if segment_length <= 0:
+            raise ValueError("Segment length must be positive")
+        count = int(np.floor(self.length / segment_length * (1 + 1e-12))) + 1
+        return self.parameters_at_length(np.arange(count) * segment_length)
+
+
+class TessellationCache(LRUCache):
+    """Memory bounded cache of CurveTessellation keyed by curve digest"""
+
+    def tessellate(self, curve, key=None):
+        key = key or geometry_digest(curve.Encode())
+        tessellation = self.get(key)
+        if tessellation is None:
+            tessellation = CurveTessellation(curve)
+            self.put(key, tessellation, tessellation.nbytes)
+        return tessellation
@@ -0,0 +1,136 @@
+"""Whole-tree solves for item access components
+
+ghhops_server only reads the first item of branch {0} for each input.
+TreeSolver reads whole data trees instead. It matches branches and
+items the way Grasshopper does (longest list, last value repeated)
+and returns output trees with the same branch paths. List outputs of
+branches holding several items are grafted, item i of branch {0} goes
+to {0;i}.
+
+A component can declare a batch handler with
+`@hops.component(..., batch=func)`. func gets one flat list per input,
+holding the aligned items of every branch, and returns one list per
+output. Components without one fall back to calling the handler once
+per item.
+
+TreeSolver has to sit below SolveCache, so create it first.
+"""
+import json
+import sys
+import traceback
+
+import ghhops_server as hs
+import numpy as np
+
+from hopskit import options
+from hopskit.arrays import _PackedParam
+
+
+def _sub_path(path, index):
+    """{0;1} and 2 to {0;1;2}"""
+    return "{%s;%d}" % (path.strip("{}"), index)
+
+
+class TreeSolver:
+    """Solve every branch and item of the input trees in one request"""
+
+    def __init__(self, hops):
+        options.install(hops)
+        self.hops = hops
+        self._process_solve_request = hops._process_solve_request
+        hops._process_solve_request = self
+
+    def __call__(self, comp, payload):
+        data = json.loads(payload)
+        trees = {item["ParamName"]: item.get("InnerTree", {}) for item in data.get("values", [])}
+        if not self._is_tree(comp, trees):
+            return self._process_solve_request(comp, payload)
+
+        try:
+            paths, args = self._match(comp, trees)
+            results = self._solve(comp, args)
+            return True, self._encode(comp, paths, results)
+        except Exception as solve_ex:
+            _, _, exc_traceback = sys.exc_info()
+            ex_msg = str(solve_ex) + "\n" + "\n".join(traceback.format_tb(exc_traceback)[1:])
+            return False, self.hops._return_with_err("Exception occured in handler:\n%s" % ex_msg)
+
+    def _is_tree(self, comp, trees):
+        # tree access inputs and single item requests go the stock way
+        if any(p.access == hs.HopsParamAccess.TREE for p in comp.inputs):
+            return False
+        if len(trees) != len(comp.inputs):
+            return False
+        for param in comp.inputs:
+            tree = trees.get(param.name, {})
+            if len(tree) > 1:
+                return True
+            if param.access == hs.HopsParamAccess.ITEM and any(len(b) > 1 for b in tree.values()):
+                return True
+        return False
+
+    def _match(self, comp, trees):
+        """Align input trees into flat per-input argument lists"""
+        branches = [list(trees[p.name].items()) for p in comp.inputs]
+        longest = max(branches, key=len)
+        paths = []
+        args = [[] for _ in comp.inputs]
+        for i, (path, _) in enumerate(longest):
+            # inputs with fewer branches repeat their last branch
+            picked = [b[min(i, len(b) - 1)] if b else (None, []) for b in branches]
+            values = []
+            for param, (_, items) in zip(comp.inputs, picked):
+                decoded = [param._coerce_value(item["type"], item["data"]) for item in items]
+                values.append(decoded)
+            items = max(
+                [len(v) for p, v in zip(comp.inputs, values) if p.access == hs.HopsParamAccess.ITEM] or [1]
+            )
+            for param, decoded, arg in zip(comp.inputs, values, args):
+                if param.access == hs.HopsParamAccess.ITEM:
+                    if not decoded:
+                        raise ValueError(f"Missing value for required input {param.name}")
+                    arg.extend(decoded[min(j, len(decoded) - 1)] for j in range(items))
+                else:
+                    arg.extend([decoded] * items)
+            paths.append((path, items))
+        return paths, args
+
+    def _solve(self, comp, args):
+        """One result list per output, aligned with the flat inputs"""
+        batch = options.option(comp, "batch")
+        if batch:
+            results = batch(*args)
+            if len(comp.outputs) == 1:
+                results = (results,)
+            # packed outputs keep their arrays, see _encode
+            return [r if isinstance(r, np.ndarray) else list(r) for r in results]
+
+        results = [[] for _ in comp.outputs]
+        for item_args in zip(*args):
+            returned = comp.handler(*item_args)
+            if not isinstance(returned, tuple):
+                returned = (returned,)
+            for out, value in zip(results, returned):
+                out.append(value)
+        return results
+
+    def _encode(self, comp, paths, results):
+        outputs = []
+        for out_param, values in zip(comp.outputs, results):
+            tree = {}
+            start = 0
+            packed = isinstance(out_param, _PackedParam) and isinstance(values, np.ndarray)
+            graft = out_param.access != hs.HopsParamAccess.ITEM
+            for path, items in paths:
+                if packed:
+                    # one row per item, written in one go
+                    tree.setdefault(path, []).extend(out_param._items(values[start:start + items]))
+                else:
+                    for i, value in enumerate(values[start:start + items]):
+                        # list results of several items get a branch each,
+                        # {path;i}, like grasshopper grafts them
+                        sub_path = _sub_path(path, i) if graft and items > 1 else path
+                        tree.setdefault(sub_path, []).extend(out_param.from_result(value)["InnerTree"]["0"])
+                start += items
+            outputs.append({"ParamName": out_param.name, "InnerTree": tree})
+        return json.dumps({"values": outputs}, cls=hs.base._HopsEncoder)
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+import rhino3dm
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client of the example app, every component registered"""
+    import app
+
+    return app.app.test_client()
+
+
+def item(value):
+    """Hops value item of a number, point, vector or rhino3dm geometry"""
+    if isinstance(value, bool):
+        return {"type": "System.Boolean", "data": json.dumps(value)}
+    if isinstance(value, int):
+        return {"type": "System.Int32", "data": str(value)}
+    if isinstance(value, float):
+        return {"type": "System.Double", "data": repr(value)}
+    if isinstance(value, (rhino3dm.Point3d, rhino3dm.Vector3d)):
+        data = json.dumps({"X": value.X, "Y": value.Y, "Z": value.Z})
+        return {"type": f"Rhino.Geometry.{type(value).__name__}", "data": data}
+    return {"type": f"Rhino.Geometry.{type(value).__name__}", "data": json.dumps(value.Encode())}
+
+
+def solve(client, pointer, **trees):
+    """POST /solve, each keyword is an input name and a {path: [values]} tree
+
+    Returns the response JSON with item data parsed.
+    """
+    values = [
+        {"ParamName": name, "InnerTree": {path: [item(v) for v in branch] for path, branch in tree.items()}}
+        for name, tree in trees.items()
+    ]
+    response = client.post("/solve", json={"pointer": pointer, "values": values})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.get_json()
+
+
+def output(result, name):
+    """{path: [parsed data]} of one output"""
+    for param in result["values"]:
+        if param["ParamName"] == name:
+            return {path: [json.loads(i["data"]) for i in items] for path, items in param["InnerTree"].items()}
+    raise KeyError(name)
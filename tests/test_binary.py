@@ -0,0 +1,68 @@
+"""HOPB payloads decode to the JSON payload they were encoded from"""
+import json
+
+import rhino3dm
+
+from hopskit import binary
+
+
+def _item(type_name, data):
+    return {"type": type_name, "data": data}
+
+
+def _point(x, y, z):
+    return _item("Rhino.Geometry.Point3d", json.dumps({"X": x, "Y": y, "Z": z}))
+
+
+def _payload():
+    curve = rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(1.0, 2.0, 3.0))
+    return {
+        "pointer": "/pointsat",
+        "warnings": [],
+        "values": [
+            {"ParamName": "Curve", "InnerTree": {"{0}": [_item("Rhino.Geometry.LineCurve", json.dumps(curve.Encode()))]}},
+            {"ParamName": "t", "InnerTree": {"{0}": [_item("System.Double", "0.1"), _item("System.Double", "0.25")]}},
+            {"ParamName": "Count", "InnerTree": {"{0;1}": [_item("System.Int32", "7")]}},
+            {"ParamName": "Flags", "InnerTree": {"{0}": [_item("System.Boolean", "true"), _item("System.Boolean", "false")]}},
+            {"ParamName": "Points", "InnerTree": {"{0}": [_point(1.5, -2.0, 1e-300), _point(0.0, 0.0, 0.0)], "{1}": []}},
+            {"ParamName": "Mixed", "InnerTree": {"{0}": [_item("System.Double", "2.5"), _item("System.String", "text")]}},
+        ],
+    }
+
+
+def _canonical(payload):
+    """Geometry data parsed, so formatting differences don't count"""
+    def data(item):
+        if item["type"].startswith("Rhino.Geometry."):
+            return json.loads(item["data"])
+        return item["data"]
+
+    payload = dict(payload)
+    payload["values"] = [
+        dict(param, InnerTree={
+            path: [(item["type"], data(item)) for item in items] for path, items in param["InnerTree"].items()
+        })
+        for param in payload["values"]
+    ]
+    return payload
+
+
+def test_round_trip():
+    payload = _payload()
+    data = binary.encode(json.dumps(payload))
+    assert binary.is_binary(data)
+    assert _canonical(binary.decode(data)) == _canonical(payload)
+
+
+def test_decoded_geometry():
+    payload = binary.decode(binary.encode(_payload()))
+    item = payload["values"][0]["InnerTree"]["{0}"][0]
+    curve = rhino3dm.CommonObject.Decode(json.loads(item["data"]))
+    assert curve.PointAtEnd.Z == 3.0
+
+
+def test_json_strings_stay_text():
+    texts = ['{"data": "not base64!", "b": 1}', '{"z": 1, "data": "AAAA"}', '{"data": 1}', "{"]
+    payload = {"values": [{"ParamName": "Text", "InnerTree": {"{0}": [_item("System.String", t) for t in texts]}}]}
+    decoded = binary.decode(binary.encode(payload))
+    assert [i["data"] for i in decoded["values"][0]["InnerTree"]["{0}"]] == texts
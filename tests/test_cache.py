@@ -0,0 +1,76 @@
+"""LRUCache bounds and SolveCache hits"""
+import ghhops_server as hs
+
+from hopskit import LRUCache, SolveCache, payload_digest
+
+
+def test_lru_bounds():
+    cache = LRUCache(max_entries=2, max_bytes=10)
+    cache.put("a", 1, 4)
+    cache.put("b", 2, 4)
+    assert cache.get("a") == 1
+    cache.put("c", 3, 4)
+    # over 10 bytes, b was used least recently
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+    assert not cache.put("d", 4, 11)
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 8, 1)
+
+
+def test_lru_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("hopskit.cache.time.monotonic", lambda: clock[0])
+    cache = LRUCache(ttl=5)
+    cache.put("a", 1)
+    clock[0] += 6
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_payload_digest_ignores_formatting():
+    a = payload_digest("/add", '{"values": [1, 2], "pointer": "/add"}')
+    b = payload_digest("/add", '{"pointer":"/add","values":[1,2]}')
+    assert a == b
+    assert payload_digest("/sub", '{"pointer":"/add","values":[1,2]}') != a
+
+
+def _hops(solves):
+    hops = hs.Hops()
+
+    def solve(comp, payload):
+        solves.append(payload)
+        return True, '{"values": [%d]}' % len(solves)
+
+    hops._process_solve_request = solve
+    return hops
+
+
+def _component(hops, cache=True):
+    @hops.component("/add", inputs=[hs.HopsNumber("A")], outputs=[hs.HopsNumber("B")], cache=cache)
+    def add(a):
+        return a
+
+    return hops._components["/add"]
+
+
+def test_hits_skip_the_solve():
+    solves = []
+    hops = _hops(solves)
+    cache = SolveCache(hops)
+    comp = _component(hops)
+    first = hops._process_solve_request(comp, '{"values": [1]}')
+    assert hops._process_solve_request(comp, '{ "values" : [1] }') == first
+    assert hops._process_solve_request(comp, '{"values": [2]}') != first
+    assert len(solves) == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_opt_out():
+    solves = []
+    hops = _hops(solves)
+    SolveCache(hops)
+    comp = _component(hops, cache=False)
+    hops._process_solve_request(comp, '{"values": [1]}')
+    hops._process_solve_request(comp, '{"values": [1]}')
+    assert len(solves) == 2
+
@@ -0,0 +1,38 @@
+"""classify_curve agrees with the rhino3dm predicates"""
+import numpy as np
+import pytest
+import rhino3dm
+
+from hopskit import CURVE_KINDS, classify_curve
+
+P = rhino3dm.Point3d
+
+
+def _free():
+    rng = np.random.default_rng(3)
+    return rhino3dm.Curve.CreateControlPointCurve([P(*p) for p in rng.uniform(-5.0, 5.0, (8, 3))], 3)
+
+
+# rhino3dm can not construct an ellipse to test
+CURVES = {
+    "Line": lambda: rhino3dm.LineCurve(P(0.0, 0.0, 0.0), P(1.0, 2.0, 3.0)),
+    "Polyline": lambda: rhino3dm.PolylineCurve([P(0.0, 0.0, 0.0), P(1.0, 0.0, 0.0), P(1.0, 1.0, 1.0)]),
+    "Circle": lambda: rhino3dm.Circle(P(1.0, 1.0, 0.0), 2.0).ToNurbsCurve(),
+    "Arc": lambda: rhino3dm.ArcCurve.CreateFromArc(rhino3dm.Arc(P(0.0, 0.0, 0.0), 3.0, 1.0)),
+    "Planar": lambda: rhino3dm.Curve.CreateControlPointCurve([P(0.0, 0.0, 0.0), P(1.0, 2.0, 0.0), P(3.0, -1.0, 0.0), P(4.0, 0.0, 0.0)], 3),
+    "Free": _free,
+}
+
+
+@pytest.mark.parametrize("kind", list(CURVES))
+def test_matches_predicates(kind):
+    curve = CURVES[kind]()
+    found = classify_curve(curve)
+    assert CURVE_KINDS[found.kind] == kind
+    assert found.closed == curve.IsClosed
+    assert found.linear == curve.IsLinear()
+    assert found.polyline == curve.IsPolyline()
+    assert found.arc == curve.IsArc()
+    assert found.circle == curve.IsCircle()
+    assert found.ellipse == curve.IsEllipse()
+    assert found.planar == curve.IsPlanar()
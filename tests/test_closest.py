@@ -0,0 +1,45 @@
+"""CurveIndexCache.closest_points against dense brute force sampling"""
+import numpy as np
+import rhino3dm
+
+from hopskit import CurveIndexCache, evaluate_curve
+
+
+def _curves():
+    rng = np.random.default_rng(1)
+    points = [rhino3dm.Point3d(*p) for p in rng.uniform(-10.0, 10.0, (60, 3))]
+    return [
+        rhino3dm.Curve.CreateControlPointCurve(points, 3),
+        rhino3dm.Circle(rhino3dm.Point3d(0.0, 0.0, 0.0), 5.0).ToNurbsCurve(),
+        rhino3dm.ArcCurve.CreateFromArc(rhino3dm.Arc(rhino3dm.Point3d(1.0, 2.0, 0.0), 4.0, 2.0)),
+        rhino3dm.PolylineCurve(
+            [rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(3.0, 1.0, 0.0), rhino3dm.Point3d(5.0, -4.0, 2.0)]
+        ),
+    ]
+
+
+def test_matches_brute_force():
+    curves = _curves()
+    queries = np.random.default_rng(2).uniform(-12.0, 12.0, (500, 3))
+    points, params, indices, distances = CurveIndexCache(16).closest_points(curves, queries)
+
+    dense = np.concatenate([
+        evaluate_curve(c, np.linspace(c.Domain.T0, c.Domain.T1, 50001)).points for c in curves
+    ])
+    brute = np.array([np.linalg.norm(dense - q, axis=1).min() for q in queries])
+    # brute force samples fall short of the true closest point by a little
+    assert np.all(distances <= brute + 1e-9)
+    assert np.all(distances >= brute - 1e-3)
+
+    np.testing.assert_allclose(np.linalg.norm(points - queries, axis=1), distances, atol=1e-9)
+    on_curve = [curves[i].PointAt(t) for i, t in zip(indices.tolist(), params.tolist())]
+    np.testing.assert_allclose(points, [[p.X, p.Y, p.Z] for p in on_curve], atol=1e-9)
+
+
+def test_points_on_curves():
+    curves = _curves()
+    circle = curves[1]
+    params = np.linspace(circle.Domain.T0, circle.Domain.T1, 17)[:-1]
+    on = evaluate_curve(circle, params).points
+    _, _, _, distances = CurveIndexCache(16).closest_points(curves, on)
+    np.testing.assert_allclose(distances, 0.0, atol=1e-9)
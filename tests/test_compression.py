@@ -0,0 +1,54 @@
+"""Content coding negotiation and round trips"""
+import pytest
+
+from hopskit.compression import Compression
+
+
+@pytest.fixture
+def gzip_only():
+    return Compression(min_size=16, codings=("gzip",))
+
+
+@pytest.mark.parametrize("accept, coding", [
+    (None, None),
+    ("", None),
+    ("gzip", "gzip"),
+    ("br, GZIP;q=0.5", "gzip"),
+    ("gzip;q=0", None),
+    ("*", "gzip"),
+    ("*, gzip;q=0", None),
+    ("identity", None),
+])
+def test_choose(gzip_only, accept, coding):
+    assert gzip_only.choose(accept) == coding
+
+
+def test_preference_order():
+    compression = Compression(codings=("zstd", "gzip"))
+    expected = "zstd" if "zstd" in Compression.supported() else "gzip"
+    assert compression.choose("gzip, zstd") == expected
+
+
+def test_round_trip(gzip_only):
+    data = b'{"values": []}' * 100
+    compressed = gzip_only.compress(data, "gzip")
+    assert len(compressed) < len(data)
+    assert gzip_only.decompress(compressed, "gzip") == data
+    assert gzip_only.decompress(b"".join(gzip_only.compress_stream([data[:7], data[7:]], "gzip")), "gzip") == data
+
+
+def test_zstd_round_trip():
+    pytest.importorskip("zstandard")
+    compression = Compression(min_size=16)
+    data = b'{"values": []}' * 100
+    assert compression.decompress(compression.compress(data, "zstd"), "zstd") == data
+
+
+def test_small_bodies_stay_plain(gzip_only):
+    assert gzip_only.compress(b"tiny", "gzip") is None
+
+
+def test_unknown_coding(gzip_only):
+    assert gzip_only.decompress(b"plain", "identity") == b"plain"
+    with pytest.raises(ValueError):
+        gzip_only.decompress(b"plain", "br")
@@ -0,0 +1,35 @@
+"""Curvature grids of surfaces with known curvature"""
+import numpy as np
+import rhino3dm
+
+from hopskit import SurfaceEvaluator, curvature_grid
+
+
+def test_sphere():
+    brep = rhino3dm.Brep.CreateFromSphere(rhino3dm.Sphere(rhino3dm.Point3d(1.0, 2.0, 3.0), 4.0))
+    evaluator = SurfaceEvaluator(brep)
+    u, v = evaluator.grid_params(9, 11)
+    success, points, normals, gaussian, mean = curvature_grid(evaluator, u, v)
+    # the poles are singular
+    assert success.sum() >= len(u) * (len(v) - 2)
+    np.testing.assert_allclose(np.linalg.norm(points - (1.0, 2.0, 3.0), axis=1), 4.0, atol=1e-9)
+    np.testing.assert_allclose(gaussian[success], 1.0 / 16.0, atol=1e-9)
+    # opennurbs sign: normals point out, mean curvature is negative
+    np.testing.assert_allclose(mean[success], -0.25, atol=1e-9)
+    np.testing.assert_allclose(normals[success], (points[success] - (1.0, 2.0, 3.0)) / 4.0, atol=1e-9)
+
+
+def test_threads_match():
+    surface = rhino3dm.NurbsSurface.Create(3, False, 4, 4, 4, 4)
+    for i in range(4):
+        for j in range(4):
+            surface.Points[i, j] = rhino3dm.Point4d(i, j, np.sin(i * j), 1.0)
+    for k, t in enumerate([0.0, 0.0, 0.0, 1.0, 1.0, 1.0]):
+        surface.KnotsU[k] = t
+        surface.KnotsV[k] = t
+    evaluator = SurfaceEvaluator(surface)
+    u, v = evaluator.grid_params(40, 30)
+    one = curvature_grid(evaluator, u, v)
+    many = curvature_grid(evaluator, u, v, workers=4, block=64)
+    for a, b in zip(one, many):
+        np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
@@ -0,0 +1,47 @@
+"""hopskit.curves against rhino3dm's own curve evaluation"""
+import numpy as np
+import pytest
+import rhino3dm
+
+from hopskit import evaluate_curve
+
+
+def _xyz(v):
+    return [v.X, v.Y, v.Z]
+
+
+def _nurbs():
+    rng = np.random.default_rng(0)
+    points = [rhino3dm.Point3d(*p) for p in rng.uniform(-10.0, 10.0, (12, 3))]
+    return rhino3dm.Curve.CreateControlPointCurve(points, 3)
+
+
+def _rational():
+    return rhino3dm.Circle(rhino3dm.Point3d(1.0, 2.0, 3.0), 4.0).ToNurbsCurve()
+
+
+def _line():
+    return rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(3.0, 4.0, 5.0))
+
+
+def _polyline():
+    points = [rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(3.0, 1.0, 0.0), rhino3dm.Point3d(5.0, -4.0, 2.0)]
+    return rhino3dm.PolylineCurve(points)
+
+
+def _arc():
+    return rhino3dm.ArcCurve.CreateFromArc(rhino3dm.Arc(rhino3dm.Point3d(1.0, 2.0, 0.0), 4.0, 2.0))
+
+
+@pytest.mark.parametrize("make", [_nurbs, _rational, _line, _polyline, _arc])
+def test_matches_rhino3dm(make):
+    curve = make()
+    t0, t1 = curve.Domain.T0, curve.Domain.T1
+    params = np.linspace(t0, t1, 101)
+    samples = evaluate_curve(curve, params, tangents=True, curvatures=True)
+
+    expected = [(_xyz(curve.PointAt(t)), _xyz(curve.TangentAt(t)), _xyz(curve.CurvatureAt(t))) for t in params.tolist()]
+    points, tangents, curvatures = (np.array(column) for column in zip(*expected))
+    np.testing.assert_allclose(samples.points, points, atol=1e-9)
+    np.testing.assert_allclose(samples.tangents, tangents, atol=1e-9)
+    np.testing.assert_allclose(samples.curvatures, curvatures, atol=1e-9)
@@ -0,0 +1,41 @@
+"""GeometryCache decodes once and hands out copies"""
+import ghhops_server as hs
+import pytest
+import rhino3dm
+from ghhops_server import params
+
+from hopskit import GeometryCache, geometry_digest
+
+
+@pytest.fixture
+def cache():
+    # creating a hops app installs the rhino3dm decoder
+    hops = hs.Hops()
+    decoder = params.RHINO_FROMJSON
+    yield GeometryCache(hops, max_entries=8)
+    params.RHINO_FROMJSON = decoder
+
+
+def _line():
+    return rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(1.0, 0.0, 0.0)).Encode()
+
+
+def test_decodes_once(cache):
+    data = _line()
+    first, second = params.RHINO_FROMJSON(data), params.RHINO_FROMJSON(dict(data))
+    assert cache.stats()["hits"] == 1
+    assert first is not second
+    assert first.PointAtEnd.X == second.PointAtEnd.X == 1.0
+
+
+def test_copies_are_private(cache):
+    data = _line()
+    cache.decode(data).Reverse()
+    assert cache.decode(data).PointAtStart.X == 0.0
+
+
+def test_digest_ignores_other_keys():
+    data = _line()
+    assert geometry_digest(data) == geometry_digest(dict(data, extra=1))
+    other = rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(2.0, 0.0, 0.0)).Encode()
+    assert geometry_digest(data) != geometry_digest(other)
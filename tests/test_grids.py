@@ -0,0 +1,32 @@
+"""Point lattices and packed array outputs"""
+import numpy as np
+import rhino3dm
+
+from hopskit import HopsPointArray, iter_point_grid, point_grid
+
+
+def test_point_grid():
+    points = point_grid(rhino3dm.Point3d(1.0, 2.0, 3.0), rhino3dm.Vector3d(1.0, 0.0, 0.0), (0.0, 2.0, 0.0), 3, 2)
+    expected = [[1.0 + i, 2.0 + 2.0 * j, 3.0] for i in range(3) for j in range(2)]
+    np.testing.assert_array_equal(points, expected)
+    assert point_grid((0, 0, 0), (1, 0, 0), (0, 1, 0), 0, 5).shape == (0, 3)
+
+
+def test_chunks_cover_the_grid():
+    args = ((0.5, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 0.0, 1.0), 7, 5)
+    chunks = list(iter_point_grid(*args, chunk_size=12))
+    assert all(len(chunk) % 5 == 0 for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), point_grid(*args))
+
+
+def test_packed_output():
+    param = HopsPointArray("Points", "P", "Points")
+    args = ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), 4, 3)
+    whole = param.from_result(point_grid(*args))
+    chunked = param.from_result(iter_point_grid(*args, chunk_size=3))
+    assert chunked == whole
+    items = whole["InnerTree"]["0"]
+    assert len(items) == 12
+    assert items[5] == {"type": "Rhino.Geometry.Point3d", "data": '{"X": 1.0, "Y": 2.0, "Z": 0.0}'}
+    tree = param.from_result({"{0}": point_grid(*args)[:2], "{1}": point_grid(*args)[2:3]})
+    assert [len(v) for v in tree["InnerTree"].values()] == [2, 1]
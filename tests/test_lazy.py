@@ -0,0 +1,87 @@
+"""LazyComponents serves a manifest and imports modules on first solve"""
+import importlib
+import json
+import sys
+
+import ghhops_server as hs
+import pytest
+
+import components
+from hopskit import LazyComponent, LazyComponents
+from hopskit.lazy import _signature
+
+
+SOURCE = '''
+import ghhops_server as hs
+import lazyhost
+
+
+@lazyhost.hops.component("/scale", inputs=[hs.HopsNumber("A", "A")], outputs=[hs.HopsNumber("B", "B")])
+def scale(a):
+    return a * %s
+'''
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    (tmp_path / "lazyhost.py").write_text("hops = None\n")
+    (tmp_path / "lazycomps.py").write_text(SOURCE % 2)
+    importlib.invalidate_caches()
+    yield tmp_path
+    for name in ("lazyhost", "lazycomps"):
+        sys.modules.pop(name, None)
+
+
+def _start(manifest, lazy=True):
+    """A fresh app as after a restart"""
+    sys.modules.pop("lazycomps", None)
+    hops = hs.Hops()
+    importlib.import_module("lazyhost").hops = hops
+    return hops, LazyComponents(hops, ["lazycomps"], str(manifest), lazy=lazy)
+
+
+def _scale(hops, a):
+    payload = json.dumps({"pointer": "/scale", "values": [
+        {"ParamName": "A", "InnerTree": {"{0}": [{"type": "System.Double", "data": repr(a)}]}}
+    ]})
+    ok, result = hops._process_solve_request(hops._components["/scale"], payload)
+    assert ok
+    return json.loads(json.loads(result)["values"][0]["InnerTree"]["0"][0]["data"])
+
+
+def test_manifest_round_trip(modules):
+    manifest = modules / "manifest.json"
+    hops, lazy = _start(manifest)
+    # no manifest yet: imported and described
+    assert "lazycomps" in sys.modules
+    entry = json.loads(manifest.read_text())["lazycomps"]
+    assert entry["signature"] == _signature("lazycomps")
+    assert [c["Uri"] for c in entry["components"]] == ["/scale"]
+
+    hops, lazy = _start(manifest)
+    assert "lazycomps" not in sys.modules
+    placeholder = hops._components["/scale"]
+    assert isinstance(placeholder, LazyComponent)
+    assert placeholder.encode() == entry["components"][0]
+    assert _scale(hops, 1.5) == 3.0
+    assert "lazycomps" in sys.modules
+    assert not isinstance(hops._components["/scale"], LazyComponent)
+
+
+def test_changed_source_is_reloaded(modules):
+    manifest = modules / "manifest.json"
+    _start(manifest)
+    (modules / "lazycomps.py").write_text(SOURCE % 10)
+    importlib.invalidate_caches()
+    hops, _ = _start(manifest)
+    assert not isinstance(hops._components["/scale"], LazyComponent)
+    assert json.loads(manifest.read_text())["lazycomps"]["signature"] == _signature("lazycomps")
+    assert _scale(hops, 1.5) == 15.0
+
+
+def test_committed_manifest_is_current():
+    entries = json.loads(open(components.MANIFEST, encoding="utf-8").read())
+    for module in components.CATEGORIES:
+        assert entries[module]["signature"] == _signature(module), f"refresh {components.MANIFEST}"
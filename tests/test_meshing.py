@@ -0,0 +1,66 @@
+"""Indexed meshes of surfaces and breps"""
+import numpy as np
+import rhino3dm
+
+from hopskit import IndexedMesh, MeshCache, mesh_geometry
+from hopskit.meshing import span_grid
+
+
+def _plane():
+    return rhino3dm.NurbsSurface.CreateRuledSurface(
+        rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(2.0, 0.0, 0.0)),
+        rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 1.0, 0.0), rhino3dm.Point3d(2.0, 1.0, 0.0)),
+    )
+
+
+def _sphere():
+    return rhino3dm.Brep.CreateFromSphere(rhino3dm.Sphere(rhino3dm.Point3d(0.0, 0.0, 0.0), 2.0))
+
+
+def test_span_grid():
+    np.testing.assert_allclose(span_grid([0, 0, 1, 2, 2], 2, (0.0, 2.0), 2), [0.0, 0.5, 1.0, 1.5, 2.0])
+    # degree 1 directions are exact at their knots
+    np.testing.assert_allclose(span_grid([0, 0, 1, 2, 2], 1, (0.0, 2.0), 4), [0.0, 1.0, 2.0])
+
+
+def test_planar_surface():
+    plane = _plane()
+    mesh = mesh_geometry(plane, density=4)
+    assert mesh.vertices.shape == (4, 3) and mesh.faces.shape == (1, 4)
+    n = plane.NormalAt(0.5, 0.5)
+    np.testing.assert_allclose(mesh.normals, [[n.X, n.Y, n.Z]] * 4, atol=1e-12)
+    a, b, c, _ = mesh.vertices[mesh.faces[0]]
+    # faces wind counterclockwise around the normal
+    assert np.dot(np.cross(b - a, c - a), mesh.normals[0]) > 0.0
+
+
+def test_sphere_is_closed_and_faces_out():
+    mesh = mesh_geometry(_sphere(), density=4)
+    np.testing.assert_allclose(np.linalg.norm(mesh.vertices, axis=1), 2.0, atol=1e-9)
+    np.testing.assert_allclose(np.linalg.norm(mesh.normals, axis=1), 1.0, atol=1e-9)
+    assert np.all(np.einsum("ij,ij->i", mesh.normals, mesh.vertices) > 0.0)
+    # collapsed quads at the poles become triangles
+    assert np.any(mesh.faces[:, 2] == mesh.faces[:, 3])
+    q = mesh.vertices[mesh.faces]
+    centers = q.mean(axis=1)
+    face_normals = np.cross(q[:, 2] - q[:, 0], q[:, 3] - q[:, 1])
+    assert np.all(np.einsum("ij,ij->i", face_normals, centers) > 0.0)
+    rhino = mesh.to_rhino()
+    assert rhino.IsValid
+    assert (len(rhino.Vertices), rhino.Faces.Count) == (len(mesh.vertices), len(mesh.faces))
+
+
+def test_join_and_reverse():
+    a = mesh_geometry(_plane())
+    joined = IndexedMesh.join([a, a.reversed()])
+    assert len(joined.vertices) == 8
+    np.testing.assert_array_equal(joined.faces[1], a.faces[0][[2, 1, 0, 3]] + 4)
+    np.testing.assert_allclose(joined.normals[4:], -a.normals)
+
+
+def test_cache():
+    cache = MeshCache(max_entries=4)
+    sphere = _sphere()
+    assert cache.mesh(sphere, 4) is cache.mesh(sphere, 4)
+    assert cache.mesh(sphere, 2) is not cache.mesh(sphere, 4)
+    assert cache.stats()["entries"] == 2
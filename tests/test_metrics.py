@@ -0,0 +1,41 @@
+"""Metrics records requests, errors and byte sizes per route"""
+import types
+
+import ghhops_server as hs
+
+from hopskit import Metrics
+
+
+def _metrics(outputs):
+    hops = hs.Hops()
+    hops._process_solve_request = lambda comp, payload: outputs
+    return hops, Metrics(hops)
+
+
+def _value(text, name):
+    line = next(line for line in text.splitlines() if line.startswith(name))
+    return float(line.rsplit(" ", 1)[1])
+
+
+def test_sizes_are_utf8_bytes():
+    hops, metrics = _metrics((True, '{"values": ["éé"]}'))
+    comp = types.SimpleNamespace(uri="/text")
+    hops._process_solve_request(comp, '{"pointer": "ü"}')
+    text = metrics.render()
+    assert _value(text, 'hops_requests_total{route="/text"}') == 1
+    assert _value(text, 'hops_errors_total{route="/text"}') == 0
+    assert _value(text, 'hops_request_size_bytes_sum{route="/text"}') == 17
+    assert _value(text, 'hops_response_size_bytes_sum{route="/text"}') == 20
+    assert _value(text, 'hops_request_duration_seconds_count{route="/text"}') == 1
+
+
+def test_errors_and_buckets():
+    hops, metrics = _metrics((False, "x" * 300))
+    comp = types.SimpleNamespace(uri="/fail")
+    for _ in range(3):
+        hops._process_solve_request(comp, "{}")
+    text = metrics.render()
+    assert _value(text, 'hops_errors_total{route="/fail"}') == 3
+    assert _value(text, 'hops_response_size_bytes_bucket{route="/fail",le="256"}') == 0
+    assert _value(text, 'hops_response_size_bytes_bucket{route="/fail",le="1024"}') == 3
+    assert _value(text, 'hops_response_size_bytes_bucket{route="/fail",le="+Inf"}') == 3
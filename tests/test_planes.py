@@ -0,0 +1,37 @@
+"""PlaneSet queries and the plane components"""
+import numpy as np
+import pytest
+
+from conftest import output, solve
+from hopskit import PlaneSet
+
+
+def test_distances_and_sides():
+    # z = 1 scaled by 2, and x = 0
+    planes = PlaneSet.from_equations([[0.0, 0.0, 2.0, -2.0], [1.0, 0.0, 0.0, 0.0]])
+    points = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 1.0], [-1.0, 5.0, 4.0]])
+    np.testing.assert_allclose(planes.equations, [[0.0, 0.0, 1.0, -1.0], [1.0, 0.0, 0.0, 0.0]])
+    distances, sides = planes.classify(points)
+    np.testing.assert_allclose(distances, [[-1.0, 0.0], [0.0, 3.0], [3.0, -1.0]])
+    np.testing.assert_array_equal(sides, [[-1, 0], [0, 1], [1, -1]])
+    np.testing.assert_array_equal(planes.side_counts(points, chunk_size=2), [[1, 1, 1], [1, 1, 1]])
+    for start, block in planes.iter_distances(points, chunk_size=2):
+        np.testing.assert_allclose(block, distances[start:start + len(block)])
+
+
+def test_zero_normal_is_invalid():
+    planes = PlaneSet.from_equations([[0.0, 0.0, 0.0, 1.0]])
+    np.testing.assert_array_equal(planes.sides([[1.0, 2.0, 3.0]]), [[0]])
+
+
+@pytest.mark.parametrize("a, b, c, d, success", [
+    (0.0, 0.0, 1.0, 0.0, True),
+    (1.0, 2.0, 3.0, -4.0, True),
+    (0.0, 0.0, 0.0, 1.0, False),
+])
+def test_plane_from_equation(client, a, b, c, d, success):
+    inputs = dict(A=a, x=1.0, B=b, y=2.0, C=c, z=3.0, D=d)
+    result = solve(client, "/planeFromEquation2", **{k: {"{0}": [v]} for k, v in inputs.items()})
+    assert output(result, "Success") == {"0": [success]}
+    normal = output(result, "normal")["0"][0]
+    assert [normal["X"], normal["Y"], normal["Z"]] == [a, b, c]
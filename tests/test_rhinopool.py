@@ -0,0 +1,50 @@
+"""RhinoPool workers, run on the plain hops example app"""
+import json
+import time
+
+import pytest
+
+from hopskit import RhinoPool
+
+
+def _add(a, b):
+    values = [
+        {"ParamName": name, "InnerTree": {"{0}": [{"type": "System.Double", "data": repr(value)}]}}
+        for name, value in (("A", a), ("B", b))
+    ]
+    return json.dumps({"pointer": "/add", "values": values})
+
+
+@pytest.fixture
+def pool():
+    pool = RhinoPool("app_http", workers=1, max_requests=1, start_timeout=60.0, poll_interval=0.1)
+    pool.open()
+    yield pool
+    pool.close()
+
+
+def _wait(condition, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+def test_retired_worker_exits_without_another_request(pool):
+    (first,) = pool._workers
+    ok, results = pool._process_solve_request(pool._components["/add"], _add(1.0, 2.0))
+    assert ok
+    assert json.loads(json.loads(results)["values"][0]["InnerTree"]["0"][0]["data"]) == 3.0
+    # past max_requests: replaced, then stopped while idle
+    assert _wait(lambda: first.dead and first not in pool._workers and len(pool._workers) == 1)
+    assert _wait(lambda: not first.process.is_alive(), timeout=30.0)
+
+
+def test_crashed_worker_is_replaced_once(pool):
+    (first,) = pool._workers
+    first.process.kill()
+    assert _wait(lambda: len(pool._workers) == 1 and first not in pool._workers)
+    time.sleep(0.5)
+    assert len(pool._workers) == 1
@@ -0,0 +1,111 @@
+"""SingleFlight shares one solve between concurrent identical requests"""
+import threading
+import time
+
+import ghhops_server as hs
+
+from hopskit import SingleFlight, SolveCache
+
+
+def _hops(release):
+    hops = hs.Hops()
+    solves = []
+
+    def solve(comp, payload):
+        solves.append(payload)
+        release.wait(5.0)
+        return True, '{"values": [%d]}' % len(solves)
+
+    hops._process_solve_request = solve
+    return hops, solves
+
+
+def _component(hops, **options):
+    @hops.component("/add", inputs=[hs.HopsNumber("A")], outputs=[hs.HopsNumber("B")], **options)
+    def add(a):
+        return a
+
+    return hops._components["/add"]
+
+
+def _wait_for(flight, count):
+    """Until `count` requests have reached the leader's call"""
+    while flight.leaders + flight.coalesced < count:
+        time.sleep(0.01)
+
+
+def test_identical_requests_share_a_solve():
+    release = threading.Event()
+    hops, solves = _hops(release)
+    flight = SingleFlight(hops)
+    comp = _component(hops)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(hops._process_solve_request(comp, '{"values": [1]}')))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    _wait_for(flight, 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(solves) == 1
+    assert results == [(True, '{"values": [1]}')] * 4
+    assert flight.stats() == {"solves": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_different_requests_and_opt_out():
+    release = threading.Event()
+    release.set()
+    hops, solves = _hops(release)
+    flight = SingleFlight(hops)
+    comp = _component(hops, coalesce=False)
+    hops._process_solve_request(comp, '{"values": [1]}')
+    assert flight.stats()["solves"] == 0
+    comp = _component(hops)
+    hops._process_solve_request(comp, '{"values": [1]}')
+    hops._process_solve_request(comp, '{"values": [2]}')
+    assert flight.stats()["solves"] == 2
+
+
+def test_cache_hits_are_not_solves():
+    release = threading.Event()
+    release.set()
+    hops, solves = _hops(release)
+    # created before the cache, see SingleFlight
+    flight = SingleFlight(hops)
+    SolveCache(hops)
+    comp = _component(hops)
+    for _ in range(3):
+        hops._process_solve_request(comp, '{"values": [1]}')
+    assert flight.stats()["solves"] == 1
+
+
+def test_errors_reach_every_waiter():
+    release = threading.Event()
+    hops = hs.Hops()
+
+    def solve(comp, payload):
+        release.wait(5.0)
+        raise RuntimeError("broken")
+
+    hops._process_solve_request = solve
+    flight = SingleFlight(hops)
+    comp = _component(hops)
+    errors = []
+
+    def request():
+        try:
+            errors.append(hops._process_solve_request(comp, "{}")[0])
+        except RuntimeError:
+            errors.append("raised")
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    _wait_for(flight, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert sorted(errors, key=str) == [False, False, "raised"]
@@ -0,0 +1,108 @@
+"""SolveStore keys, eviction and counters, and SolveCache on top"""
+import threading
+
+import ghhops_server as hs
+
+from hopskit import SolveCache, SolveStore, component_version
+from hopskit import options
+
+
+def test_put_get(tmp_path):
+    store = SolveStore(str(tmp_path / "solves.db"), version="1")
+    assert store.get("a") is None
+    assert store.put("a", '{"values": []}')
+    assert store.get("a") == '{"values": []}'
+    stats = store.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+    store.close()
+
+
+def test_version_is_part_of_the_key(tmp_path):
+    path = str(tmp_path / "solves.db")
+    old, new = SolveStore(path, version="old"), SolveStore(path, version="new")
+    old.put("a", "old result")
+    assert new.get("a") is None
+    assert old.get("a") == "old result"
+
+
+def test_evicts_least_recently_used(tmp_path):
+    store = SolveStore(str(tmp_path / "solves.db"), max_bytes=30, low_water=0.7, version="1")
+    for key in "abc":
+        store.put(key, "x" * 10)
+    store.get("a")
+    store.put("d", "x" * 10)
+    # 40 bytes, down to 21: b and c go, a was used last
+    assert [store.get(k) is not None for k in "abcd"] == [True, False, False, True]
+    assert store.stats()["bytes"] == 20
+    assert store.stats()["evictions"] == 2
+    assert not store.put("e", "x" * 31)
+
+
+def test_counters_from_threads(tmp_path):
+    store = SolveStore(str(tmp_path / "solves.db"), version="1")
+    store.put("a", "result")
+
+    def lookups():
+        for i in range(200):
+            store.get("a" if i % 2 else "missing")
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"]) == (800, 800)
+
+
+def test_component_version():
+    hops = options.install(hs.Hops())
+
+    @hops.component("/plain", inputs=[hs.HopsNumber("A")], outputs=[hs.HopsNumber("B")])
+    def plain(a):
+        return a
+
+    @hops.component("/pinned", inputs=[hs.HopsNumber("A")], outputs=[hs.HopsNumber("B")], version=3)
+    def pinned(a):
+        return a
+
+    version = component_version(hops._components["/plain"])
+    assert len(version) == 16
+    assert version == component_version(hops._components["/plain"])
+    assert component_version(hops._components["/pinned"]) == "3"
+
+
+def _hops(solves):
+    hops = hs.Hops()
+
+    def solve(comp, payload):
+        solves.append(payload)
+        return True, '{"values": [%d]}' % len(solves)
+
+    hops._process_solve_request = solve
+    return hops
+
+
+def _component(hops):
+    @hops.component("/add", inputs=[hs.HopsNumber("A")], outputs=[hs.HopsNumber("B")])
+    def add(a):
+        return a
+
+    return hops._components["/add"]
+
+
+def test_store_survives_the_memory_cache(tmp_path):
+    path = str(tmp_path / "solves.db")
+    solves = []
+    hops = _hops(solves)
+    SolveCache(hops, store=SolveStore(path, version="1"))
+    comp = _component(hops)
+    first = hops._process_solve_request(comp, '{"values": [1]}')
+
+    # a restarted process: empty memory, same file
+    hops = _hops(solves)
+    cache = SolveCache(hops, store=SolveStore(path, version="1"))
+    comp = _component(hops)
+    assert hops._process_solve_request(comp, '{"values": [1]}') == first
+    assert len(solves) == 1
+    assert len(cache) == 1
@@ -0,0 +1,88 @@
+"""Streamed responses decode to the same JSON as unstreamed ones"""
+import json
+
+import ghhops_server as hs
+import numpy as np
+import rhino3dm
+
+from conftest import output, solve
+from hopskit import HopsPointArray, Streaming, StreamedOutputs, point_grid
+
+
+def _hops(handler, chunk_bytes=64):
+    hops = hs.Hops()
+    Streaming(hops, chunk_bytes=chunk_bytes)
+
+    @hops.component(
+        "/grid",
+        inputs=[hs.HopsInteger("Count", "N")],
+        outputs=[hs.HopsInteger("Total", "T"), HopsPointArray("Points", "P")],
+        stream=True,
+    )
+    def grid(count):
+        return handler(count)
+
+    return hops, hops._components["/grid"]
+
+
+def _payload(count):
+    return json.dumps({"pointer": "/grid", "values": [
+        {"ParamName": "Count", "InnerTree": {"{0}": [{"type": "System.Int32", "data": str(count)}]}}
+    ]})
+
+
+def _chunks(count):
+    for start in range(0, count, 7):
+        yield point_grid((start, 0, 0), (1, 0, 0), (0, 1, 0), min(7, count - start), 1)
+
+
+def test_same_json_as_unstreamed():
+    hops, comp = _hops(lambda count: (count, _chunks(count)))
+    ok, outputs = hops._process_solve_request(comp, _payload(40))
+    assert ok and isinstance(outputs, StreamedOutputs)
+    sizes = []
+    outputs.on_close.append(lambda size, ok: sizes.append((size, ok)))
+    chunks = list(outputs)
+    assert len(chunks) > 1
+    streamed = json.loads(b"".join(chunks))
+
+    points = np.column_stack((np.arange(40.0), np.zeros(40), np.zeros(40)))
+    expected = {"values": [
+        comp.outputs[0].from_result(40),
+        comp.outputs[1].from_result(points),
+    ]}
+    assert streamed == json.loads(json.dumps(expected, cls=hs.base._HopsEncoder))
+    assert sizes == [(sum(map(len, chunks)), True)]
+
+
+def test_empty_generator():
+    hops, comp = _hops(lambda count: (count, _chunks(0)))
+    _, outputs = hops._process_solve_request(comp, _payload(0))
+    assert json.loads(outputs.read())["values"][1]["InnerTree"] == {"0": []}
+
+
+def test_generator_errors_end_the_response():
+    def broken(count):
+        yield point_grid((0, 0, 0), (1, 0, 0), (0, 1, 0), 3, 1)
+        raise ValueError("broken chunk")
+
+    hops, comp = _hops(lambda count: (count, broken(count)))
+    _, outputs = hops._process_solve_request(comp, _payload(3))
+    result = json.loads(outputs.read())
+    assert not outputs.ok
+    assert len(result["values"][1]["InnerTree"]["0"]) == 3
+    assert "broken chunk" in result["errors"][0]
+
+
+def test_streamed_component_over_http(client):
+    result = solve(
+        client, "/pointGrid8",
+        Origin={"{0}": [rhino3dm.Point3d(0.0, 0.0, 0.0)]},
+        X={"{0}": [rhino3dm.Vector3d(1.0, 0.0, 0.0)]},
+        Y={"{0}": [rhino3dm.Vector3d(0.0, 1.0, 0.0)]},
+        Ucount={"{0}": [300]}, Vcount={"{0}": [300]},
+    )
+    points = output(result, "Point")["0"]
+    assert output(result, "Success") == {"0": [True]}
+    assert len(points) == 90000
+    assert points[-1] == {"X": 299.0, "Y": 299.0, "Z": 0.0}
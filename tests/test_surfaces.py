@@ -0,0 +1,64 @@
+"""SurfaceEvaluator against rhino3dm PointAt, NormalAt and FrameAt"""
+import numpy as np
+import pytest
+import rhino3dm
+
+from hopskit import SurfaceEvaluator, frames
+
+
+def _sphere():
+    brep = rhino3dm.Brep.CreateFromSphere(rhino3dm.Sphere(rhino3dm.Point3d(1.0, 2.0, 3.0), 5.0))
+    return brep, brep.Faces[0].UnderlyingSurface()
+
+
+def _revolved():
+    profile = rhino3dm.NurbsCurve.Create(False, 3, [
+        rhino3dm.Point3d(2.0, 0.0, 0.0), rhino3dm.Point3d(3.0, 0.0, 1.0),
+        rhino3dm.Point3d(1.5, 0.0, 2.0), rhino3dm.Point3d(2.5, 0.0, 4.0),
+    ])
+    axis = rhino3dm.Line(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(0.0, 0.0, 1.0))
+    surface = rhino3dm.RevSurface.Create(profile, axis, 0.3, 4.0)
+    return surface, surface
+
+
+def _nurbs():
+    surface = rhino3dm.NurbsSurface.Create(3, False, 4, 4, 4, 4)
+    for i in range(4):
+        for j in range(4):
+            surface.Points[i, j] = rhino3dm.Point4d(i, j, np.sin(i * j), 1.0 + 0.1 * i)
+    for k, t in enumerate([0.0, 0.0, 0.0, 1.0, 1.0, 1.0]):
+        surface.KnotsU[k] = t
+        surface.KnotsV[k] = 2.0 * t
+    return surface, surface
+
+
+@pytest.mark.parametrize("make", [_sphere, _revolved, _nurbs])
+def test_matches_rhino3dm(make):
+    geometry, surface = make()
+    evaluator = SurfaceEvaluator(geometry)
+    u, v = evaluator.grid_params(7, 6)
+    d = evaluator.grid(u, v)
+    ok, x_axes, _, normals = frames(d["Su"], d["Sv"])
+    for i, s in enumerate(u.tolist()):
+        for j, t in enumerate(v.tolist()):
+            p = surface.PointAt(s, t)
+            np.testing.assert_allclose(d["S"][i, j], [p.X, p.Y, p.Z], atol=1e-9)
+            if ok[i, j]:
+                n = surface.NormalAt(s, t)
+                x = surface.FrameAt(s, t)[1].XAxis
+                np.testing.assert_allclose(normals[i, j], [n.X, n.Y, n.Z], atol=1e-9)
+                np.testing.assert_allclose(x_axes[i, j], [x.X, x.Y, x.Z], atol=1e-9)
+
+
+def test_grid_params_cover_the_surface_domain():
+    _, surface = _revolved()
+    u, v = SurfaceEvaluator(surface).grid_params(5, 3)
+    np.testing.assert_allclose([u[0], u[-1], v[0], v[-1]], [
+        surface.Domain(0).T0, surface.Domain(0).T1, surface.Domain(1).T0, surface.Domain(1).T1,
+    ])
+
+
+def test_multi_face_breps_are_refused():
+    box = rhino3dm.Brep.CreateFromBox(rhino3dm.Box(rhino3dm.BoundingBox(0.0, 0.0, 0.0, 1.0, 1.0, 1.0)))
+    with pytest.raises(ValueError):
+        SurfaceEvaluator(box)
@@ -0,0 +1,62 @@
+"""Arc length tables of CurveTessellation"""
+import math
+
+import numpy as np
+import pytest
+import rhino3dm
+
+from hopskit import CurveTessellation, TessellationCache, evaluate_curve
+
+
+def _circle():
+    return rhino3dm.Circle(rhino3dm.Point3d(1.0, 2.0, 3.0), 2.0).ToNurbsCurve()
+
+
+def _arc():
+    return rhino3dm.ArcCurve.CreateFromArc(rhino3dm.Arc(rhino3dm.Point3d(0.0, 0.0, 0.0), 3.0, 1.5))
+
+
+def _polyline():
+    points = [rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(3.0, 4.0, 0.0), rhino3dm.Point3d(3.0, 4.0, 2.0)]
+    return rhino3dm.PolylineCurve(points)
+
+
+@pytest.mark.parametrize("make, length, converted", [
+    (_circle, 4.0 * math.pi, False),
+    (_arc, 4.5, True),
+    (_polyline, 7.0, True),
+])
+def test_length(make, length, converted):
+    tessellation = CurveTessellation(make())
+    assert tessellation.length == pytest.approx(length, rel=1e-12)
+    assert tessellation.converted == converted
+    assert tessellation.lengths[0] == 0.0
+    assert np.all(np.diff(tessellation.lengths) >= 0.0)
+
+
+def test_parameters_at_length_on_arc():
+    arc = _arc()
+    tessellation = CurveTessellation(arc)
+    lengths = np.array([-1.0, 0.0, 1.0, 3.0, 4.5, 10.0])
+    params = tessellation.curve_parameters(tessellation.parameters_at_length(lengths))
+    # the arc's own parameters are arc lengths, its NURBS form's are not
+    np.testing.assert_allclose(params, np.clip(lengths, 0.0, 4.5), atol=1e-12)
+    np.testing.assert_allclose(tessellation.length_at(tessellation.nurbs_parameters(params)), np.clip(lengths, 0.0, 4.5))
+
+
+def test_divide_length():
+    circle = _circle()
+    tessellation = CurveTessellation(circle)
+    params = tessellation.divide_length(math.pi / 2.0)
+    points = evaluate_curve(circle, tessellation.curve_parameters(params)).points
+    assert len(points) == 9
+    chords = np.linalg.norm(np.diff(points, axis=0), axis=1)
+    np.testing.assert_allclose(chords, 2.0 * 2.0 * math.sin(math.pi / 8.0), rtol=1e-10)
+    with pytest.raises(ValueError):
+        tessellation.divide_length(0.0)
+
+
+def test_cache_shares_tessellations():
+    cache = TessellationCache(max_entries=4)
+    assert cache.tessellate(_circle()) is cache.tessellate(_circle())
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,27 @@
+"""TreeSolver matches and grafts data trees like Grasshopper"""
+import pytest
+import rhino3dm
+
+from conftest import output, solve
+
+
+def _line(length):
+    return rhino3dm.LineCurve(rhino3dm.Point3d(0.0, 0.0, 0.0), rhino3dm.Point3d(length, 0.0, 0.0))
+
+
+def test_item_outputs_keep_branches(client):
+    curves = {"{0}": [_line(1.0), _line(2.0)], "{1}": [_line(3.0)]}
+    result = solve(client, "/crvPointAt", Curve=curves, Parameter={"{0}": [0.5]})
+    points = output(result, "Point")
+    assert list(points) == ["{0}", "{1}"]
+    assert [p["X"] for p in points["{0}"]] == pytest.approx([0.5, 0.5])
+    assert [p["X"] for p in points["{1}"]] == pytest.approx([0.5])
+
+
+def test_list_outputs_are_grafted(client):
+    result = solve(client, "/crvDivideLength", Curve={"{0}": [_line(2.0), _line(3.0)]}, Length={"{0}": [1.0]})
+    points = output(result, "Points")
+    assert sorted(points) == ["{0;0}", "{0;1}"]
+    assert [p["X"] for p in points["{0;0}"]] == pytest.approx([0.0, 1.0, 2.0])
+    assert [p["X"] for p in points["{0;1}"]] == pytest.approx([0.0, 1.0, 2.0, 3.0])
+    assert [len(v) for v in output(result, "Parameters").values()] == pytest.approx([3, 4])